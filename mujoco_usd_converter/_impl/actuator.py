@@ -35,16 +35,17 @@ def get_actuator_name(actuator: mujoco.MjsActuator) -> str:
 def convert_actuator(parent: Usd.Prim, name: str, actuator: mujoco.MjsActuator, data: ConversionData) -> Usd.Prim:
     actuator_prim: Usd.Prim = parent.GetStage().DefinePrim(parent.GetPath().AppendChild(name))
     actuator_prim.SetTypeName("MjcActuator")
+    fields = data.get_spec_snapshot().actuator(actuator)
 
-    set_schema_attribute(actuator_prim, "mjc:group", actuator.group)
+    set_schema_attribute(actuator_prim, "mjc:group", fields.group)
 
-    if actuator.trntype == mujoco.mjtTrn.mjTRN_BODY:
+    if fields.trntype == mujoco.mjtTrn.mjTRN_BODY:
         references = data.references[Tokens.PhysicsBodies]
-    elif actuator.trntype == mujoco.mjtTrn.mjTRN_JOINT:
+    elif fields.trntype == mujoco.mjtTrn.mjTRN_JOINT:
         references = data.references[Tokens.PhysicsJoints]
-    elif actuator.trntype == mujoco.mjtTrn.mjTRN_SITE or actuator.trntype == mujoco.mjtTrn.mjTRN_SLIDERCRANK:
+    elif fields.trntype == mujoco.mjtTrn.mjTRN_SITE or fields.trntype == mujoco.mjtTrn.mjTRN_SLIDERCRANK:
         references = data.references[Tokens.PhysicsSites]
-    elif actuator.trntype == mujoco.mjtTrn.mjTRN_TENDON:
+    elif fields.trntype == mujoco.mjtTrn.mjTRN_TENDON:
         references = data.references[Tokens.PhysicsTendons]
     else:
         Tf.Warn(f"Unsupported transmission type '{actuator.trntype}' for actuator '{actuator.name}'")
@@ -73,29 +74,29 @@ def convert_actuator(parent: Usd.Prim, name: str, actuator: mujoco.MjsActuator,
             Tf.Warn(f"Slidersite '{actuator.slidersite}' not found for actuator '{actuator.name}'")
             return actuator_prim
 
-    set_schema_attribute(actuator_prim, "mjc:actDim", actuator.actdim)
-    set_schema_attribute(actuator_prim, "mjc:actEarly", bool(actuator.actearly))
-    set_schema_attribute(actuator_prim, "mjc:actLimited", mj_limited_to_token(actuator.actlimited))
-    set_schema_attribute(actuator_prim, "mjc:actRange:min", actuator.actrange[0])
-    set_schema_attribute(actuator_prim, "mjc:actRange:max", actuator.actrange[1])
-    set_schema_attribute(actuator_prim, "mjc:biasPrm", list(actuator.biasprm))
-    set_schema_attribute(actuator_prim, "mjc:biasType", convert_bias_type(actuator.biastype))
-    set_schema_attribute(actuator_prim, "mjc:crankLength", actuator.cranklength)
-    set_schema_attribute(actuator_prim, "mjc:ctrlLimited", mj_limited_to_token(actuator.ctrllimited))
-    set_schema_attribute(actuator_prim, "mjc:ctrlRange:min", actuator.ctrlrange[0])
-    set_schema_attribute(actuator_prim, "mjc:ctrlRange:max", actuator.ctrlrange[1])
-    set_schema_attribute(actuator_prim, "mjc:dynPrm", list(actuator.dynprm))
-    set_schema_attribute(actuator_prim, "mjc:dynType", convert_dyn_type(actuator.dyntype))
-    set_schema_attribute(actuator_prim, "mjc:forceLimited", mj_limited_to_token(actuator.forcelimited))
-    set_schema_attribute(actuator_prim, "mjc:forceRange:min", actuator.forcerange[0])
-    set_schema_attribute(actuator_prim, "mjc:forceRange:max", actuator.forcerange[1])
-    set_schema_attribute(actuator_prim, "mjc:gainPrm", list(actuator.gainprm))
-    set_schema_attribute(actuator_prim, "mjc:gainType", convert_gain_type(actuator.gaintype))
-    set_schema_attribute(actuator_prim, "mjc:gear", list(actuator.gear))
-    set_schema_attribute(actuator_prim, "mjc:group", actuator.group)
-    set_schema_attribute(actuator_prim, "mjc:inheritRange", actuator.inheritrange)
-    set_schema_attribute(actuator_prim, "mjc:lengthRange:min", actuator.lengthrange[0])
-    set_schema_attribute(actuator_prim, "mjc:lengthRange:max", actuator.lengthrange[1])
+    set_schema_attribute(actuator_prim, "mjc:actDim", fields.actdim)
+    set_schema_attribute(actuator_prim, "mjc:actEarly", fields.actearly)
+    set_schema_attribute(actuator_prim, "mjc:actLimited", mj_limited_to_token(fields.actlimited))
+    set_schema_attribute(actuator_prim, "mjc:actRange:min", fields.actrange[0])
+    set_schema_attribute(actuator_prim, "mjc:actRange:max", fields.actrange[1])
+    set_schema_attribute(actuator_prim, "mjc:biasPrm", fields.biasprm)
+    set_schema_attribute(actuator_prim, "mjc:biasType", convert_bias_type(fields.biastype))
+    set_schema_attribute(actuator_prim, "mjc:crankLength", fields.cranklength)
+    set_schema_attribute(actuator_prim, "mjc:ctrlLimited", mj_limited_to_token(fields.ctrllimited))
+    set_schema_attribute(actuator_prim, "mjc:ctrlRange:min", fields.ctrlrange[0])
+    set_schema_attribute(actuator_prim, "mjc:ctrlRange:max", fields.ctrlrange[1])
+    set_schema_attribute(actuator_prim, "mjc:dynPrm", fields.dynprm)
+    set_schema_attribute(actuator_prim, "mjc:dynType", convert_dyn_type(fields.dyntype))
+    set_schema_attribute(actuator_prim, "mjc:forceLimited", mj_limited_to_token(fields.forcelimited))
+    set_schema_attribute(actuator_prim, "mjc:forceRange:min", fields.forcerange[0])
+    set_schema_attribute(actuator_prim, "mjc:forceRange:max", fields.forcerange[1])
+    set_schema_attribute(actuator_prim, "mjc:gainPrm", fields.gainprm)
+    set_schema_attribute(actuator_prim, "mjc:gainType", convert_gain_type(fields.gaintype))
+    set_schema_attribute(actuator_prim, "mjc:gear", fields.gear)
+    set_schema_attribute(actuator_prim, "mjc:group", fields.group)
+    set_schema_attribute(actuator_prim, "mjc:inheritRange", fields.inheritrange)
+    set_schema_attribute(actuator_prim, "mjc:lengthRange:min", fields.lengthrange[0])
+    set_schema_attribute(actuator_prim, "mjc:lengthRange:max", fields.lengthrange[1])
 
     return actuator_prim
 
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any
+
+from pxr import Plug, Sdf, Tf, Usd
+
+__all__ = ["PrimOverride", "author_overrides", "get_schema_fallbacks"]
+
+# the namespaces of the attributes defined by the MuJoCo and Newton schemas
+SCHEMA_NAMESPACES = ("mjc:", "newton:")
+
+
+@dataclass
+class PrimOverride:
+    """
+    The applied API schemas, attributes and relationships to author on a single prim.
+
+    This is a plain record of the opinions, which :func:`author_overrides` writes directly into a
+    layer. It mirrors the ``Usd`` calls it replaces: schemas are applied in order, and attributes
+    are sparse, i.e. a value equal to the schema fallback is not authored unless forced.
+    """
+
+    path: Sdf.Path
+    schemas: list[str] = field(default_factory=list)
+    attributes: dict[str, Any] = field(default_factory=dict)
+    relationships: dict[str, Sdf.Path] = field(default_factory=dict)
+
+    def apply_schema(self, schema: str) -> None:
+        if schema not in self.schemas:
+            self.schemas.append(schema)
+
+    def set_attribute(self, name: str, value: Any, force: bool = False) -> None:
+        """Author an attribute of one of the applied schemas, if its value differs from the schema fallback or ``force`` is set."""
+        definition = self.__get_definition(name)
+        fallback = definition.GetFallbackValue()
+        if force or fallback is None or value != fallback:
+            self.attributes[name] = value
+
+    def set_target(self, name: str, target: Sdf.Path) -> None:
+        self.relationships[name] = target
+
+    def __get_definition(self, name: str) -> Usd.PrimDefinition.Attribute:
+        for schema in self.schemas:
+            if (definition := get_attribute_definition(schema, name)) is not None:
+                return definition
+        Tf.RaiseCodingError(f'Attribute "{name}" is not valid for prim <{self.path}> with schemas {self.schemas}')
+
+
+def author_overrides(stage: Usd.Stage, overrides: list[PrimOverride]) -> None:
+    """
+    Write prim overrides straight into the edit target layer of a stage.
+
+    The specs are authored with ``Sdf`` inside a single ``Sdf.ChangeBlock``, so the stage processes
+    the changes and recomposes once, rather than once for every schema applied and attribute set.
+    The result is identical to authoring the same opinions through ``Usd``.
+    """
+    layer = stage.GetEditTarget().GetLayer()
+    with Sdf.ChangeBlock():
+        for override in overrides:
+            prim_spec = layer.GetPrimAtPath(override.path) or Sdf.CreatePrimInLayer(layer, override.path)
+            if override.schemas:
+                schemas: Sdf.TokenListOp = prim_spec.GetInfo("apiSchemas")
+                prepended = list(schemas.prependedItems)
+                prepended.extend(schema for schema in override.schemas if schema not in prepended)
+                schemas.prependedItems = prepended
+                prim_spec.SetInfo("apiSchemas", schemas)
+            for name, value in override.attributes.items():
+                attr_spec = prim_spec.attributes.get(name)
+                if attr_spec is None:
+                    definition = next(d for schema in override.schemas if (d := get_attribute_definition(schema, name)) is not None)
+                    attr_spec = Sdf.AttributeSpec(prim_spec, name, definition.GetTypeName(), definition.GetVariability())
+                attr_spec.default = value
+            for name, target in override.relationships.items():
+                rel_spec = prim_spec.relationships.get(name) or Sdf.RelationshipSpec(prim_spec, name, custom=False)
+                rel_spec.targetPathList.explicitItems = [target]
+
+
+@cache
+def get_attribute_definition(schema: str, name: str) -> Usd.PrimDefinition.Attribute | None:
+    """The definition of an attribute of an applied API schema, or ``None`` if the schema does not define it."""
+    prim_definition = Usd.SchemaRegistry().FindAppliedAPIPrimDefinition(schema)
+    if prim_definition is None or name not in prim_definition.GetPropertyNames():
+        return None
+    return prim_definition.GetAttributeDefinition(name)
+
+
+@cache
+def get_schema_fallbacks() -> dict[str, Any]:
+    """
+    The fallback values of every ``mjc`` and ``newton`` attribute of the registered schemas, by attribute name.
+
+    The table is built once per process, so sparse authoring can compare values in Python rather
+    than resolving each attribute on the stage. Attributes whose fallback differs between schemas
+    are left out, so they are always resolved on the prim.
+    """
+    registry = Usd.SchemaRegistry()
+    fallbacks: dict[str, Any] = {}
+    conflicts: set[str] = set()
+    for schema_type in Plug.Registry().GetAllDerivedTypes(Tf.Type.FindByName("UsdSchemaBase")):
+        if not (schema := registry.GetSchemaTypeName(schema_type)):
+            continue
+        prim_definition = registry.FindConcretePrimDefinition(schema) or registry.FindAppliedAPIPrimDefinition(schema)
+        if prim_definition is None:
+            continue
+        for name in prim_definition.GetPropertyNames():
+            if not name.startswith(SCHEMA_NAMESPACES) or not (definition := prim_definition.GetAttributeDefinition(name)):
+                continue
+            fallback = definition.GetFallbackValue()
+            if name in fallbacks and fallbacks[name] != fallback:
+                conflicts.add(name)
+            fallbacks.setdefault(name, fallback)
+    for name in conflicts:
+        del fallbacks[name]
+    return fallbacks
@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import contextlib
+import json
+import math
+import multiprocessing
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field, replace
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+
+import usdex.core
+from pxr import Tf, UsdUtils
+
+from .convert import Converter
+
+__all__ = ["BatchResult", "convert_batch", "convert_model"]
+
+
+# the diagnostics reported with each result, the statuses are too verbose to stream per model
+DIAGNOSTIC_LEVELS = {
+    usdex.core.DiagnosticsLevel.eFatal: "fatal",
+    usdex.core.DiagnosticsLevel.eError: "error",
+    usdex.core.DiagnosticsLevel.eWarning: "warning",
+}
+
+
+@dataclass
+class BatchResult:
+    """The outcome of converting one model of a batch."""
+
+    input: str
+    output: str
+    # "converted", "failed", "timeout" or "skipped"
+    status: str
+    seconds: float = 0.0
+    asset: str | None = None
+    error: str | None = None
+    # the time each phase of the conversion took, in seconds
+    timings: dict[str, float] = field(default_factory=dict)
+    # the warnings and errors emitted while converting, in the order they were emitted
+    diagnostics: list[dict[str, str]] = field(default_factory=list)
+    # the hash of everything the asset depends on, when the batch is recorded in a journal
+    input_hash: str | None = None
+
+    def to_json(self) -> str:
+        """Serialize the result as a single line of JSON."""
+        return json.dumps(asdict(self))
+
+
+def convert_model(converter: Converter, input_file: Path, output_dir: Path) -> BatchResult:
+    """Convert a single model, capturing its outcome, timings and diagnostics rather than raising."""
+    result = BatchResult(input=input_file.as_posix(), output=output_dir.as_posix(), status="failed")
+    delegate = UsdUtils.CoalescingDiagnosticDelegate()
+    start = time.perf_counter()
+    converter.timings = {}
+    try:
+        if asset := converter.convert(input_file, output_dir):
+            result.status = "converted"
+            result.asset = asset.path
+        else:
+            result.error = "Conversion failed for unknown reason"
+    except Exception as e:
+        result.error = str(e)
+    result.seconds = time.perf_counter() - start
+    result.timings = dict(converter.timings)
+    for diagnostic in delegate.TakeUncoalescedDiagnostics():
+        level = usdex.core.getDiagnosticLevel(diagnostic.diagnosticCode)
+        if level in DIAGNOSTIC_LEVELS:
+            result.diagnostics.append({"level": DIAGNOSTIC_LEVELS[level], "message": diagnostic.commentary})
+    return result
+
+
+def _serve(connection: Connection, params: Converter.Params, convert: Callable[..., BatchResult]) -> None:
+    # the results are streamed on the stdout of the parent process, so anything a worker prints goes to stderr instead
+    os.dup2(2, 1)
+    converter = Converter(**asdict(params))
+    # signal that the imports are done, so the start up of the worker does not count towards the timeout of its first model
+    connection.send(None)
+    while (task := connection.recv()) is not None:
+        connection.send(convert(converter, *task))
+
+
+class _Worker:
+    def __init__(self, context: multiprocessing.context.SpawnContext, params: Converter.Params, convert: Callable[..., BatchResult]):
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child, params, convert), name="mujoco-usd-batch")
+        self.process.start()
+        child.close()
+        self.ready = False
+        self.task: tuple | None = None
+        self.deadline = math.inf
+
+    def start(self, task: tuple, timeout: float | None) -> None:
+        self.task = task
+        self.deadline = math.inf if timeout is None else time.monotonic() + timeout
+        self.connection.send(task)
+
+    def stop(self) -> None:
+        if self.process.is_alive():
+            with contextlib.suppress(OSError):
+                self.connection.send(None)
+            self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+
+    def kill(self) -> None:
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+
+def convert_batch(
+    models: list[tuple],
+    params: Converter.Params,
+    jobs: int = 1,
+    timeout: float | None = None,
+    convert: Callable[..., BatchResult] = convert_model,
+) -> Iterator[BatchResult]:
+    """
+    Convert many models in a pool of worker processes, yielding the result of each model as it completes.
+
+    Each model is a pair of the input MJCF file and the directory to convert it into, which the
+    workers pass to ``convert`` along with their converter. A ``convert`` other than
+    :func:`convert_model` must be picklable, and may take further arguments which follow the pair.
+
+    The workers are spawned once and convert one model at a time, so the imports and plugin
+    registration are paid once per worker rather than once per model. Workers are spawned rather
+    than forked, as forking a process which has already loaded USD is not safe.
+
+    A model which has not finished converting within ``timeout`` seconds is abandoned, by
+    terminating the worker converting it, and a fresh worker takes its place. A worker which exits
+    unexpectedly (e.g. on a crash in a native library) only fails the model it was converting.
+
+    The ``jobs`` processes are shared between the pool and the mesh decoding of each worker, so a
+    batch with fewer models than ``jobs`` gives each worker several processes to decode meshes with,
+    while a larger batch decodes meshes serially in each of its ``jobs`` workers.
+    """
+    context = multiprocessing.get_context("spawn")
+    params = replace(params, jobs=max(1, jobs // max(1, min(jobs, len(models)))))
+    pending = deque(models)
+    workers: list[_Worker] = []
+    try:
+        while pending or any(worker.task is not None for worker in workers):
+            for worker in workers:
+                if worker.ready and worker.task is None and pending:
+                    worker.start(pending.popleft(), timeout)
+            # workers which are still starting will take the next pending models, so only spawn for the rest
+            starting = sum(1 for worker in workers if worker.task is None)
+            workers.extend(_Worker(context, params, convert) for _ in range(min(jobs - len(workers), len(pending) - starting)))
+
+            waiting = [worker for worker in workers if not worker.ready or worker.task is not None]
+            deadline = min((worker.deadline for worker in waiting), default=math.inf)
+            ready = wait([worker.connection for worker in waiting], timeout=None if deadline == math.inf else max(0.0, deadline - time.monotonic()))
+            for worker in waiting:
+                if worker.connection in ready:
+                    try:
+                        message = worker.connection.recv()
+                    except EOFError:
+                        worker.kill()
+                        workers.remove(worker)
+                        if worker.task is None:
+                            Tf.RaiseRuntimeError(f"A batch worker process failed to start, with exit code {worker.process.exitcode}")
+                        input_file, output_dir = worker.task[:2]
+                        yield BatchResult(
+                            input=input_file.as_posix(),
+                            output=output_dir.as_posix(),
+                            status="failed",
+                            error=f"The worker process exited with code {worker.process.exitcode}",
+                        )
+                        continue
+                    if not worker.ready:
+                        worker.ready = True
+                    else:
+                        worker.task = None
+                        yield message
+                elif worker.task is not None and time.monotonic() >= worker.deadline:
+                    worker.kill()
+                    workers.remove(worker)
+                    input_file, output_dir = worker.task[:2]
+                    yield BatchResult(
+                        input=input_file.as_posix(),
+                        output=output_dir.as_posix(),
+                        status="timeout",
+                        seconds=timeout,
+                        error=f"The conversion did not finish within {timeout}s",
+                    )
+    finally:
+        for worker in workers:
+            worker.stop()
@@ -6,8 +6,10 @@ import numpy as np
 import usdex.core
 from pxr import Gf, Sdf, Tf, Usd, UsdGeom, UsdPhysics, Vt
 
+from .authoring import PrimOverride
 from .data import ConversionData, Tokens
 from .geom import convert_geom, get_geom_name
+from .inertia import BodyInertia
 from .joint import convert_joints
 from .numpy import convert_quatf, convert_vec3d
 from .utils import set_schema_attribute, set_transform
@@ -17,79 +19,101 @@ __all__ = ["convert_bodies"]
 
 def convert_bodies(data: ConversionData):
     geo_scope = data.content[Tokens.Geometry].GetDefaultPrim().GetChild(Tokens.Geometry).GetPrim()
-    convert_body(parent=geo_scope, name=data.spec.modelname, body=data.spec.worldbody, data=data)
+    worldbody = data.spec.worldbody
+    bodies = data.spec.bodies
+    articulated = get_articulated_descendants(bodies)
+    # the compiled mass of every body which needs it is read up front, from a single compile
+    data.body_inertias = bake_body_masses(get_mass_bake_bodies(bodies, data), data)
 
+    # The tree is walked depth first with an explicit stack, as long chains of bodies (e.g. ropes) would exceed the
+    # recursion limit. Bodies are converted in the same order as a recursive walk, and whether a body is kinematic
+    # is passed down the stack rather than read back from its parent prim.
+    stack: list[tuple[Usd.Prim, str, mujoco.MjsBody, bool]] = [(geo_scope, data.spec.modelname, worldbody, False)]
+    while stack:
+        parent, name, body, parent_kinematic = stack.pop()
+        kinematic = body.mocap or parent_kinematic
+        articulation_root = body.parent == worldbody and articulated[body]
+        body_prim = convert_body(parent=parent, name=name, body=body, kinematic=kinematic, articulation_root=articulation_root, data=data)
 
-def requires_mass_bake(body: mujoco.MjsBody, data: ConversionData) -> bool:
-    """Whether this body's mass depends on a geom that USD cannot accumulate mass from.
+        safe_names = data.name_cache.getPrimNames(body_prim, [get_body_name(x) for x in body.bodies])
+        stack.extend(reversed([(body_prim, safe_name, child_body, kinematic) for child_body, safe_name in zip(body.bodies, safe_names)]))
+
+
+def get_mass_bake_bodies(bodies: list[mujoco.MjsBody], data: ConversionData) -> list[mujoco.MjsBody]:
+    """The bodies whose mass depends on a geom that USD cannot accumulate mass from.
 
     MuJoCo infers body mass from every geom in ``inertiagrouprange``, including non-colliding
     ones. USD accumulates only from enabled colliders, so such a body needs explicit mass.
 
     Bodies whose mass comes solely from colliders are left alone: their mass is described as
-    the source expressed it, and baking would override an author's implicit intent.
+    the source expressed it, and baking would override an author's implicit intent. So are bodies
+    with an explicit inertial, which is authored as is.
+
+    The geoms of all bodies are gathered into arrays, so the decision is made for every body at once.
     """
     if data.spec.compiler.inertiafromgeom == mujoco.mjtInertiaFromGeom.mjINERTIAFROMGEOM_FALSE:
-        return False
+        return []
+    candidates = [body for body in bodies if body != data.spec.worldbody and not body.explicitinertial]
+    geoms = [(i, geom.contype, geom.conaffinity, geom.group, geom.mass, geom.density) for i, body in enumerate(candidates) for geom in body.geoms]
+    if not geoms:
+        return []
+    owner, contype, conaffinity, group, mass, density = np.array(geoms, dtype=np.float64).T
     lower, upper = data.spec.compiler.inertiagrouprange
-    for geom in body.geoms:
-        if geom.contype != 0 or geom.conaffinity != 0:
-            continue  # a collider; USD accumulates its mass
-        if not lower <= geom.group <= upper:
-            continue  # MuJoCo does not count it either
-        if not np.isnan(geom.mass):
-            if geom.mass > 0.0:
-                return True
-        elif geom.density > 0.0:
-            return True
-    return False
-
-
-def get_model_body_id(body: mujoco.MjsBody, model: mujoco.MjModel, data: ConversionData) -> int | None:
-    """Return the compiled body id for a spec body, or ``None`` if it cannot be located.
-
-    The match is positional: ``MjSpec.bodies`` is the body tree flattened depth-first, which is
-    the order the compiler assigns ids in. Composition happens before compilation and preserves
-    that agreement -- ``attach`` splices the attached subtree into both orderings at the same
-    point, and ``replicate`` expands into the spec as named clones.
-
-    Name is not a usable key here: a body name is optional, so every unnamed body shares the
-    empty name. Nor is ``MjsBody.id``, which is -1 until the spec itself is compiled, and this
-    compiles a copy to leave the spec being converted untouched.
-    """
-    index = next((i for i, b in enumerate(data.spec.bodies) if b is body), None)
-    if index is None or index >= model.nbody:
-        return None
-    return index
+    # colliders are accumulated by USD, and MuJoCo does not count geoms outside the group range either
+    visual = (contype == 0) & (conaffinity == 0) & (lower <= group) & (group <= upper)
+    # density only contributes when the mass is unspecified
+    massive = np.where(np.isnan(mass), density > 0.0, mass > 0.0)
+    bake = np.bincount(owner[visual & massive].astype(np.int64), minlength=len(candidates)) > 0
+    return [body for body, needs_bake in zip(candidates, bake.tolist()) if needs_bake]
 
 
-def bake_body_mass(body: mujoco.MjsBody, body_over: Usd.Prim, data: ConversionData) -> None:
-    """Author MuJoCo's compiled mass, centre of mass and inertia on the body prim.
+def bake_body_masses(bodies: list[mujoco.MjsBody], data: ConversionData) -> dict[mujoco.MjsBody, BodyInertia]:
+    """Read MuJoCo's compiled mass, centre of mass and inertia of several bodies at once.
 
-    See :func:`requires_mass_bake` for when a body needs this.
+    See :func:`get_mass_bake_bodies` for which bodies need this. Bodies which cannot be located
+    in the compiled model, or all of them if the model does not compile, are reported and left out.
     """
+    if not bodies:
+        return {}
     try:
         model = data.get_model()
     except Exception as e:
-        Tf.Warn(f"Unable to compile the model to bake mass for body '{body.name}': {e}")
-        return
-
-    body_id = get_model_body_id(body, model, data)
-    if body_id is None:
-        Tf.Warn(f"Unable to locate body '{body.name}' in the compiled model; mass not baked.")
-        return
-    compiled = model.body(body_id)
-
+        for body in bodies:
+            Tf.Warn(f"Unable to compile the model to bake mass for body '{body.name}': {e}")
+        return {}
+
+    index = data.get_model_index()
+    located: list[mujoco.MjsBody] = []
+    body_ids: list[int] = []
+    for body in bodies:
+        body_id = index.body_id(body)
+        if body_id is None:
+            Tf.Warn(f"Unable to locate body '{body.name}' in the compiled model; mass not baked.")
+            continue
+        located.append(body)
+        body_ids.append(body_id)
+
+    ids = np.array(body_ids, dtype=np.int64)
+    masses, positions, quats, inertias = model.body_mass[ids], model.body_ipos[ids], model.body_iquat[ids], model.body_inertia[ids]
+    return {
+        body: BodyInertia(float(mass), pos, quat, inertia)
+        for body, mass, pos, quat, inertia in zip(located, masses.tolist(), positions, quats, inertias)
+    }
+
+
+def author_body_mass(body_over: Usd.Prim, inertia: BodyInertia) -> None:
+    """Author the compiled mass, centre of mass and inertia of a body on its prim."""
     mass_api: UsdPhysics.MassAPI = UsdPhysics.MassAPI.Apply(body_over)
-    mass_api.CreateMassAttr().Set(float(compiled.mass[0]))
-    mass_api.CreateCenterOfMassAttr().Set(convert_vec3d(compiled.ipos))
-    inertia = convert_vec3d(compiled.inertia)
-    if inertia != Gf.Vec3f(0, 0, 0):
-        mass_api.CreatePrincipalAxesAttr().Set(convert_quatf(compiled.iquat).GetNormalized())
-        mass_api.CreateDiagonalInertiaAttr().Set(inertia)
+    mass_api.CreateMassAttr().Set(inertia.mass)
+    mass_api.CreateCenterOfMassAttr().Set(convert_vec3d(inertia.pos))
+    diagonal_inertia = convert_vec3d(inertia.inertia)
+    if diagonal_inertia != Gf.Vec3f(0, 0, 0):
+        mass_api.CreatePrincipalAxesAttr().Set(convert_quatf(inertia.quat).GetNormalized())
+        mass_api.CreateDiagonalInertiaAttr().Set(diagonal_inertia)
 
 
-def convert_body(parent: Usd.Prim, name: str, body: mujoco.MjsBody, data: ConversionData) -> UsdGeom.Xform:
+def convert_body(parent: Usd.Prim, name: str, body: mujoco.MjsBody, kinematic: bool, articulation_root: bool, data: ConversionData) -> Usd.Prim:
+    """Convert a single body, without its child bodies, returning its prim in the geometry layer."""
     if body == data.spec.worldbody:
         # the worldbody is already converted as the default prim and
         # its children need to be nested under the geometry scope
@@ -97,7 +121,7 @@ def convert_body(parent: Usd.Prim, name: str, body: mujoco.MjsBody, data: Conver
     else:
         body_xform = usdex.core.defineXform(parent, name)
         body_prim = body_xform.GetPrim()
-        set_transform(body_xform, body, data.spec)
+        set_transform(body_xform, body, data.get_spec_transforms())
         # FUTURE: specialize from childclass (asset: spot, cassie)
         if name != body.name:
             usdex.core.setDisplayName(body_prim, body.name)
@@ -108,21 +132,26 @@ def convert_body(parent: Usd.Prim, name: str, body: mujoco.MjsBody, data: Conver
 
     # sites are specialized geoms used as frame markers, so we convert them as guide Gprims
     safe_names = data.name_cache.getPrimNames(body_prim, [get_geom_name(x) for x in body.sites])
+    site_paths: dict[str, Sdf.Path] = {}
     for site, safe_name in zip(body.sites, safe_names):
         if site_prim := convert_geom(parent=body_prim, name=safe_name, geom=site, data=data):
             site_prim.GetPurposeAttr().Set(UsdGeom.Tokens.guide)
-            site_over: Usd.Prim = data.content[Tokens.Physics].OverridePrim(site_prim.GetPath())
-            data.references[Tokens.PhysicsSites][site.name] = site_over
-            site_over.ApplyAPI("MjcSiteAPI")
-            site_over.ApplyAPI("NewtonSiteAPI")
-            set_schema_attribute(site_over, "mjc:group", site.group)
+            site_over = PrimOverride(site_prim.GetPath(), ["MjcSiteAPI", "NewtonSiteAPI"])
+            site_over.set_attribute("mjc:group", site.group)
+            data.add_override(Tokens.Physics, site_over)
+            site_paths[site.name] = site_prim.GetPath()
+
+    # the geoms and sites of the body are authored into the content layers together
+    data.author_overrides()
+    for site_name, site_path in site_paths.items():
+        data.references[Tokens.PhysicsSites][site_name] = data.content[Tokens.Physics].GetPrimAtPath(site_path)
 
     if body != data.spec.worldbody:
         body_over = data.content[Tokens.Physics].OverridePrim(body_prim.GetPath())
         data.references[Tokens.PhysicsBodies][body.name] = body_over
         rbd: UsdPhysics.RigidBodyAPI = UsdPhysics.RigidBodyAPI.Apply(body_over)
         # when the parent body is kinematic, the child body must also be kinematic
-        if is_kinematic(body, body_over):
+        if kinematic:
             rbd.CreateKinematicEnabledAttr().Set(True)
 
         # Store concept gaps as custom attributes
@@ -148,48 +177,39 @@ def convert_body(parent: Usd.Prim, name: str, body: mujoco.MjsBody, data: Conver
                 if not np.isnan(body.fullinertia[0]):
                     body_over.ApplyAPI("NewtonMassAPI")
                     set_schema_attribute(body_over, "newton:inertia", Vt.DoubleArray.FromNumpy(body.fullinertia))
-        elif requires_mass_bake(body, data):
-            bake_body_mass(body, body_over, data)
+        elif (body_inertia := data.body_inertias.get(body)) is not None:
+            author_body_mass(body_over, body_inertia)
 
         convert_joints(parent=body_over, body=body, data=data)
 
-    safe_names = data.name_cache.getPrimNames(body_prim, [get_body_name(x) for x in body.bodies])
-    for child_body, safe_name in zip(body.bodies, safe_names):
-        child_body_prim = convert_body(parent=body_prim, name=safe_name, body=child_body, data=data)
-        if child_body_prim and body == data.spec.worldbody and has_articulated_descendants(child_body):
-            child_body_over = data.content[Tokens.Physics].OverridePrim(child_body_prim.GetPath())
-            UsdPhysics.ArticulationRootAPI.Apply(child_body_over)
-            child_body_over.ApplyAPI("NewtonArticulationRootAPI")
-            set_schema_attribute(child_body_over, "newton:jointsAddMobility", True)
+        if articulation_root:
+            UsdPhysics.ArticulationRootAPI.Apply(body_over)
+            body_over.ApplyAPI("NewtonArticulationRootAPI")
+            set_schema_attribute(body_over, "newton:jointsAddMobility", True)
 
     return body_prim
 
 
-def is_kinematic(body: mujoco.MjsBody, physics_prim: Usd.Prim) -> bool:
-    if body.mocap:
-        return True
+def get_articulated_descendants(bodies: list[mujoco.MjsBody]) -> dict[mujoco.MjsBody, bool]:
+    """
+    Whether each body has descendants connected by non-free joints or implicit fixed joints.
+
+    ``bodies`` is the body tree flattened depth first (i.e. ``MjSpec.bodies``), so walking it in
+    reverse visits every child before its parent, and each body is visited once.
+    """
+    articulated: dict[mujoco.MjsBody, bool] = {}
+    for body in reversed(bodies):
+        articulated[body] = any(is_articulated(child_body) or articulated[child_body] for child_body in body.bodies)
+    return articulated
+
 
-    kinematic_attr = UsdPhysics.RigidBodyAPI(physics_prim.GetParent()).GetKinematicEnabledAttr()
-    return kinematic_attr and kinematic_attr.Get()
-
-
-def has_articulated_descendants(body: mujoco.MjsBody) -> bool:
-    # Recursively check if this body has child bodies connected
-    # by non-free joints or implicit fixed joints
-    for child_body in body.bodies:
-        # a child body without joints indicates a fully-constrained relationship,
-        # which we do consider an articulation, as the USD equivalent will have
-        # a PhysicsFixedJoint between the bodies
-        if not child_body.joints:
-            return True
-        if child_body.joints:
-            for joint in child_body.joints:
-                if joint.type != mujoco.mjtJoint.mjJNT_FREE:
-                    return True
-        # Recursively check all descendants until we find a body with non-free joints
-        if has_articulated_descendants(child_body):
-            return True
-    return False
+def is_articulated(body: mujoco.MjsBody) -> bool:
+    # a body without joints indicates a fully-constrained relationship to its parent,
+    # which we do consider an articulation, as the USD equivalent will have
+    # a PhysicsFixedJoint between the bodies
+    if not body.joints:
+        return True
+    return any(joint.type != mujoco.mjtJoint.mjJNT_FREE for joint in body.joints)
 
 
 def extract_inertia(fullinertia: np.ndarray) -> tuple[Gf.Quatf, Gf.Vec3f]:
@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import contextlib
+import hashlib
+import os
+import pathlib
+import shutil
+import tempfile
+from collections.abc import Callable
+
+__all__ = ["DEFAULT_CACHE_MAX_BYTES", "DiskCache", "FileHashes", "hash_file", "hash_key"]
+
+# The size limit of each cache within a cache directory, unless the conversion sets its own
+DEFAULT_CACHE_MAX_BYTES = 1 << 30
+
+
+def hash_file(path: pathlib.Path) -> str:
+    """Return the sha256 hex digest of the contents of a file."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FileHashes:
+    """
+    A memo of :func:`hash_file`, for files which are hashed repeatedly (e.g. the assets shared by many models of a batch).
+
+    Digests are keyed by the path, size and modification time of each file, so a file which is
+    modified is hashed again.
+    """
+
+    def __init__(self):
+        self.digests: dict[tuple[str, int, int], str] = {}
+
+    def __call__(self, path: pathlib.Path) -> str:
+        stat = path.stat()
+        key = (path.absolute().as_posix(), stat.st_size, stat.st_mtime_ns)
+        if (digest := self.digests.get(key)) is None:
+            digest = self.digests[key] = hash_file(path)
+        return digest
+
+
+def hash_key(*parts: str) -> str:
+    """Combine several strings (e.g. file digests and settings) into a single cache key."""
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class DiskCache:
+    """
+    A size bounded, content addressed cache of directories on disk.
+
+    Each entry is a directory named by its key. Entries are written into a private temporary
+    directory and then renamed into place, so readers never observe a partial entry and several
+    processes may share the same cache. When two processes publish the same key, the first one
+    wins and the other discards its copy.
+
+    Reading an entry refreshes its modification time, and :meth:`evict` removes the least recently
+    used entries until the cache fits within ``max_bytes``. Evicted entries are renamed out of place
+    before they are deleted, so readers never observe a partially deleted entry either.
+    """
+
+    def __init__(self, root: pathlib.Path, max_bytes: int):
+        self.root = pathlib.Path(root)
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> pathlib.Path | None:
+        """Return the directory of the entry for ``key``, or ``None`` if it is not cached."""
+        entry = self.__entry_path(key)
+        try:
+            os.utime(entry)
+        except OSError:
+            return None
+        return entry
+
+    def put(self, key: str, write: Callable[[pathlib.Path], None]) -> pathlib.Path:
+        """
+        Publish a new entry for ``key``, returning its directory.
+
+        Args:
+            key: The content address of the entry.
+            write: A callable which writes the entry files into the directory it is given.
+        """
+        entry = self.__entry_path(key)
+        staging = self.root / "staging"
+        staging.mkdir(parents=True, exist_ok=True)
+        tmp = pathlib.Path(tempfile.mkdtemp(dir=staging))
+        try:
+            write(tmp)
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp.rename(entry)
+        except OSError:
+            # another process published the same entry first
+            if not entry.exists():
+                raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        return entry
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits within its size limit."""
+        entries = []
+        total = 0
+        for entry in self.root.glob("??/*"):
+            try:
+                size = sum(f.stat().st_size for f in entry.iterdir())
+                entries.append((entry.stat().st_mtime, size, entry))
+            except OSError:
+                continue  # removed by another process
+            total += size
+
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self.__remove(entry)
+            total -= size
+
+    def __remove(self, entry: pathlib.Path) -> None:
+        # the entry is renamed out of place before it is deleted, so a reader sees either the whole entry or no entry
+        staging = self.root / "staging"
+        staging.mkdir(parents=True, exist_ok=True)
+        tmp = pathlib.Path(tempfile.mkdtemp(dir=staging))
+        # the entry may already have been removed by another process
+        with contextlib.suppress(OSError):
+            entry.rename(tmp / entry.name)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    def __entry_path(self, key: str) -> pathlib.Path:
+        return self.root / key[:2] / key
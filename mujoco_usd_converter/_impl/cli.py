@@ -1,6 +1,7 @@
-# SPDX-FileCopyrightText: Copyright (c) 2025 The Newton Developers
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026 The Newton Developers
 # SPDX-License-Identifier: Apache-2.0
 import argparse
+from dataclasses import asdict
 from pathlib import Path
 
 import mujoco
@@ -9,7 +10,10 @@ import usdex.core
 from pxr import Tf, Usd
 
 from .._version import __version__
+from .batch import convert_batch
+from .cache import DEFAULT_CACHE_MAX_BYTES
 from .convert import Converter
+from .journal import BatchJournal, resume_batch
 
 
 def run() -> int:
@@ -20,16 +24,26 @@ def run() -> int:
     args = parser.parse_args()
 
     # Argument validation
-    # Check input_file
-    if not args.input_file.exists():
-        Tf.Warn(f"Input file does not exist: {args.input_file}")
-        return 1
-    if not args.input_file.is_file():
-        Tf.Warn(f"Input path is not a file: {args.input_file}")
-        return 1
-    if args.input_file.suffix.lower() != ".xml":
-        Tf.Warn(f"Only MJCF (.xml) files are supported as input, got: {args.input_file.suffix}")
-        return 1
+    # Check input_files
+    for input_file in args.input_files:
+        if not input_file.exists():
+            Tf.Warn(f"Input file does not exist: {input_file}")
+            return 1
+        if not input_file.is_file():
+            Tf.Warn(f"Input path is not a file: {input_file}")
+            return 1
+        if input_file.suffix.lower() != ".xml":
+            Tf.Warn(f"Only MJCF (.xml) files are supported as input, got: {input_file.suffix}")
+            return 1
+    # Check that every model of a batch converts into its own directory
+    if len(args.input_files) > 1:
+        models = [(input_file, args.output_dir / input_file.stem) for input_file in args.input_files]
+        outputs = [output_dir for _, output_dir in models]
+        for output_dir in sorted({x for x in outputs if outputs.count(x) > 1}):
+            Tf.Warn(f"Multiple input files would be converted into the same directory: {output_dir}")
+            return 1
+    else:
+        models = [(args.input_files[0], args.output_dir)]
     # Check output_dir
     if args.output_dir.exists() and not args.output_dir.is_dir():
         Tf.Warn(f"Output path exists but is not a directory: {args.output_dir}")
@@ -40,6 +54,26 @@ def run() -> int:
         except Exception as e:
             Tf.Warn(f"Failed to create output directory: {args.output_dir}, error: {e}")
             return 1
+    # Check jobs
+    if args.jobs < 1:
+        Tf.Warn(f"The number of jobs must be at least 1, got: {args.jobs}")
+        return 1
+    # Check cache size
+    if args.cache_max_size < 1:
+        Tf.Warn(f"The cache size limit must be at least 1 byte, got: {args.cache_max_size}")
+        return 1
+    # Check weld tolerance
+    if args.weld_tolerance < 0:
+        Tf.Warn(f"The weld tolerance must not be negative, got: {args.weld_tolerance}")
+        return 1
+    # Check timeout
+    if args.timeout is not None and args.timeout <= 0:
+        Tf.Warn(f"The timeout must be positive, got: {args.timeout}")
+        return 1
+    # Check journal
+    if args.journal is not None and args.journal.exists() and not args.journal.is_file():
+        Tf.Warn(f"Journal path exists but is not a file: {args.journal}")
+        return 1
 
     usdex.core.activateDiagnosticsDelegate()
     usdex.core.setDiagnosticsLevel(usdex.core.DiagnosticsLevel.eStatus if args.verbose else usdex.core.DiagnosticsLevel.eWarning)
@@ -50,9 +84,24 @@ def run() -> int:
     Tf.Status(f"MuJoCo Version: {mujoco.__version__}")
     Tf.Status(f"Newton USD Schemas Version: {newton_usd_schemas.__version__}")
 
+    params = Converter.Params(
+        layer_structure=not args.no_layer_structure,
+        scene=not args.no_physics_scene,
+        comment=args.comment,
+        jobs=args.jobs,
+        cache_dir=args.cache_dir,
+        cache_max_bytes=args.cache_max_size,
+        weld_tolerance=args.weld_tolerance,
+        merge_obj_shapes=args.merge_obj_shapes,
+        prune_unused_assets=args.prune_unused_assets,
+        compile_in_background=args.compile_in_background,
+    )
+    if len(models) > 1 or args.timeout is not None or args.journal is not None:
+        return __run_batch(models, params, args)
+
     try:
-        converter = Converter(layer_structure=not args.no_layer_structure, scene=not args.no_physics_scene, comment=args.comment)
-        if result := converter.convert(args.input_file, args.output_dir):
+        converter = Converter(**asdict(params))
+        if result := converter.convert(args.input_files[0], args.output_dir):
             Tf.Status(f"Created USD Asset: {result.path}")
             return 0
         else:
@@ -66,6 +115,37 @@ def run() -> int:
             return 1
 
 
+def __run_batch(models: list[tuple[Path, Path]], params: Converter.Params, args: argparse.Namespace) -> int:
+    # each result is streamed to stdout as a line of JSON, while diagnostics are reported on stderr
+    failed = 0
+    if args.journal is not None:
+        results = resume_batch(models, BatchJournal(args.journal), params, jobs=args.jobs, timeout=args.timeout)
+    else:
+        results = convert_batch(models, params, jobs=args.jobs, timeout=args.timeout)
+    for result in results:
+        print(result.to_json(), flush=True)
+        if result.status == "converted":
+            Tf.Status(f"Created USD Asset: {result.asset} in {result.seconds:.3f}s")
+        elif result.status == "skipped":
+            Tf.Status(f"Skipped {result.input}, which the journal records as converted to {result.asset}")
+        else:
+            failed += 1
+            Tf.Warn(f"Conversion of {result.input} failed: {result.error}")
+    if failed:
+        Tf.Warn(f"{failed} of {len(models)} conversions failed")
+        return 1
+    return 0
+
+
+def __parse_size(value: str) -> int:
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+    scale = units.get(value[-1:].upper(), 1)
+    try:
+        return int(float(value[:-1] if scale > 1 else value) * scale)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r}") from None
+
+
 def __create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Convert MuJoCo MJCF files to USD format",
@@ -74,9 +154,15 @@ def __create_parser() -> argparse.ArgumentParser:
 
     # Required arguments
     parser.add_argument(
-        "input_file",
+        "input_files",
         type=Path,
-        help="Path to the input MJCF (MuJoCo XML) file",
+        nargs="+",
+        metavar="input_file",
+        help="""
+        Path to the input MJCF (MuJoCo XML) file. Several files may be given to convert them as a batch,
+        in which case each model is converted into <output_dir>/<input_file stem> and the result of each
+        conversion is streamed to stdout as a line of JSON
+        """,
     )
     parser.add_argument(
         "output_dir",
@@ -102,6 +188,67 @@ def __create_parser() -> argparse.ArgumentParser:
         default=False,
         help="Disable authoring a `UsdPhysics.Scene` prim with the `MjcPhysicsSceneAPI` as a sibling of the default prim",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes used to decode mesh files, or to convert the models of a batch",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Number of seconds after which the conversion of a model is abandoned. Runs the conversion in a worker process",
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        default=None,
+        help="""
+        Path to a journal file which records the outcome of each conversion as it completes. When the journal already
+        exists, models it records as converted from unchanged inputs are skipped, and any others are converted again
+        """,
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory of a persistent cache of decoded meshes and compiled models, which may be shared between conversions",
+    )
+    parser.add_argument(
+        "--cache-max-size",
+        type=__parse_size,
+        default=DEFAULT_CACHE_MAX_BYTES,
+        help="""
+        Size limit of each cache in --cache-dir, in bytes or with a K, M, G or T suffix. The least recently used
+        entries are evicted beyond it
+        """,
+    )
+    parser.add_argument(
+        "--weld-tolerance",
+        type=float,
+        default=0.0,
+        help="Distance within which STL vertices are merged, removing any degenerate or duplicate triangles. Disabled when 0",
+    )
+    parser.add_argument(
+        "--merge-obj-shapes",
+        action="store_true",
+        default=False,
+        help="Convert every shape of an OBJ file as a face subset of a single mesh, rather than only the first shape which MuJoCo simulates",
+    )
+    parser.add_argument(
+        "--prune-unused-assets",
+        action="store_true",
+        default=False,
+        help="Only convert the meshes and materials which are used by a geom or site, skipping any others defined in the MJCF",
+    )
+    parser.add_argument(
+        "--compile-in-background",
+        action="store_true",
+        default=False,
+        help="Compile the model on a background thread while meshes and materials are converted, e.g. for models which bake body mass",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -3,6 +3,7 @@
 import pathlib
 import tempfile
 from dataclasses import dataclass
+from functools import partial
 
 import mujoco
 
@@ -14,11 +15,13 @@ from pxr import Sdf, Tf, Usd, UsdGeom, UsdPhysics
 from ._flatten import export_flattened
 from .actuator import convert_actuators
 from .body import convert_bodies
+from .cache import DEFAULT_CACHE_MAX_BYTES, DiskCache
 from .data import ConversionData, Tokens
 from .equality import convert_equalities
 from .exclude import convert_excludes
 from .material import convert_materials
 from .mesh import convert_meshes
+from .plan import ConversionPlan
 from .scene import convert_scene
 from .tendon import convert_tendons
 from .utils import get_authoring_metadata
@@ -32,9 +35,41 @@ class Converter:
         layer_structure: bool = True
         scene: bool = True
         comment: str = ""
-
-    def __init__(self, layer_structure: bool = True, scene: bool = True, comment: str = ""):
-        self.params = self.Params(layer_structure=layer_structure, scene=scene, comment=comment)
+        jobs: int = 1
+        cache_dir: str | None = None
+        weld_tolerance: float = 0.0
+        merge_obj_shapes: bool = False
+        prune_unused_assets: bool = False
+        compile_in_background: bool = False
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+
+    def __init__(
+        self,
+        layer_structure: bool = True,
+        scene: bool = True,
+        comment: str = "",
+        jobs: int = 1,
+        cache_dir: str | None = None,
+        weld_tolerance: float = 0.0,
+        merge_obj_shapes: bool = False,
+        prune_unused_assets: bool = False,
+        compile_in_background: bool = False,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        self.params = self.Params(
+            layer_structure=layer_structure,
+            scene=scene,
+            comment=comment,
+            jobs=jobs,
+            cache_dir=cache_dir,
+            weld_tolerance=weld_tolerance,
+            merge_obj_shapes=merge_obj_shapes,
+            prune_unused_assets=prune_unused_assets,
+            compile_in_background=compile_in_background,
+            cache_max_bytes=cache_max_bytes,
+        )
+        # the time each phase of the most recent conversion took, in seconds
+        self.timings: dict[str, float] = {}
 
     def convert(self, input_file: str, output_dir: str) -> Sdf.AssetPath:
         """
@@ -77,7 +112,17 @@ class Converter:
             name_cache=usdex.core.NameCache(),
             scene=self.params.scene,
             comment=self.params.comment,
+            jobs=self.params.jobs,
+            weld_tolerance=self.params.weld_tolerance,
+            merge_obj_shapes=self.params.merge_obj_shapes,
+            prune_unused_assets=self.params.prune_unused_assets,
         )
+        if self.params.cache_dir:
+            data.mesh_cache = DiskCache(pathlib.Path(self.params.cache_dir) / "meshes", self.params.cache_max_bytes)
+            data.model_cache = DiskCache(pathlib.Path(self.params.cache_dir) / "models", self.params.cache_max_bytes)
+            data.model_path = input_path.absolute()
+        if self.params.compile_in_background:
+            data.start_compile()
 
         # setup the main output layer (which will become an asset interface later)
         if not self.params.layer_structure:
@@ -105,48 +150,44 @@ class Converter:
         # setup the root layer of the payload
         data.content[Tokens.Contents] = usdex.core.createAssetPayload(asset_stage)
 
-        # author the mesh library
-        convert_meshes(data)
-        # setup a content layer for referenced meshes
-        data.content[Tokens.Geometry] = usdex.core.addAssetContent(data.content[Tokens.Contents], Tokens.Geometry, format="usda")
-
+        def write_asset():
+            nonlocal asset_identifier
+            # optionally flatten the asset
+            if not self.params.layer_structure:
+                data.writer.flush()
+                asset_identifier = export_flattened(asset_stage, output_dir, asset_dir, asset_stem, asset_format, self.params.comment)
+            else:
+                # the libraries, content layers and asset are written together
+                data.writer.save_stage(asset_stage, self.params.comment)
+                data.writer.flush()
+
+        plan = ConversionPlan()
+        # author the mesh library and setup a content layer for referenced meshes
+        plan.add("meshes", partial(convert_meshes, data))
+        plan.add("geometry", partial(add_geometry_content, data), depends=("meshes",))
         # author the material library and setup the content layer for materials only if there are materials
-        convert_materials(data)
-
+        # the content layers are sublayered in the order they are added, so each follows the previous one
+        plan.add("materials", partial(convert_materials, data), depends=("geometry",))
         # setup a content layer for physics
-        data.content[Tokens.Physics] = usdex.core.addAssetContent(data.content[Tokens.Contents], Tokens.Physics, format="usda")
-        data.references[Tokens.PhysicsBodies] = {}
-        data.references[Tokens.PhysicsJoints] = {}
-        data.references[Tokens.PhysicsSites] = {}
-        data.references[Tokens.PhysicsTendons] = {}
-
+        plan.add("physics", partial(add_physics_content, data), depends=("materials",))
         # author the physics scene
         if self.params.scene:
-            convert_scene(data)
-
+            plan.add("scene", partial(convert_scene, data), depends=("physics",))
         # author the kinematic tree
-        convert_bodies(data)
-
-        # author the tendons
-        convert_tendons(data)
-
-        # author the actuators
-        convert_actuators(data)
-
-        # author the equalities
-        convert_equalities(data)
-
-        # author the contact excludes
-        convert_excludes(data)
-
+        plan.add("bodies", partial(convert_bodies, data), depends=("meshes", "materials", "physics"))
+        # author the tendons, actuators, equalities and contact excludes, which target the bodies, joints and sites
+        plan.add("tendons", partial(convert_tendons, data), depends=("bodies",))
+        plan.add("actuators", partial(convert_actuators, data), depends=("bodies", "tendons"))
+        plan.add("equalities", partial(convert_equalities, data), depends=("bodies",))
+        plan.add("excludes", partial(convert_excludes, data), depends=("bodies",))
         # create the asset interface
-        usdex.core.addAssetInterface(asset_stage, source=data.content[Tokens.Contents])
-
-        # optionally flatten the asset
-        if not self.params.layer_structure:
-            asset_identifier = export_flattened(asset_stage, output_dir, asset_dir, asset_stem, asset_format, self.params.comment)
-        else:
-            usdex.core.saveStage(asset_stage, comment=self.params.comment)
+        plan.add(
+            "interface",
+            partial(usdex.core.addAssetInterface, asset_stage, source=data.content[Tokens.Contents]),
+            depends=("tendons", "actuators", "equalities", "excludes"),
+        )
+        plan.add("write", write_asset, depends=("interface",))
+        self.timings = plan.run()
 
         # warn about known limitations
         self.warn(spec)
@@ -168,3 +209,15 @@ class Converter:
             Tf.Warn("pairs are not supported")
         if spec.sensors:
             Tf.Warn("sensors are not supported")
+
+
+def add_geometry_content(data: ConversionData):
+    data.content[Tokens.Geometry] = usdex.core.addAssetContent(data.content[Tokens.Contents], Tokens.Geometry, format="usda")
+
+
+def add_physics_content(data: ConversionData):
+    data.content[Tokens.Physics] = usdex.core.addAssetContent(data.content[Tokens.Contents], Tokens.Physics, format="usda")
+    data.references[Tokens.PhysicsBodies] = {}
+    data.references[Tokens.PhysicsJoints] = {}
+    data.references[Tokens.PhysicsSites] = {}
+    data.references[Tokens.PhysicsTendons] = {}
@@ -1,10 +1,21 @@
-# SPDX-FileCopyrightText: Copyright (c) 2025 The Newton Developers
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026 The Newton Developers
 # SPDX-License-Identifier: Apache-2.0
-from dataclasses import dataclass
+import pathlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 
 import mujoco
 import usdex.core
-from pxr import Sdf, Usd
+from pxr import Sdf, Usd, UsdShade
+
+from .authoring import PrimOverride, author_overrides
+from .cache import DiskCache
+from .index import ModelIndex
+from .inertia import BodyInertia, MeshInertia
+from .model import compile_model
+from .snapshot import SpecSnapshot
+from .transform import SpecTransforms
+from .writer import LayerWriter
 
 __all__ = ["ConversionData", "Tokens"]
 
@@ -36,13 +47,84 @@ class ConversionData:
     name_cache: usdex.core.NameCache
     scene: bool
     comment: str
+    jobs: int = 1
+    weld_tolerance: float = 0.0
+    merge_obj_shapes: bool = False
+    prune_unused_assets: bool = False
+    mesh_cache: DiskCache | None = None
+    model_cache: DiskCache | None = None
+    model_path: pathlib.Path | None = None
+    model_index: ModelIndex | None = None
+    spec_meshes: dict[str, mujoco.MjsMesh] | None = None
+    mesh_inertias: dict[str, MeshInertia] = field(default_factory=dict)
+    body_inertias: dict[mujoco.MjsBody, BodyInertia] = field(default_factory=dict)
+    model_future: Future | None = None
+    physics_materials: dict[tuple[float, ...], UsdShade.Material] = field(default_factory=dict)
+    spec_transforms: SpecTransforms | None = None
+    spec_snapshot: SpecSnapshot | None = None
+    overrides: dict[Tokens, list[PrimOverride]] = field(default_factory=dict)
+    writer: LayerWriter = field(default_factory=LayerWriter)
 
     def get_model(self) -> mujoco.MjModel:
         """Compile the spec on demand, caching the result. Raises if compilation fails.
 
         A copy is compiled because ``MjSpec.compile()`` mutates the spec it is called on,
-        and conversion reads from the spec throughout.
+        and conversion reads from the spec throughout. When a model cache is configured, a model
+        compiled from the same inputs by an earlier conversion is loaded instead.
         """
         if self.model is None:
-            self.model = self.spec.copy().compile()
+            if self.model_future is not None:
+                # re-raises any compilation error, as compiling in place would
+                self.model = self.model_future.result()
+            else:
+                self.model = self.__compile(self.spec.copy())
         return self.model
+
+    def start_compile(self) -> None:
+        """Start compiling the spec on a background thread, so :meth:`get_model` only waits for it to finish.
+
+        The copy is taken up front, on the calling thread, so the compile never reads the spec
+        while conversion is reading it. MuJoCo releases the GIL for much of the compile, so it
+        overlaps with mesh and material conversion.
+        """
+        if self.model is None and self.model_future is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mujoco-compile")
+            self.model_future = executor.submit(self.__compile, self.spec.copy())
+            executor.shutdown(wait=False)
+
+    def __compile(self, spec: mujoco.MjSpec) -> mujoco.MjModel:
+        return compile_model(spec, self.model_cache, self.model_path)
+
+    def get_model_index(self) -> ModelIndex:
+        """Compile the spec on demand and index its elements against the model, caching the result."""
+        if self.model_index is None:
+            self.model_index = ModelIndex(self.spec, self.get_model())
+        return self.model_index
+
+    def get_spec_transforms(self) -> SpecTransforms:
+        """Resolve the local transforms of all spec elements together, caching the result."""
+        if self.spec_transforms is None:
+            self.spec_transforms = SpecTransforms(self.spec)
+        return self.spec_transforms
+
+    def get_spec_snapshot(self) -> SpecSnapshot:
+        """Gather the numeric fields of the geoms, joints, actuators and tendons of the spec in one pass, caching the result."""
+        if self.spec_snapshot is None:
+            self.spec_snapshot = SpecSnapshot(self.spec)
+        return self.spec_snapshot
+
+    def add_override(self, token: Tokens, override: PrimOverride) -> None:
+        """Queue a prim override for the content layer of ``token``, until :meth:`author_overrides` writes it."""
+        self.overrides.setdefault(token, []).append(override)
+
+    def author_overrides(self) -> None:
+        """Write all queued prim overrides, recomposing each content stage once rather than once per override."""
+        for token, overrides in self.overrides.items():
+            author_overrides(self.content[token], overrides)
+        self.overrides.clear()
+
+    def get_spec_mesh(self, name: str) -> mujoco.MjsMesh | None:
+        """Find a spec mesh by name, without the linear search of ``MjSpec.mesh()``."""
+        if self.spec_meshes is None:
+            self.spec_meshes = {mesh.name: mesh for mesh in self.spec.meshes if mesh.name}
+        return self.spec_meshes.get(name)
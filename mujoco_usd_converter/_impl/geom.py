@@ -5,22 +5,16 @@ import numpy as np
 import usdex.core
 from pxr import Gf, Tf, Usd, UsdGeom, UsdPhysics, UsdShade, Vt
 
+from .authoring import PrimOverride
 from .data import ConversionData, Tokens
-from .numpy import convert_color, convert_quatf, convert_vec3d
+from .inertia import MeshInertia, rotate
+from .numpy import convert_color, convert_quatd, convert_quatf, convert_vec3d
 from .utils import get_fromto_vectors, set_purpose, set_schema_attribute, set_transform
 
-__all__ = ["convert_geom", "get_geom_name"]
+__all__ = ["FITTED_GEOM_TYPES", "convert_geom", "get_geom_name"]
 
-
-def solref_to_stiffness_damping(solref) -> tuple[float, float]:
-    """Convert MuJoCo solref (timeconst, dampratio) to Newton stiffness and damping."""
-    timeconst = float(solref[0])
-    dampratio = float(solref[1])
-    if timeconst < 0.0 and dampratio < 0.0:
-        return -timeconst, -dampratio
-    if timeconst <= 0.0 or dampratio <= 0.0:
-        return float("-inf"), float("-inf")
-    return 1.0 / (timeconst * timeconst * dampratio * dampratio), 2.0 / timeconst
+# primitive geoms which are fitted to their mesh when they specify one
+FITTED_GEOM_TYPES = (mujoco.mjtGeom.mjGEOM_SPHERE, mujoco.mjtGeom.mjGEOM_BOX, mujoco.mjtGeom.mjGEOM_CYLINDER, mujoco.mjtGeom.mjGEOM_CAPSULE)
 
 
 def get_geom_name(geom: mujoco.MjsGeom) -> str:
@@ -98,7 +92,7 @@ def convert_mesh(parent: Usd.Prim, name: str, geom: mujoco.MjsGeom, data: Conver
     # we need to block the referenced display name
     if prim.GetPrim().GetName() != ref_mesh.GetPrim().GetName():
         usdex.core.blockDisplayName(prim.GetPrim())
-    set_transform(prim, geom, data.spec)
+    set_transform(prim, geom, data.get_spec_transforms())
     return UsdGeom.Mesh(prim)
 
 
@@ -112,38 +106,37 @@ def convert_plane(parent: Usd.Prim, name: str, geom: mujoco.MjsGeom, data: Conve
     if half_length == 0:
         half_length = UsdGeom.GetStageMetersPerUnit(parent.GetStage()) * 10
     plane: UsdGeom.Plane = usdex.core.definePlane(parent, name, half_width * 2, half_length * 2, UsdGeom.Tokens.z)
-    set_transform(plane, geom, data.spec)
+    set_transform(plane, geom, data.get_spec_transforms())
     return plane
 
 
 def get_model_geom_id(geom: mujoco.MjsGeom, data: ConversionData) -> int:
-    if geom.name:
-        return data.model.geom(geom.name).id
-
+    index = data.get_model_index()
     # If no geom name is specified, the target geom is searched for within the parent body.
-    parent_body = geom.parent
-    if not parent_body.name:
+    if not geom.name and not geom.parent.name:
         # MjsGeom.id is only assigned by compiling the spec in place, which the converter avoids.
         # A geom's position in the spec is the id the compiler assigns it, so report that instead.
-        geom_index = next((i for i, g in enumerate(data.spec.geoms) if g is geom), None)
-        Tf.Warn(f"Parent body name not found (geom id: {geom_index})")
+        Tf.Warn(f"Parent body name not found (geom id: {index.spec_index(geom)})")
         return None
 
-    for i in range(data.model.ngeom):
-        body_id = data.model.geom_bodyid[i]
-        body_name = data.model.body(body_id).name
-        if body_name == parent_body.name and data.model.geom(i).type[0] == geom.type:
-            return data.model.geom(i).id
-
-    return None
+    return index.geom_id(geom)
 
 
 def get_mesh_fitting(geom: mujoco.MjsGeom, data: ConversionData) -> tuple[Gf.Vec3d, Gf.Vec3d, Gf.Quatf]:
     if not hasattr(geom, "meshname") or not geom.meshname:
         return None, None, None
 
+    # fit from the decoded mesh where possible, which avoids compiling the model
+    inertia = data.mesh_inertias.get(geom.meshname)
+    if inertia is not None and np.isnan(geom.fromto[0]):
+        size, pos, quat = fit_primitive(geom, inertia, data.spec.compiler.fitaabb)
+        # a fit MuJoCo rejects is left to the compiler, which reports the error
+        if (size[: get_size_count(geom)] > 0).all():
+            pos, orient = data.get_spec_transforms().to_body(geom, convert_vec3d(pos), convert_quatd(quat))
+            return convert_vec3d(size), pos, orient
+
     try:
-        data.get_model()
+        data.get_model_index()
     except Exception as e:
         Tf.RaiseRuntimeError(f"Failed to compile model: {e}")
 
@@ -158,6 +151,45 @@ def get_mesh_fitting(geom: mujoco.MjsGeom, data: ConversionData) -> tuple[Gf.Vec
     return size, pos, orient
 
 
+def fit_primitive(geom: mujoco.MjsGeom, inertia: MeshInertia, fitaabb: bool) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fit a primitive geom to its mesh as the MuJoCo compiler does, returning its size and its pose in the geom frame."""
+    size = np.zeros(3)
+    if fitaabb:
+        half = inertia.aabb_size
+        pos = inertia.pos + rotate(inertia.quat, inertia.aabb_center)
+        if geom.type == mujoco.mjtGeom.mjGEOM_SPHERE:
+            size[0] = half.max()
+        elif geom.type == mujoco.mjtGeom.mjGEOM_CYLINDER:
+            size[:2] = max(half[0], half[1]), half[2]
+        elif geom.type == mujoco.mjtGeom.mjGEOM_CAPSULE:
+            radius = max(half[0], half[1])
+            size[:2] = radius, half[2] - radius
+        else:
+            size[:] = half
+    else:
+        box = inertia.inertia_box
+        pos = inertia.pos
+        if geom.type == mujoco.mjtGeom.mjGEOM_SPHERE:
+            size[0] = box.mean()
+        elif geom.type == mujoco.mjtGeom.mjGEOM_CYLINDER:
+            size[:2] = (box[0] + box[1]) / 2, box[2]
+        elif geom.type == mujoco.mjtGeom.mjGEOM_CAPSULE:
+            radius = (box[0] + box[1]) / 2
+            size[:2] = radius, max(0.0, box[2] - radius / 2)
+        else:
+            size[:] = box
+    return size * geom.fitscale, pos, inertia.quat
+
+
+def get_size_count(geom: mujoco.MjsGeom) -> int:
+    """The number of size parameters a primitive geom uses."""
+    if geom.type == mujoco.mjtGeom.mjGEOM_SPHERE:
+        return 1
+    elif geom.type in (mujoco.mjtGeom.mjGEOM_CYLINDER, mujoco.mjtGeom.mjGEOM_CAPSULE):
+        return 2
+    return 3
+
+
 def convert_sphere(parent: Usd.Prim, name: str, geom: mujoco.MjsGeom, data: ConversionData) -> UsdGeom.Sphere:
     size, pos, orient = get_mesh_fitting(geom, data)
     radius = size[0] if size else geom.size[0]
@@ -166,7 +198,7 @@ def convert_sphere(parent: Usd.Prim, name: str, geom: mujoco.MjsGeom, data: Conv
     if size:
         usdex.core.setLocalTransform(sphere.GetPrim(), pos, orient, Gf.Vec3f(1.0))
     else:
-        set_transform(sphere, geom, data.spec)
+        set_transform(sphere, geom, data.get_spec_transforms())
 
     return sphere
 
@@ -190,7 +222,7 @@ def convert_box(parent: Usd.Prim, name: str, geom: mujoco.MjsGeom, data: Convers
         # this is an extra scale to deform the cube into a prism
         scale_op = cube.AddScaleOp()
         scale_op.Set(Gf.Vec3f(width, length, height))
-        set_transform(cube, geom, data.spec)
+        set_transform(cube, geom, data.get_spec_transforms())
 
     return cube
 
@@ -213,7 +245,7 @@ def convert_cylinder(parent: Usd.Prim, name: str, geom: mujoco.MjsGeom, data: Co
     if size:
         usdex.core.setLocalTransform(cylinder.GetPrim(), pos, orient, Gf.Vec3f(1.0))
     else:
-        set_transform(cylinder, geom, data.spec)
+        set_transform(cylinder, geom, data.get_spec_transforms())
 
     return cylinder
 
@@ -236,7 +268,7 @@ def convert_capsule(parent: Usd.Prim, name: str, geom: mujoco.MjsGeom, data: Con
     if size:
         usdex.core.setLocalTransform(capsule.GetPrim(), pos, orient, Gf.Vec3f(1.0))
     else:
-        set_transform(capsule, geom, data.spec)
+        set_transform(capsule, geom, data.get_spec_transforms())
 
     return capsule
 
@@ -286,98 +318,92 @@ def apply_physics(geom_prim: Usd.Prim, geom: mujoco.MjsGeom, data: ConversionDat
     if geom.name:
         data.geom_targets[geom.name] = geom_prim.GetPath()
 
+    # the numeric fields of the geom are read from the snapshot of the spec rather than through the spec
+    fields = data.get_spec_snapshot().geom(geom)
+
     # exclude visual geom from physics; any mass they carry is baked onto the body instead
-    if geom.contype == 0 and geom.conaffinity == 0:
+    if fields.contype == 0 and fields.conaffinity == 0:
         is_collider = False
 
     if not is_collider:
         # this is a purely visual geom, so we skip physics authoring
         # but we still need to set the group attribute
-        geom_prim.ApplyAPI("MjcImageableAPI")
-        set_schema_attribute(geom_prim, "mjc:group", geom.group)
+        geom_override = PrimOverride(geom_prim.GetPath(), ["MjcImageableAPI"])
+        geom_override.set_attribute("mjc:group", fields.group)
+        data.add_override(Tokens.Geometry, geom_override)
         return
 
-    geom_over: Usd.Prim = data.content[Tokens.Physics].OverridePrim(geom_prim.GetPrim().GetPath())
-
-    UsdPhysics.CollisionAPI.Apply(geom_over)
-
-    geom_over.ApplyAPI("NewtonCollisionAPI")
-    geom_over.ApplyAPI("MjcCollisionAPI")
+    # the collider is queued to be authored straight into the physics layer, along with the other prims of the body
+    geom_over = PrimOverride(geom_prim.GetPath(), ["PhysicsCollisionAPI", "NewtonCollisionAPI", "MjcCollisionAPI"])
 
     # Set NewtonCollisionAPI attributes
-    set_schema_attribute(geom_over, "newton:contactMargin", geom.margin)
-    set_schema_attribute(geom_over, "newton:contactGap", geom.gap)
+    geom_over.set_attribute("newton:contactMargin", fields.margin)
+    geom_over.set_attribute("newton:contactGap", fields.gap)
 
     # Set all MjcCollisionAPI attributes
-    set_schema_attribute(geom_over, "mjc:condim", geom.condim)
-    set_schema_attribute(geom_over, "mjc:group", geom.group)
-    set_schema_attribute(geom_over, "mjc:priority", geom.priority)
-    set_schema_attribute(geom_over, "mjc:solimp", list(geom.solimp))
-    set_schema_attribute(geom_over, "mjc:solmix", geom.solmix)
+    geom_over.set_attribute("mjc:condim", fields.condim)
+    geom_over.set_attribute("mjc:group", fields.group)
+    geom_over.set_attribute("mjc:priority", fields.priority)
+    geom_over.set_attribute("mjc:solimp", fields.solimp)
+    geom_over.set_attribute("mjc:solmix", fields.solmix)
     # Always author mjc:solref since the conversion to ke/kd can be lossy
     # solref compatible runtimes should prefer mjc:solref on the shape
     # rather than falling through to material-level ke/kd.
-    geom_over.GetAttribute("mjc:solref").Set(list(geom.solref))
+    geom_over.set_attribute("mjc:solref", fields.solref, force=True)
 
-    if geom.type == mujoco.mjtGeom.mjGEOM_MESH:
-        mesh_collider: UsdPhysics.MeshCollisionAPI = UsdPhysics.MeshCollisionAPI.Apply(geom_over)
-        mesh_collider.CreateApproximationAttr().Set(UsdPhysics.Tokens.convexHull)
-        geom_over.ApplyAPI("NewtonMeshCollisionAPI")
+    if fields.type == mujoco.mjtGeom.mjGEOM_MESH:
+        geom_over.apply_schema("PhysicsMeshCollisionAPI")
+        geom_over.set_attribute("physics:approximation", UsdPhysics.Tokens.convexHull, force=True)
+        geom_over.apply_schema("NewtonMeshCollisionAPI")
         if inertia := get_inertia_token(geom, data):
-            geom_over.ApplyAPI("MjcMeshCollisionAPI")
-            set_schema_attribute(geom_over, "mjc:inertia", inertia)
+            geom_over.apply_schema("MjcMeshCollisionAPI")
+            geom_over.set_attribute("mjc:inertia", inertia)
             if inertia == "shell":
-                geom_over.ApplyAPI("NewtonMassAPI")
-                set_schema_attribute(geom_over, "newton:massModel", "shell")
+                geom_over.apply_schema("NewtonMassAPI")
+                geom_over.set_attribute("newton:massModel", "shell")
         if maxhullvert := get_maxhullvert(geom, data):
-            set_schema_attribute(geom_over, "newton:maxHullVertices", maxhullvert)
+            geom_over.set_attribute("newton:maxHullVertices", maxhullvert)
     else:
-        set_schema_attribute(geom_over, "mjc:shellinertia", bool(geom.typeinertia == mujoco.mjtGeomInertia.mjINERTIA_SHELL))
-        if geom.typeinertia == mujoco.mjtGeomInertia.mjINERTIA_SHELL:
-            geom_over.ApplyAPI("NewtonMassAPI")
-            set_schema_attribute(geom_over, "newton:massModel", "shell")
-
-    if not np.isnan(geom.mass):
-        geom_mass: UsdPhysics.MassAPI = UsdPhysics.MassAPI.Apply(geom_over)
-        geom_mass.CreateMassAttr().Set(geom.mass)
-    elif geom.density > 0.0:
+        geom_over.set_attribute("mjc:shellinertia", bool(fields.typeinertia == mujoco.mjtGeomInertia.mjINERTIA_SHELL))
+        if fields.typeinertia == mujoco.mjtGeomInertia.mjINERTIA_SHELL:
+            geom_over.apply_schema("NewtonMassAPI")
+            geom_over.set_attribute("newton:massModel", "shell")
+
+    if not np.isnan(fields.mass):
+        geom_over.apply_schema("PhysicsMassAPI")
+        geom_over.set_attribute("physics:mass", fields.mass, force=True)
+    elif fields.density > 0.0:
         # Only author density when mass is unspecified. Per MJCF docs:
         # "If [mass] is specified, the density attribute is ignored."
         # When mass IS specified, MuJoCo back-computes density from mass,
         # so geom.density is non-zero but not an independent opinion.
-        geom_mass: UsdPhysics.MassAPI = UsdPhysics.MassAPI.Apply(geom_over)
-        geom_mass.CreateDensityAttr().Set(geom.density)
+        geom_over.apply_schema("PhysicsMassAPI")
+        geom_over.set_attribute("physics:density", fields.density, force=True)
 
-    physics_material: UsdPhysics.MaterialAPI = acquire_physics_material(geom, data)
+    physics_material: UsdPhysics.MaterialAPI = acquire_physics_material(fields, data)
     if physics_material:
-        usdex.core.bindPhysicsMaterial(geom_over, physics_material)
+        geom_over.apply_schema("MaterialBindingAPI")
+        geom_over.set_target("material:binding:physics", physics_material.GetPath())
 
-    # FUTURE: collision filtering
+    data.add_override(Tokens.Physics, geom_over)
 
+    # FUTURE: collision filtering
 
-def acquire_physics_material(geom: mujoco.MjsGeom, data: ConversionData) -> UsdShade.Material:
-    sliding_friction = geom.friction[0]
-    torsional_friction = geom.friction[1]
-    rolling_friction = geom.friction[2]
-    ke, kd = solref_to_stiffness_damping(geom.solref)
-    material_hash = (sliding_friction, torsional_friction, rolling_friction, ke, kd)
 
-    # check for an existing physics material with the same values
-    physics_scope = data.content[Tokens.Physics].GetDefaultPrim().GetChild(Tokens.Physics)
-    for child in physics_scope.GetChildren():
-        if child.HasAPI(UsdPhysics.MaterialAPI):
-            physics_material: UsdPhysics.MaterialAPI = UsdPhysics.MaterialAPI(child.GetPrim())
-            if _material_hash_close(material_hash, hash_physics_material(physics_material)):
-                return UsdShade.Material(physics_material)
+def acquire_physics_material(fields: tuple, data: ConversionData) -> UsdShade.Material:
+    """Find or create the physics material of a geom, from its fields in the spec snapshot."""
+    values = (*fields.friction, fields.stiffness, fields.damping)
 
-    return create_physics_material(physics_scope, geom, data)
+    # reuse an existing physics material with the same authored values
+    key = tuple(fields.material_key)
+    if (material := data.physics_materials.get(key)) is None:
+        physics_scope = data.content[Tokens.Physics].GetDefaultPrim().GetChild(Tokens.Physics)
+        material = data.physics_materials[key] = create_physics_material(physics_scope, values, data)
+    return material
 
 
-def create_physics_material(physics_materials: Usd.Prim, geom: mujoco.MjsGeom, data: ConversionData) -> UsdShade.Material:
-    sliding_friction = geom.friction[0]
-    torsional_friction = geom.friction[1]
-    rolling_friction = geom.friction[2]
-    ke, kd = solref_to_stiffness_damping(geom.solref)
+def create_physics_material(physics_materials: Usd.Prim, values: tuple[float, ...], data: ConversionData) -> UsdShade.Material:
+    sliding_friction, torsional_friction, rolling_friction, ke, kd = values
 
     name = data.name_cache.getPrimName(physics_materials, "PhysicsMaterial")
     # MuJoCo has a single sliding friction coefficient, applied whether a contact is stuck or
@@ -399,25 +425,11 @@ def create_physics_material(physics_materials: Usd.Prim, geom: mujoco.MjsGeom, d
     return material
 
 
-def hash_physics_material(material: UsdPhysics.MaterialAPI) -> tuple[float, ...]:
-    sliding_friction = material.GetDynamicFrictionAttr().Get()
-    torsional_friction = material.GetPrim().GetAttribute("newton:torsionalFriction").Get()
-    rolling_friction = material.GetPrim().GetAttribute("newton:rollingFriction").Get()
-    ke = material.GetPrim().GetAttribute("newton:contactStiffness").Get()
-    kd = material.GetPrim().GetAttribute("newton:contactDamping").Get()
-    return (sliding_friction, torsional_friction, rolling_friction, ke, kd)
-
-
-def _material_hash_close(a: tuple[float, ...], b: tuple[float, ...], tol: float = 1e-6) -> bool:
-    return len(a) == len(b) and all(x == y or abs(x - y) < tol for x, y in zip(a, b))
-
-
 def get_inertia_token(geom: mujoco.MjsGeom, data: ConversionData) -> str:
     if geom.type != mujoco.mjtGeom.mjGEOM_MESH or not geom.meshname:
         return None
 
-    # Find the mesh by name
-    mesh = data.spec.mesh(geom.meshname)
+    mesh = data.get_spec_mesh(geom.meshname)
     if not mesh:
         return None
 
@@ -436,8 +448,7 @@ def get_maxhullvert(geom: mujoco.MjsGeom, data: ConversionData) -> int:
     if geom.type != mujoco.mjtGeom.mjGEOM_MESH or not geom.meshname:
         return None
 
-    # Find the mesh by name
-    mesh = data.spec.mesh(geom.meshname)
+    mesh = data.get_spec_mesh(geom.meshname)
     if not mesh:
         return None
 
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import mujoco
+
+__all__ = ["ModelIndex"]
+
+
+class ModelIndex:
+    """
+    Constant time lookups from spec elements to the ids of their compiled counterparts.
+
+    The index is built once per conversion, from the spec being converted and the model compiled
+    from a copy of it. Spec elements cannot be matched to the model through ``id``, which is -1
+    until a spec is compiled in place, so they are matched either by their position in the spec
+    or by name, whichever the element type allows.
+    """
+
+    def __init__(self, spec: mujoco.MjSpec, model: mujoco.MjModel):
+        self.model = model
+        # The element wrappers hash by identity, and holding them here keeps that identity stable
+        # for the lifetime of the index, as the bindings return the live wrapper of an element.
+        self.__positions: dict[object, int] = {}
+        for elements in (spec.bodies, spec.geoms, spec.meshes, spec.sites, spec.joints):
+            self.__positions.update((element, i) for i, element in enumerate(elements))
+        self.__names: dict[mujoco.mjtObj, dict[str, int]] = {}
+        self.__geoms_by_body_and_type: dict[tuple[str, int], int] | None = None
+
+    def spec_index(self, element) -> int | None:
+        """Return the position of a body, geom, mesh, site or joint within its spec, or ``None`` if it is not part of the spec."""
+        return self.__positions.get(element)
+
+    def body_id(self, body: mujoco.MjsBody) -> int | None:
+        """Return the compiled id of a spec body, or ``None`` if it cannot be located.
+
+        The match is positional: ``MjSpec.bodies`` is the body tree flattened depth-first, which is
+        the order the compiler assigns ids in. Composition happens before compilation and preserves
+        that agreement -- ``attach`` splices the attached subtree into both orderings at the same
+        point, and ``replicate`` expands into the spec as named clones.
+
+        Name is not a usable key here: a body name is optional, so every unnamed body shares the
+        empty name. Nor is ``MjsBody.id``, which is -1 until the spec itself is compiled, and the
+        converter compiles a copy to leave the spec being converted untouched.
+        """
+        index = self.spec_index(body)
+        if index is None or index >= self.model.nbody:
+            return None
+        return index
+
+    def mesh_id(self, mesh: mujoco.MjsMesh) -> int | None:
+        """Return the compiled id of a spec mesh, or ``None`` if it cannot be located."""
+        index = self.spec_index(mesh)
+        if index is None or index >= self.model.nmesh:
+            return None
+        return index
+
+    def geom_id(self, geom: mujoco.MjsGeom) -> int | None:
+        """Return the compiled id of a spec geom, or ``None`` if it cannot be located.
+
+        Named geoms are matched by name. An unnamed geom is matched to the first compiled geom of
+        the same type within a body of the same name as its parent, so its parent must be named.
+        """
+        if geom.name:
+            return self.name_id(mujoco.mjtObj.mjOBJ_GEOM, geom.name)
+
+        if self.__geoms_by_body_and_type is None:
+            body_names = self.__get_names(mujoco.mjtObj.mjOBJ_BODY, self.model.nbody)
+            geoms = {}
+            for i, (body_id, geom_type) in enumerate(zip(self.model.geom_bodyid.tolist(), self.model.geom_type.tolist())):
+                geoms.setdefault((body_names[body_id], geom_type), i)
+            self.__geoms_by_body_and_type = geoms
+        return self.__geoms_by_body_and_type.get((geom.parent.name, int(geom.type)))
+
+    def name_id(self, obj_type: mujoco.mjtObj, name: str) -> int | None:
+        """Return the compiled id of the element of type ``obj_type`` named ``name``, or ``None`` if there is no such element."""
+        if obj_type not in self.__names:
+            count = {
+                mujoco.mjtObj.mjOBJ_BODY: self.model.nbody,
+                mujoco.mjtObj.mjOBJ_GEOM: self.model.ngeom,
+                mujoco.mjtObj.mjOBJ_MESH: self.model.nmesh,
+                mujoco.mjtObj.mjOBJ_SITE: self.model.nsite,
+                mujoco.mjtObj.mjOBJ_JOINT: self.model.njnt,
+            }[obj_type]
+            # names are unique per element type, except for the empty name of unnamed elements
+            self.__names[obj_type] = {element_name: i for i, element_name in enumerate(self.__get_names(obj_type, count)) if element_name}
+        return self.__names[obj_type].get(name)
+
+    def __get_names(self, obj_type: mujoco.mjtObj, count: int) -> list[str]:
+        return [mujoco.mj_id2name(self.model, obj_type, i) or "" for i in range(count)]
@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+from dataclasses import dataclass
+
+import mujoco
+import numpy as np
+
+__all__ = ["BodyInertia", "MeshInertia", "compute_mesh_inertia", "triangulate"]
+
+
+@dataclass(frozen=True)
+class MeshInertia:
+    """The inertial frame of a mesh and the bounds primitives are fitted to, as the MuJoCo compiler computes them.
+
+    All values are in the frame of the mesh geom, i.e. after the mesh ``scale``, ``refpos`` and
+    ``refquat`` have been applied to the vertices.
+    """
+
+    pos: np.ndarray
+    """The centre of mass of the mesh."""
+    quat: np.ndarray
+    """The principal axes of inertia of the mesh, ordered by decreasing moment, as a (w, x, y, z) quaternion."""
+    inertia_box: np.ndarray
+    """The half sizes of the box with the same inertia as the mesh, along its principal axes."""
+    aabb_center: np.ndarray
+    """The centre of the bounding box of the vertices, expressed in the principal axes."""
+    aabb_size: np.ndarray
+    """The half sizes of the bounding box of the vertices, expressed in the principal axes."""
+
+
+@dataclass(frozen=True)
+class BodyInertia:
+    """The mass and inertial frame of a body, as read from the compiled model."""
+
+    mass: float
+    pos: np.ndarray
+    """The centre of mass of the body, in the body frame."""
+    quat: np.ndarray
+    """The principal axes of inertia of the body, as a (w, x, y, z) quaternion."""
+    inertia: np.ndarray
+    """The diagonal inertia of the body, along its principal axes."""
+
+
+def triangulate(face_vertex_counts: np.ndarray, face_vertex_indices: np.ndarray) -> np.ndarray:
+    """Fan triangulate polygonal faces, returning an array of shape (N, 3) of vertex indices."""
+    counts = np.asarray(face_vertex_counts, dtype=np.int64)
+    indices = np.asarray(face_vertex_indices, dtype=np.int64)
+    starts = np.cumsum(counts) - counts
+    triangle_counts = np.maximum(counts - 2, 0)
+    first = np.repeat(starts, triangle_counts)
+    # the offset of each triangle within its face, starting at 1 for the first triangle
+    offsets = np.arange(len(first)) - np.repeat(np.cumsum(triangle_counts) - triangle_counts, triangle_counts) + 1
+    return np.column_stack((indices[first], indices[first + offsets], indices[first + offsets + 1]))
+
+
+def compute_mesh_inertia(mesh: mujoco.MjsMesh, points: np.ndarray, triangles: np.ndarray) -> MeshInertia | None:
+    """
+    Compute the inertial frame of a mesh with vectorized NumPy, following the MuJoCo compiler.
+
+    This gives the same result as compiling the model, for every mesh inertia type except
+    ``convex``, which is computed from a convex hull of the mesh.
+
+    Args:
+        mesh: The spec mesh, which provides the vertex transform and the inertia type.
+        points: All vertices of the mesh as read from its source, including any which no face references.
+        triangles: The vertex indices of each triangle, of shape (N, 3).
+
+    Returns:
+        The inertial frame, or ``None`` if it cannot be computed without compiling the model
+        (a convex hull is required, or the mesh has too little volume, which fails to compile).
+    """
+    if mesh.inertia == mujoco.mjtMeshInertia.mjMESH_INERTIA_CONVEX or not len(triangles):
+        return None
+
+    vertices = np.asarray(points, dtype=np.float64) - np.asarray(mesh.refpos, dtype=np.float64)
+    vertices = rotate(conjugate(np.asarray(mesh.refquat, dtype=np.float64)), vertices) * np.asarray(mesh.scale, dtype=np.float64)
+    corners = vertices[triangles]
+    areas = np.linalg.norm(np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), axis=1) / 2
+    centers = corners.mean(axis=1)
+    if areas.sum() < mujoco.mjMINVAL:
+        return None
+
+    if mesh.inertia == mujoco.mjtMeshInertia.mjMESH_INERTIA_SHELL:
+        measure = areas.sum()
+        com = (areas[:, None] * centers).sum(axis=0) / measure
+        covariance = second_moments(corners - com, areas, divisor=12)
+    else:
+        # the volume is decomposed into tetrahedra formed by each triangle and an interior point
+        # legacy inertia takes the absolute volume of each tetrahedron, so its result depends on that point
+        absolute = mesh.inertia == mujoco.mjtMeshInertia.mjMESH_INERTIA_LEGACY
+        center = (areas[:, None] * centers).sum(axis=0) / areas.sum()
+        volumes = tetrahedron_volumes(corners - center, absolute)
+        measure = volumes.sum()
+        if measure < mujoco.mjMINVAL:
+            return None
+        com = center + (volumes[:, None] * (corners - center).sum(axis=1)).sum(axis=0) / (4 * measure)
+        volumes = tetrahedron_volumes(corners - com, absolute)
+        measure = volumes.sum()
+        covariance = second_moments(corners - com, volumes, divisor=20)
+
+    inertia = np.trace(covariance) * np.eye(3) - covariance
+    moments = np.zeros(3)
+    quat = np.zeros(4)
+    # use the compiler's own decomposition, so the principal axes have the same order and handedness
+    mujoco.mju_eig3(moments, np.zeros(9), quat, inertia.reshape(-1))
+    inertia_box = np.sqrt(np.maximum(3 * (moments.sum() - 2 * moments) / (2 * measure), 0))
+
+    # the bounding box includes every vertex, as MuJoCo does
+    local = rotate(conjugate(quat), vertices - com)
+    lower, upper = local.min(axis=0), local.max(axis=0)
+    return MeshInertia(pos=com, quat=quat, inertia_box=inertia_box, aabb_center=(upper + lower) / 2, aabb_size=(upper - lower) / 2)
+
+
+def tetrahedron_volumes(corners: np.ndarray, absolute: bool) -> np.ndarray:
+    """The signed (or absolute) volumes of the tetrahedra formed by each triangle and the origin."""
+    volumes = np.einsum("ij,ij->i", corners[:, 0], np.cross(corners[:, 1], corners[:, 2])) / 6
+    return np.abs(volumes) if absolute else volumes
+
+
+def second_moments(corners: np.ndarray, weights: np.ndarray, divisor: int) -> np.ndarray:
+    """
+    The second moment of a set of triangles (``divisor=12``) or of the tetrahedra they form with the origin (``divisor=20``).
+
+    Each element contributes ``weight / divisor * (sum(v v^T) + s s^T)``, where ``v`` are its
+    vertices and ``s`` is their sum, which integrates ``x x^T`` over its area or volume.
+    """
+    sums = corners.sum(axis=1)
+    outer = np.einsum("ijk,ijl->kl", corners * weights[:, None, None], corners) + np.einsum("ik,il->kl", sums * weights[:, None], sums)
+    return outer / divisor
+
+
+def rotate(quat: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """Rotate an array of vectors by a (w, x, y, z) quaternion."""
+    matrix = np.zeros(9)
+    mujoco.mju_quat2Mat(matrix, quat / np.linalg.norm(quat))
+    return vectors @ matrix.reshape(3, 3).T
+
+
+def conjugate(quat: np.ndarray) -> np.ndarray:
+    return quat * np.array([1.0, -1.0, -1.0, -1.0])
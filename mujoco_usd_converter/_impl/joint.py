@@ -49,8 +49,12 @@ def convert_joints(parent: Usd.Prim, body: mujoco.MjsBody, data: ConversionData)
     safe_names = data.name_cache.getPrimNames(parent, source_names)
     for joint, source_name, safe_name in zip(body.joints, source_names, safe_names):
         limits = get_limits(joint, data)
-        axis = convert_vec3f(joint.axis)
-        frame = usdex.core.JointFrame(usdex.core.JointFrame.Space.Body1, convert_vec3d(joint.pos), Gf.Quatd.GetIdentity())
+        pos, axis = convert_vec3d(joint.pos), convert_vec3f(joint.axis)
+        # joints within a frame are placed relative to the frame rather than the body
+        if (frame_transform := data.get_spec_transforms().get_frame_transform(joint)) is not None:
+            matrix = frame_transform.GetMatrix()
+            pos, axis = matrix.Transform(pos), Gf.Vec3f(matrix.TransformDir(Gf.Vec3d(axis)))
+        frame = usdex.core.JointFrame(usdex.core.JointFrame.Space.Body1, pos, Gf.Quatd.GetIdentity())
         if joint.type == mujoco.mjtJoint.mjJNT_HINGE:
             joint_prim = usdex.core.definePhysicsRevoluteJoint(parent, safe_name, body0, body1, frame, axis, limits[0], limits[1])
         elif joint.type == mujoco.mjtJoint.mjJNT_SLIDE:
@@ -67,35 +71,37 @@ def convert_joints(parent: Usd.Prim, body: mujoco.MjsBody, data: ConversionData)
 
         data.references[Tokens.PhysicsJoints][joint.name] = joint_prim.GetPrim()
 
-        apply_mjc_joint_api(joint_prim.GetPrim(), joint)
+        apply_mjc_joint_api(joint_prim.GetPrim(), data.get_spec_snapshot().joint(joint))
 
 
-def apply_mjc_joint_api(prim: Usd.Prim, joint: mujoco.MjsJoint):
+def apply_mjc_joint_api(prim: Usd.Prim, fields: tuple):
+    """Apply the MjcJointAPI and NewtonJointAPI to a joint prim, from the fields of the joint in the spec snapshot."""
     prim.ApplyAPI("MjcJointAPI")
     prim.ApplyAPI("NewtonJointAPI")
 
-    limited_token = mj_limited_to_token(joint.actfrclimited)
+    limited_token = mj_limited_to_token(fields.actfrclimited)
     set_schema_attribute(prim, "mjc:actuatorfrclimited", limited_token)
-    set_schema_attribute(prim, "mjc:actuatorfrcrange:min", joint.actfrcrange[0])
-    set_schema_attribute(prim, "mjc:actuatorfrcrange:max", joint.actfrcrange[1])
-    set_schema_attribute(prim, "mjc:actuatorgravcomp", bool(joint.actgravcomp))
-    set_schema_attribute(prim, "mjc:armature", joint.armature)
-    set_schema_attribute(prim, "mjc:damping", joint.damping[0])
-    set_schema_attribute(prim, "mjc:frictionloss", joint.frictionloss)
-    set_schema_attribute(prim, "mjc:group", joint.group)
-    set_schema_attribute(prim, "mjc:margin", joint.margin)
-    set_schema_attribute(prim, "mjc:ref", joint.ref)
-    set_schema_attribute(prim, "mjc:solimpfriction", list(joint.solimp_friction))
-    set_schema_attribute(prim, "mjc:solimplimit", list(joint.solimp_limit))
-    set_schema_attribute(prim, "mjc:solreffriction", list(joint.solref_friction))
-    set_schema_attribute(prim, "mjc:solreflimit", list(joint.solref_limit))
-    set_schema_attribute(prim, "mjc:springdamper", list(joint.springdamper))
-    set_schema_attribute(prim, "mjc:springref", joint.springref)
-    set_schema_attribute(prim, "mjc:stiffness", joint.stiffness[0])
-
-    set_schema_attribute(prim, "newton:armature", joint.armature)
-    set_schema_attribute(prim, "newton:damping", to_newton_angular_gain(joint, joint.damping[0]))
-    set_schema_attribute(prim, "newton:friction", joint.frictionloss)
+    set_schema_attribute(prim, "mjc:actuatorfrcrange:min", fields.actfrcrange[0])
+    set_schema_attribute(prim, "mjc:actuatorfrcrange:max", fields.actfrcrange[1])
+    set_schema_attribute(prim, "mjc:actuatorgravcomp", fields.actgravcomp)
+    set_schema_attribute(prim, "mjc:armature", fields.armature)
+    set_schema_attribute(prim, "mjc:damping", fields.damping[0])
+    set_schema_attribute(prim, "mjc:frictionloss", fields.frictionloss)
+    set_schema_attribute(prim, "mjc:group", fields.group)
+    set_schema_attribute(prim, "mjc:margin", fields.margin)
+    set_schema_attribute(prim, "mjc:ref", fields.ref)
+    set_schema_attribute(prim, "mjc:solimpfriction", fields.solimp_friction)
+    set_schema_attribute(prim, "mjc:solimplimit", fields.solimp_limit)
+    set_schema_attribute(prim, "mjc:solreffriction", fields.solref_friction)
+    set_schema_attribute(prim, "mjc:solreflimit", fields.solref_limit)
+    set_schema_attribute(prim, "mjc:springdamper", fields.springdamper)
+    set_schema_attribute(prim, "mjc:springref", fields.springref)
+    set_schema_attribute(prim, "mjc:stiffness", fields.stiffness[0])
+
+    set_schema_attribute(prim, "newton:armature", fields.armature)
+    # the damping is converted to the per-degree convention of NewtonJointAPI for angular joints
+    set_schema_attribute(prim, "newton:damping", fields.newton_damping)
+    set_schema_attribute(prim, "newton:friction", fields.frictionloss)
     # newton:limitStiffness and newton:limitDamping are deliberately left unauthored.
     # MJCF describes joint limits only through solreflimit, which is in MuJoCo's
     # normalized constraint space, while NewtonJointAPI defines those gains as effort per
@@ -105,17 +111,6 @@ def apply_mjc_joint_api(prim: Usd.Prim, joint: mujoco.MjsJoint):
     # authoritative for SolverMuJoCo. See newton-physics/newton#3762.
 
 
-def to_newton_angular_gain(joint: mujoco.MjsJoint, value: float) -> float:
-    """Convert a MuJoCo per-radian gain to the per-degree convention used by NewtonJointAPI.
-
-    MuJoCo authors angular gains per radian, while the NewtonJointAPI attributes are per
-    degree. Linear DOFs are unaffected.
-    """
-    if joint.type in (mujoco.mjtJoint.mjJNT_HINGE, mujoco.mjtJoint.mjJNT_BALL):
-        return value * (np.pi / 180.0)
-    return value
-
-
 def is_limited(joint: mujoco.MjsJoint, data: ConversionData) -> bool:
     if joint.limited == mujoco.mjtLimited.mjLIMITED_TRUE:
         return True
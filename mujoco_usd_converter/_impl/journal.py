@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import json
+import os
+import pathlib
+from collections.abc import Callable, Iterator
+from dataclasses import asdict
+
+import mujoco
+from pxr import Tf
+
+from .._version import __version__
+from .batch import BatchResult, convert_batch, convert_model
+from .cache import FileHashes, hash_file, hash_key
+from .convert import Converter
+from .model import get_model_cache_key
+
+__all__ = ["BatchJournal", "get_input_hash", "resume_batch"]
+
+# Bump whenever the meaning of a journal entry changes, so entries written by an older version are not trusted
+JOURNAL_VERSION = "1"
+
+# the parameters which only affect how a model is converted, not the asset it is converted to
+JOURNAL_IGNORED_PARAMS = ("jobs", "cache_dir", "cache_max_bytes", "compile_in_background")
+
+
+def get_input_hash(input_file: pathlib.Path, params: Converter.Params, hasher: Callable[[pathlib.Path], str] = hash_file) -> str | None:
+    """
+    Hash everything the asset converted from a model depends on, or return ``None`` if the model cannot be read.
+
+    The hash covers the MJCF file, the files it includes, the asset files it references, the
+    versions of MuJoCo and of the converter, and the parameters of the conversion.
+    """
+    try:
+        spec = mujoco.MjSpec.from_file(input_file.absolute().as_posix())
+    except ValueError:
+        return None
+    if (model_key := get_model_cache_key(spec, input_file.absolute(), hasher)) is None:
+        return None
+    settings = {name: value for name, value in asdict(params).items() if name not in JOURNAL_IGNORED_PARAMS}
+    return hash_key(JOURNAL_VERSION, __version__, json.dumps(settings, sort_keys=True), model_key)
+
+
+class BatchJournal:
+    """
+    An append-only record of the models converted by a batch, so that an interrupted batch can resume.
+
+    Each finished model appends one line of JSON, with the hash of its inputs, its status, its
+    output and its timings. Lines are flushed to disk as they are written, so a crash or a
+    preempted host loses at most the line being written, which is ignored when the journal is read
+    back. When a model appears several times, its most recent entry wins.
+
+    A model is complete when its most recent entry converted the same inputs into the same output
+    directory, and the asset it produced still exists.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        if path.exists():
+            with path.open("r", encoding="utf-8") as f:
+                for number, line in enumerate(f, start=1):
+                    if (entry := _parse_entry(line)) is None:
+                        Tf.Warn(f"Ignoring invalid entry on line {number} of the batch journal {path}")
+                    else:
+                        self.entries[entry["input"]] = entry
+
+    def get_converted(self, input_file: pathlib.Path, output_dir: pathlib.Path) -> dict | None:
+        """
+        The most recent entry of a model, if it converted the model into ``output_dir`` and its asset still exists.
+
+        The model is only complete if the ``"hash"`` of the entry also matches its current inputs.
+        """
+        entry = self.entries.get(input_file.absolute().as_posix())
+        if (
+            entry is not None
+            and entry.get("status") == "converted"
+            and entry.get("hash") is not None
+            and entry.get("output") == output_dir.absolute().as_posix()
+            and entry.get("asset") is not None
+            and pathlib.Path(entry["asset"]).is_file()
+        ):
+            return entry
+        return None
+
+    def record(self, result: BatchResult) -> None:
+        """Append the result of converting a model, and flush it to disk before returning."""
+        entry = {
+            "input": pathlib.Path(result.input).absolute().as_posix(),
+            "hash": result.input_hash,
+            "output": pathlib.Path(result.output).absolute().as_posix(),
+            "status": result.status,
+            "asset": pathlib.Path(result.asset).absolute().as_posix() if result.asset else None,
+            "error": result.error,
+            "seconds": result.seconds,
+            "timings": result.timings,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a+b") as f:
+            # a crash may have left a partial line, which must not swallow the start of this entry
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(json.dumps(entry).encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.entries[entry["input"]] = entry
+
+
+def _parse_entry(line: str) -> dict | None:
+    # a crash while appending leaves a partial line, which is not valid JSON
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) and isinstance(entry.get("input"), str) else None
+
+
+class _ResumeModel:
+    """Convert a model in a batch worker, unless the journal entry it was given records it as converted from the same inputs."""
+
+    def __init__(self, params: Converter.Params):
+        self.params = params
+        # procedurally generated variants of a model share their asset files, which are only hashed once per worker
+        self.hasher = FileHashes()
+
+    def __call__(self, converter: Converter, input_file: pathlib.Path, output_dir: pathlib.Path, entry: dict | None) -> BatchResult:
+        # the inputs are hashed before they are converted, so an input modified during the conversion is not trusted later
+        input_hash = get_input_hash(input_file, self.params, self.hasher)
+        if entry is not None and entry["hash"] == input_hash:
+            result = BatchResult(input=input_file.as_posix(), output=output_dir.as_posix(), status="skipped", asset=entry["asset"])
+        else:
+            result = convert_model(converter, input_file, output_dir)
+        result.input_hash = input_hash
+        return result
+
+
+def resume_batch(
+    models: list[tuple[pathlib.Path, pathlib.Path]],
+    journal: BatchJournal,
+    params: Converter.Params,
+    jobs: int = 1,
+    timeout: float | None = None,
+) -> Iterator[BatchResult]:
+    """
+    Convert a batch of models as :func:`convert_batch` does, skipping the models the journal records as complete.
+
+    A skipped model yields a result with the ``"skipped"`` status and the asset converted
+    previously. Every other model is converted, and its result is recorded in the journal before it
+    is yielded, so the journal never claims a model is complete before its asset has been written.
+    Models which failed, timed out or were never reached are converted again, over whatever output
+    a previous attempt left behind.
+
+    The inputs of each model are hashed by the worker it is dispatched to, so the batch starts
+    converting without first hashing every model, and the time spent hashing counts towards the
+    ``timeout`` of the model.
+    """
+    tasks = [(input_file, output_dir, journal.get_converted(input_file, output_dir)) for input_file, output_dir in models]
+    for result in convert_batch(tasks, params, jobs=jobs, timeout=timeout, convert=_ResumeModel(params)):
+        if result.status != "skipped":
+            journal.record(result)
+        yield result
@@ -1,7 +1,6 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025-2026 The Newton Developers
 # SPDX-License-Identifier: Apache-2.0
 import pathlib
-import shutil
 
 import mujoco
 import usdex.core
@@ -14,23 +13,27 @@ __all__ = ["convert_materials"]
 
 
 def convert_materials(data: ConversionData):
-    if not len(data.spec.materials):
+    materials = list(data.spec.materials)
+    if data.prune_unused_assets:
+        bound = {x.material for x in (*data.spec.geoms, *data.spec.sites) if x.material}
+        materials = [material for material in materials if material.name in bound]
+    if not materials:
         return
 
     data.libraries[Tokens.Materials] = usdex.core.addAssetLibrary(data.content[Tokens.Contents], Tokens.Materials, format="usdc")
     data.references[Tokens.Materials] = {}
 
     materials_scope = data.libraries[Tokens.Materials].GetDefaultPrim()
-    source_names = [x.name for x in data.spec.materials]
+    source_names = [x.name for x in materials]
     safe_names = data.name_cache.getPrimNames(materials_scope, source_names)
-    for material, source_name, safe_name in zip(data.spec.materials, source_names, safe_names):
+    for material, source_name, safe_name in zip(materials, source_names, safe_names):
         material_prim = convert_material(materials_scope, safe_name, material, data).GetPrim()
         data.references[Tokens.Materials][source_name] = material_prim
         # FUTURE: specialize from class
         if source_name != safe_name:
             usdex.core.setDisplayName(material_prim, source_name)
 
-    usdex.core.saveStage(data.libraries[Tokens.Materials], comment=f"Material Library for {data.spec.modelname}. {data.comment}")
+    data.writer.save_stage(data.libraries[Tokens.Materials], f"Material Library for {data.spec.modelname}. {data.comment}")
 
     # setup a content layer for referenced materials
     data.content[Tokens.Materials] = usdex.core.addAssetContent(data.content[Tokens.Contents], Tokens.Materials, format="usda")
@@ -113,8 +116,7 @@ def convert_2d_texture(texture: mujoco.MjsTexture, data: ConversionData) -> Sdf.
     if not local_texture_dir.exists():
         local_texture_dir.mkdir(parents=True)
     local_texture_path = local_texture_dir / texture_path.name
-    shutil.copyfile(texture_path, local_texture_path)
-    Tf.Status(f"Copied texture {texture_path} to {local_texture_path}")
+    data.writer.copy_file(texture_path, local_texture_path)
 
     relative_texture_path = local_texture_path.relative_to(pathlib.Path(data.libraries[Tokens.Materials].GetRootLayer().identifier).parent)
     return Sdf.AssetPath(f"./{relative_texture_path.as_posix()}")
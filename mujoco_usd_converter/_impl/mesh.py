@@ -1,40 +1,129 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025-2026 The Newton Developers
 # SPDX-License-Identifier: Apache-2.0
+import json
+import multiprocessing
 import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
 
 import mujoco
 import numpy as np
 import stl
 import tinyobjloader
 import usdex.core
-from pxr import Tf, Usd, UsdGeom, Vt
+from pxr import Gf, Tf, Usd, UsdGeom, Vt
 
+from .cache import DiskCache, hash_file, hash_key
 from .data import ConversionData, Tokens
-from .numpy import convert_vec3f_array
+from .geom import FITTED_GEOM_TYPES
+from .inertia import MeshInertia, compute_mesh_inertia, triangulate
 from .utils import set_transform
 
 __all__ = ["convert_meshes"]
 
+# Bump whenever a change to decoding alters the buffers it produces, so stale cache entries are not reused
+MESH_CACHE_VERSION = "3"
+
+# The subset family which partitions a mesh merged from several OBJ shapes
+OBJ_SHAPE_FAMILY = "shape"
+
+# A binary STL is an 80 byte header, a uint32 triangle count, and a packed 50 byte record per triangle
+STL_HEADER_BYTES = 80
+STL_TRIANGLE_DTYPE = np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attributes", "<u2")])
+
+
+@dataclass
+class MeshBuffers:
+    """Decoded mesh data, indexed and ready to be authored as a ``UsdGeom.Mesh``.
+
+    Decoding is kept free of USD so it can run in a worker process. Diagnostics raised while
+    decoding are carried in ``warnings`` and reported when the mesh is authored.
+    """
+
+    face_vertex_counts: np.ndarray
+    face_vertex_indices: np.ndarray
+    points: np.ndarray
+    normals: np.ndarray | None = None
+    normal_indices: np.ndarray | None = None
+    normals_interpolation: str = UsdGeom.Tokens.faceVarying
+    uvs: np.ndarray | None = None
+    uv_indices: np.ndarray | None = None
+    subset_names: list[str] | None = None
+    subset_face_counts: np.ndarray | None = None
+    # vertices of the source which no face references, which are not authored but still bound the mesh in MuJoCo
+    unreferenced_points: np.ndarray | None = None
+    warnings: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class DecodeOptions:
+    """Settings which change the buffers decoded from a mesh file, and so form part of its cache key."""
+
+    weld_tolerance: float = 0.0
+    merge_obj_shapes: bool = False
+
 
 def convert_meshes(data: ConversionData):
-    if not len(data.spec.meshes):
+    # primitives fitted to a mesh need its inertia, which is computed from the decoded mesh
+    fitted = {geom.meshname for geom in data.spec.geoms if geom.type in FITTED_GEOM_TYPES and geom.meshname}
+    meshes = list(data.spec.meshes)
+    authored = meshes
+    if data.prune_unused_assets:
+        # fitted primitives only need the mesh inertia, so only mesh geoms need a library mesh
+        referenced = {geom.meshname for geom in data.spec.geoms if geom.type == mujoco.mjtGeom.mjGEOM_MESH}
+        meshes = [mesh for mesh in meshes if get_mesh_name(mesh) in referenced or get_mesh_name(mesh) in fitted]
+        authored = [mesh for mesh in meshes if get_mesh_name(mesh) in referenced]
+    if not meshes:
+        return
+
+    # meshes which share a source file (e.g. mirrored limbs, or visual & collision variants) are decoded once
+    # inline meshes have no source file, their data is read directly from the spec
+    sources = {mesh: get_mesh_source(mesh, data) if mesh.file else None for mesh in meshes}
+    # MuJoCo uses the convex hull of a mesh without faces, which is read from the compiled model
+    hulls = {mesh for mesh, source in sources.items() if uses_convex_hull(mesh, source)}
+    unique_sources = list(dict.fromkeys(source for mesh, source in sources.items() if source is not None and mesh not in hulls))
+    options = DecodeOptions(weld_tolerance=data.weld_tolerance, merge_obj_shapes=data.merge_obj_shapes)
+    decoded = dict(zip(unique_sources, decode_meshes(unique_sources, data.jobs, data.mesh_cache, options)))
+    # meshes which are not decoded from their file alone are decoded individually
+    individual = {mesh: decode_inline_mesh(mesh, data) for mesh, source in sources.items() if source is None}
+    individual.update(
+        (mesh, decode_msh(source[0], get_convex_hull_faces(mesh, data))) for mesh, source in sources.items() if source and mesh in hulls
+    )
+
+    for mesh in meshes:
+        # the fit of a mesh without faces is read from the compiled model along with its convex hull
+        if get_mesh_name(mesh) in fitted and mesh not in hulls:
+            buffers = individual[mesh] if mesh in individual else decoded[sources[mesh]]
+            if (inertia := get_mesh_inertia(mesh, buffers)) is not None:
+                data.mesh_inertias[get_mesh_name(mesh)] = inertia
+
+    if not authored:
         return
 
     data.libraries[Tokens.Geometry] = usdex.core.addAssetLibrary(data.content[Tokens.Contents], Tokens.Geometry, format="usdc")
     data.references[Tokens.Geometry] = {}
 
     geo_scope = data.libraries[Tokens.Geometry].GetDefaultPrim()
-    source_names = [get_mesh_name(x) for x in data.spec.meshes]
+    source_names = [get_mesh_name(x) for x in authored]
     safe_names = data.name_cache.getPrimNames(geo_scope, source_names)
-    for mesh, source_name, safe_name in zip(data.spec.meshes, source_names, safe_names):
-        mesh_prim: Usd.Prim = usdex.core.defineXform(geo_scope, safe_name).GetPrim()
+    source_prims: dict[tuple[pathlib.Path, str], Usd.Prim] = {}
+    for mesh, source_name, safe_name in zip(authored, source_names, safe_names):
+        source = sources[mesh]
+        if mesh in individual:
+            mesh_prim: Usd.Prim = usdex.core.defineXform(geo_scope, safe_name).GetPrim()
+            convert_mesh(mesh_prim, mesh, individual[mesh], data)
+        elif source in source_prims:
+            mesh_prim = convert_shared_mesh(geo_scope, safe_name, mesh, source_prims[source], data)
+        else:
+            mesh_prim: Usd.Prim = usdex.core.defineXform(geo_scope, safe_name).GetPrim()
+            convert_mesh(mesh_prim, mesh, decoded[source], data)
+            source_prims[source] = mesh_prim
         data.references[Tokens.Geometry][source_name] = mesh_prim
         # FUTURE: specialize from class
         if source_name != safe_name:
             usdex.core.setDisplayName(mesh_prim, source_name)
-        convert_mesh(mesh_prim, mesh, data)
 
-    usdex.core.saveStage(data.libraries[Tokens.Geometry], comment=f"Mesh Library for {data.spec.modelname}. {data.comment}")
+    data.writer.save_stage(data.libraries[Tokens.Geometry], f"Mesh Library for {data.spec.modelname}. {data.comment}")
 
 
 def get_mesh_name(mesh: mujoco.MjsMesh) -> str:
@@ -46,54 +135,463 @@ def get_mesh_name(mesh: mujoco.MjsMesh) -> str:
         return f"Mesh_{mesh.id}"
 
 
-def convert_mesh(prim: Usd.Prim, mesh: mujoco.MjsMesh, data: ConversionData):
-    if not mesh.file:
-        # FUTURE: support inline meshes
-        raise Tf.RaiseRuntimeError(f"Mesh {mesh.name} has no file")
+def get_mesh_inertia(mesh: mujoco.MjsMesh, buffers: MeshBuffers) -> MeshInertia | None:
+    """Compute the inertia of a decoded mesh, or ``None`` if it must be read from the compiled model instead."""
+    counts, indices = buffers.face_vertex_counts, buffers.face_vertex_indices
+    if buffers.subset_face_counts is not None:
+        # MuJoCo only compiles the first shape of a multi-shape OBJ file
+        face_count = int(buffers.subset_face_counts[0])
+        counts, indices = counts[:face_count], indices[: int(np.sum(counts[:face_count]))]
+    points = buffers.points if buffers.unreferenced_points is None else np.concatenate((buffers.points, buffers.unreferenced_points))
+    return compute_mesh_inertia(mesh, points, triangulate(counts, indices))
+
+
+def uses_convex_hull(mesh: mujoco.MjsMesh, source: tuple[pathlib.Path, str] | None) -> bool:
+    """Whether a mesh defines no faces, so MuJoCo builds them from the convex hull of its vertices."""
+    if source is None:
+        return not len(mesh.userface)
+    return source[1] == "msh" and read_msh_counts(source[0])[3] == 0
 
+
+def get_convex_hull_faces(mesh: mujoco.MjsMesh, data: ConversionData) -> np.ndarray:
+    """The faces MuJoCo computed for a mesh without faces, which index the vertices in their original order."""
+    index = data.get_model_index()
+    model = index.model
+    mesh_id = index.mesh_id(mesh)
+    start = model.mesh_faceadr[mesh_id]
+    return model.mesh_face[start : start + model.mesh_facenum[mesh_id]].reshape(-1).astype(np.int32)
+
+
+def get_mesh_source(mesh: mujoco.MjsMesh, data: ConversionData) -> tuple[pathlib.Path, str]:
+    """Resolve the file backing a mesh and the format it should be decoded as."""
     mesh_file = pathlib.Path(data.spec.modelfiledir) / pathlib.Path(mesh.compiler.meshdir) / pathlib.Path(mesh.file)
     if not mesh_file.exists():
         raise Tf.RaiseRuntimeError(f"Mesh {mesh.name} file {mesh_file} does not exist")
 
     if mesh.content_type == "model/stl" or mesh_file.suffix.lower() == ".stl":
-        mesh_prim = convert_stl(prim, mesh_file)
+        return mesh_file, "stl"
     elif mesh.content_type == "model/obj" or mesh_file.suffix.lower() == ".obj":
-        mesh_prim = convert_obj(prim, mesh_file)
+        return mesh_file, "obj"
+    elif mesh.content_type == "model/vnd.mujoco.msh" or mesh_file.suffix.lower() == ".msh":
+        return mesh_file, "msh"
     else:
         raise Tf.RaiseRuntimeError(
             f"Mesh {mesh.name} from file {mesh_file} has unsupported content_type {mesh.content_type} or extension {mesh_file.suffix}"
         )
 
-    set_transform(mesh_prim, mesh, data.spec)
-
-
-def convert_stl(prim: Usd.Prim, input_path: pathlib.Path) -> UsdGeom.Mesh:
-    stl_mesh = stl.Mesh.from_file(input_path, calculate_normals=False)
-
-    points = usdex.core.Vec3fPrimvarData(UsdGeom.Tokens.vertex, convert_vec3f_array(stl_mesh.points))
-    points.index()
-    face_vertex_indices = points.indices()
-    face_vertex_counts = [3] * stl_mesh.points.shape[0]
 
+def decode_meshes(
+    sources: list[tuple[pathlib.Path, str]], jobs: int, cache: DiskCache | None = None, options: DecodeOptions = DecodeOptions()
+) -> list[MeshBuffers]:
+    """
+    Decode mesh files, reusing cached buffers where possible.
+
+    Files which are not cached are decoded in a pool of worker processes when more than one job is
+    requested. Workers are spawned rather than forked, as forking a process which has already loaded
+    USD is not safe. The results are identical to decoding serially, in the same order.
+    """
+    decoded: list[MeshBuffers | None] = [None] * len(sources)
+    keys = []
+    if cache is not None:
+        keys = [get_mesh_cache_key(path, mesh_format, options) for path, mesh_format in sources]
+        for i, key in enumerate(keys):
+            decoded[i] = load_cached_mesh(cache, key)
+
+    missing = [i for i, buffers in enumerate(decoded) if buffers is None]
+    if jobs <= 1 or len(missing) <= 1:
+        results = [decode_mesh(*sources[i], options) for i in missing]
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(jobs, len(missing)), mp_context=context) as pool:
+            paths, mesh_formats = zip(*[sources[i] for i in missing])
+            results = list(pool.map(_decode_mesh_in_worker, paths, mesh_formats, [options] * len(missing)))
+
+    for i, buffers in zip(missing, results):
+        decoded[i] = buffers
+        if cache is not None:
+            store_cached_mesh(cache, keys[i], buffers)
+    if cache is not None and missing:
+        cache.evict()
+
+    return decoded
+
+
+def decode_mesh(input_path: pathlib.Path, mesh_format: str, options: DecodeOptions = DecodeOptions()) -> MeshBuffers:
+    if mesh_format == "stl":
+        return decode_stl(input_path, options.weld_tolerance)
+    elif mesh_format == "msh":
+        return decode_msh(input_path)
+    return decode_obj(input_path, options.merge_obj_shapes)
+
+
+def _decode_mesh_in_worker(input_path: pathlib.Path, mesh_format: str, options: DecodeOptions) -> MeshBuffers:
+    # Tf errors cannot be pickled back to the parent process, so re-raise them as plain runtime errors
+    try:
+        return decode_mesh(input_path, mesh_format, options)
+    except Tf.ErrorException as e:
+        raise RuntimeError("; ".join(error.commentary for error in e.args)) from None
+
+
+def get_mesh_cache_key(input_path: pathlib.Path, mesh_format: str, options: DecodeOptions = DecodeOptions()) -> str:
+    # The key only covers what the decoded buffers depend on. Per-mesh settings such as scale, refpos
+    # and refquat are authored as a transform on the library prim, so they do not affect the buffers.
+    parts = [MESH_CACHE_VERSION, mesh_format, hash_file(input_path)]
+    if mesh_format == "stl" and options.weld_tolerance > 0:
+        parts.append(f"weld={options.weld_tolerance!r}")
+    elif mesh_format == "obj" and options.merge_obj_shapes:
+        parts.append("merge_shapes")
+    return hash_key(*parts)
+
+
+def load_cached_mesh(cache: DiskCache, key: str) -> MeshBuffers | None:
+    if not (entry := cache.get(key)):
+        return None
+    try:
+        metadata = json.loads((entry / "mesh.json").read_text())
+        # every array the entry was stored with must be present, a missing optional array would silently drop it
+        arrays = {name: np.load(entry / f"{name}.npy", mmap_mode="r") for name in metadata.pop("arrays")}
+        return MeshBuffers(**arrays, **metadata)
+    except (OSError, ValueError, TypeError, KeyError):
+        # the entry was evicted while reading it, or is otherwise unusable
+        return None
+
+
+def store_cached_mesh(cache: DiskCache, key: str, buffers: MeshBuffers) -> None:
+    def write(directory: pathlib.Path):
+        metadata = {"arrays": []}
+        for buffer_field in fields(buffers):
+            value = getattr(buffers, buffer_field.name)
+            if isinstance(value, np.ndarray):
+                np.save(directory / f"{buffer_field.name}.npy", value)
+                metadata["arrays"].append(buffer_field.name)
+            elif value is not None:
+                metadata[buffer_field.name] = value
+        (directory / "mesh.json").write_text(json.dumps(metadata))
+
+    try:
+        cache.put(key, write)
+    except OSError as e:
+        Tf.Warn(f"Unable to store decoded mesh in the cache at {cache.root}: {e}")
+
+
+def convert_mesh(prim: Usd.Prim, mesh: mujoco.MjsMesh, buffers: MeshBuffers, data: ConversionData):
+    for warning in buffers.warnings:
+        Tf.Warn(warning)
+    define_mesh(prim, buffers)
+    set_transform(prim, mesh, data.get_spec_transforms())
+
+
+def convert_shared_mesh(parent: Usd.Prim, name: str, mesh: mujoco.MjsMesh, source_prim: Usd.Prim, data: ConversionData) -> Usd.Prim:
+    """Author a mesh whose source file has already been converted, by referencing the existing library mesh.
+
+    Only the transform differs between meshes sharing a file, so it replaces the referenced transform
+    rather than composing with it.
+    """
+    prim = usdex.core.defineReference(parent, source_prim, name)
+    if usdex.core.getDisplayName(source_prim):
+        usdex.core.blockDisplayName(prim)
+    usdex.core.setLocalTransform(prim, Gf.Vec3d(0), Gf.Quatf.GetIdentity(), Gf.Vec3f(1))
+    set_transform(prim, mesh, data.get_spec_transforms())
+    return prim
+
+
+def define_mesh(prim: Usd.Prim, buffers: MeshBuffers) -> UsdGeom.Mesh:
     normals = None
-    if stl_mesh.normals.any():
-        normals = usdex.core.Vec3fPrimvarData(UsdGeom.Tokens.uniform, convert_vec3f_array(stl_mesh.normals))
-        normals.index()
+    if buffers.normals is not None:
+        normals = usdex.core.Vec3fPrimvarData(
+            buffers.normals_interpolation,
+            Vt.Vec3fArray.FromNumpy(buffers.normals),
+            Vt.IntArray.FromNumpy(buffers.normal_indices),
+        )
+
+    uvs = None
+    if buffers.uvs is not None:
+        uvs = usdex.core.Vec2fPrimvarData(
+            UsdGeom.Tokens.faceVarying,
+            Vt.Vec2fArray.FromNumpy(buffers.uvs),
+            Vt.IntArray.FromNumpy(buffers.uv_indices),
+        )
 
     usd_mesh = usdex.core.definePolyMesh(
-        prim.GetParent(),
-        prim.GetName(),
-        faceVertexCounts=Vt.IntArray(face_vertex_counts),
-        faceVertexIndices=Vt.IntArray(face_vertex_indices),
-        points=points.values(),
-        normals=normals,
+        prim,
+        Vt.IntArray.FromNumpy(buffers.face_vertex_counts),
+        Vt.IntArray.FromNumpy(buffers.face_vertex_indices),
+        Vt.Vec3fArray.FromNumpy(buffers.points),
+        normals,
+        uvs,
     )
     if not usd_mesh:
-        Tf.RaiseRuntimeError(f'Failed to convert mesh "{prim.GetPath()}" from {input_path}')
+        Tf.RaiseRuntimeError(f'Failed to convert mesh "{prim.GetPath()}"')
+
+    if buffers.subset_names is not None:
+        define_subsets(usd_mesh, buffers.subset_names, buffers.subset_face_counts)
+
     return usd_mesh
 
 
-def convert_obj(prim: Usd.Prim, input_path: pathlib.Path) -> UsdGeom.Mesh:
+def define_subsets(usd_mesh: UsdGeom.Mesh, source_names: list[str], face_counts: np.ndarray):
+    """Author a face subset for each part of a mesh, where each part is a contiguous range of faces."""
+    safe_names = usdex.core.getValidChildNames(usd_mesh.GetPrim(), source_names)
+    ends = np.cumsum(face_counts)
+    for source_name, safe_name, start, end in zip(source_names, safe_names, ends - face_counts, ends):
+        subset = UsdGeom.Subset.CreateGeomSubset(
+            usd_mesh,
+            safe_name,
+            UsdGeom.Tokens.face,
+            Vt.IntArray.FromNumpy(np.arange(start, end, dtype=np.int32)),
+            OBJ_SHAPE_FAMILY,
+            UsdGeom.Tokens.partition,
+        )
+        if source_name != safe_name:
+            usdex.core.setDisplayName(subset.GetPrim(), source_name)
+
+
+def index_values(values: np.ndarray, indices: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Remove duplicate values, returning the unique values and the indices which reproduce the input.
+
+    This matches the behavior of ``usdex.core.Vec3fPrimvarData.index()``: unique values are kept
+    in the order they are first referenced, and values which compare equal are merged.
+
+    Args:
+        values: A numpy array of shape (N, M) containing N elements.
+        indices: Optional indices into ``values``, describing the sequence of elements to be indexed.
+
+    Returns:
+        A tuple containing the unique values and the int32 indices into them.
+    """
+    if indices is not None:
+        values = values[indices]
+    # sort the rows so equal values are adjacent, this is considerably faster than np.unique(axis=0)
+    order = np.lexsort(values.T[::-1])
+    ordered = values[order]
+    starts = np.empty(len(values), dtype=bool)
+    starts[:1] = True
+    np.any(ordered[1:] != ordered[:-1], axis=1, out=starts[1:])
+    # lexsort is stable, so the start of each run is the first occurrence of that value
+    first = order[starts]
+    rank = np.empty(len(first), dtype=np.intp)
+    rank[np.argsort(first)] = np.arange(len(first))
+    indices = np.empty(len(values), dtype=np.int32)
+    indices[order] = rank[np.cumsum(starts) - 1]
+    return np.ascontiguousarray(values[np.sort(first)]), indices
+
+
+def decode_inline_mesh(mesh: mujoco.MjsMesh, data: ConversionData) -> MeshBuffers:
+    """
+    Decode a mesh whose data is embedded in the spec (e.g. the ``vertex`` and ``face`` attributes in MJCF).
+
+    The spec vectors do not expose a buffer, so each is copied into a numpy array in a single pass.
+    """
+    points = np.array(mesh.uservert, dtype=np.float32).reshape(-1, 3)
+    if not len(points):
+        Tf.RaiseRuntimeError(f"Mesh {mesh.name} has no file or vertices")
+
+    face_vertex_indices = np.array(mesh.userface, dtype=np.int32)
+    if not len(face_vertex_indices):
+        face_vertex_indices = get_convex_hull_faces(mesh, data)
+
+    return index_triangle_mesh(
+        points,
+        face_vertex_indices,
+        normals=np.array(mesh.usernormal, dtype=np.float32).reshape(-1, 3),
+        normal_indices=np.array(mesh.userfacenormal, dtype=np.int32),
+        uvs=np.array(mesh.usertexcoord, dtype=np.float32).reshape(-1, 2),
+        uv_indices=np.array(mesh.userfacetexcoord, dtype=np.int32),
+    )
+
+
+def index_triangle_mesh(
+    points: np.ndarray,
+    face_vertex_indices: np.ndarray,
+    normals: np.ndarray,
+    normal_indices: np.ndarray,
+    uvs: np.ndarray,
+    uv_indices: np.ndarray,
+) -> MeshBuffers:
+    """
+    Build the buffers for a triangle mesh described the way MuJoCo stores meshes internally.
+
+    Normals & texcoords are indexed per face corner when indices are provided for them, otherwise they
+    are per vertex. Any of the normals, texcoords and their indices may be empty.
+    """
+    buffers = MeshBuffers(
+        face_vertex_counts=np.full(len(face_vertex_indices) // 3, 3, dtype=np.int32),
+        face_vertex_indices=face_vertex_indices,
+        points=points,
+    )
+
+    if len(normals) and (len(normal_indices) or len(normals) == len(points)):
+        buffers.normals, buffers.normal_indices = index_values(normals, normal_indices if len(normal_indices) else face_vertex_indices)
+    else:
+        # MuJoCo computes normals for meshes which do not provide them, author flat normals so the mesh is not shaded smooth
+        corners = points[face_vertex_indices.reshape(-1, 3)]
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), np.finfo(np.float32).tiny)
+        buffers.normals, buffers.normal_indices = index_values(normals)
+        buffers.normals_interpolation = UsdGeom.Tokens.uniform
+
+    if len(uvs) and (len(uv_indices) or len(uvs) == len(points)):
+        # MuJoCo texture coordinates have their origin at the top left, while USD uses the bottom left
+        uvs = np.column_stack((uvs[:, 0], 1 - uvs[:, 1]))
+        buffers.uvs, buffers.uv_indices = index_values(uvs, uv_indices if len(uv_indices) else face_vertex_indices)
+
+    # e.g. the convex hull may leave interior vertices unreferenced
+    buffers.points, buffers.face_vertex_indices = remove_unreferenced_points(points, face_vertex_indices)
+    if len(buffers.points) < len(points):
+        buffers.unreferenced_points = np.delete(points, np.unique(face_vertex_indices), axis=0)
+
+    return buffers
+
+
+def decode_stl(input_path: pathlib.Path, weld_tolerance: float = 0.0) -> MeshBuffers:
+    triangles = read_binary_stl(input_path)
+    if triangles is not None:
+        vertices, normals = triangles["vertices"], triangles["normal"]
+    else:
+        stl_mesh = stl.Mesh.from_file(input_path, calculate_normals=False)
+        vertices, normals = stl_mesh.vectors.astype(np.float32), stl_mesh.normals.astype(np.float32)
+
+    if weld_tolerance > 0:
+        points, face_vertex_indices, kept = weld_triangles(vertices.reshape(-1, 3), weld_tolerance)
+        normals = normals[kept]
+    else:
+        points, face_vertex_indices = index_values(vertices.reshape(-1, 3))
+    buffers = MeshBuffers(
+        face_vertex_counts=np.full(len(face_vertex_indices) // 3, 3, dtype=np.int32),
+        face_vertex_indices=face_vertex_indices,
+        points=points,
+    )
+
+    if normals.any():
+        buffers.normals, buffers.normal_indices = index_values(normals)
+        buffers.normals_interpolation = UsdGeom.Tokens.uniform
+
+    return buffers
+
+
+def read_binary_stl(input_path: pathlib.Path) -> np.ndarray | None:
+    """
+    Memory map the triangle records of a binary STL file.
+
+    A file is treated as binary when its size matches the triangle count in its header. This also
+    accepts binary files whose header begins with ``solid``, which several exporters write.
+
+    Returns:
+        A read only structured array viewing the triangle records, or ``None`` if the file is not a binary STL.
+    """
+    size = input_path.stat().st_size
+    if size < STL_HEADER_BYTES + 4:
+        return None
+    with input_path.open("rb") as f:
+        f.seek(STL_HEADER_BYTES)
+        count = int(np.frombuffer(f.read(4), dtype="<u4")[0])
+    if size != STL_HEADER_BYTES + 4 + count * STL_TRIANGLE_DTYPE.itemsize:
+        return None
+    if count == 0:
+        return np.empty(0, dtype=STL_TRIANGLE_DTYPE)
+    return np.memmap(input_path, dtype=STL_TRIANGLE_DTYPE, mode="r", offset=STL_HEADER_BYTES + 4, shape=(count,))
+
+
+def weld_triangles(points: np.ndarray, tolerance: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Weld the vertices of a triangle soup and remove the triangles and vertices which become redundant.
+
+    Vertices are snapped to a grid with a spacing of ``tolerance`` and vertices sharing a grid cell are
+    merged, keeping the position of the first one. Triangles which no longer have three distinct
+    vertices or which have no area are removed, as are repeats of the same triangle with the same
+    winding. Finally, vertices which are no longer referenced by any triangle are removed.
+
+    Args:
+        points: A numpy array of shape (3N, 3) containing the corners of N triangles.
+        tolerance: The grid spacing used to merge vertices.
+
+    Returns:
+        A tuple containing the welded points, the int32 face vertex indices, and the indices of the
+        input triangles which were kept.
+    """
+    _, indices = index_values(np.round(points.astype(np.float64) / tolerance).astype(np.int64))
+    welded = points[np.unique(indices, return_index=True)[1]]
+    triangles = indices.reshape(-1, 3)
+
+    corners = welded[triangles]
+    areas = np.linalg.norm(np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), axis=1)
+    valid = np.flatnonzero(
+        (triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) & (triangles[:, 2] != triangles[:, 0]) & (areas > 0)
+    )
+
+    # rotate each triangle to start from its lowest index, so repeats match regardless of their first corner
+    shift = np.argmin(triangles[valid], axis=1)[:, np.newaxis]
+    rotated = np.take_along_axis(triangles[valid], (shift + np.arange(3)) % 3, axis=1)
+    _, repeats = index_values(rotated)
+    kept = np.sort(valid[np.unique(repeats, return_index=True)[1]])
+    points, face_vertex_indices = remove_unreferenced_points(welded, triangles[kept].reshape(-1))
+    return points, face_vertex_indices, kept
+
+
+def remove_unreferenced_points(points: np.ndarray, face_vertex_indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Remove the points which are not referenced by any face, preserving the order of the remaining points."""
+    referenced = np.zeros(len(points), dtype=bool)
+    referenced[face_vertex_indices] = True
+    if referenced.all():
+        return points, face_vertex_indices
+    remap = np.cumsum(referenced, dtype=np.int32) - 1
+    return points[referenced], remap[face_vertex_indices]
+
+
+def read_msh_counts(input_path: pathlib.Path) -> tuple[int, int, int, int]:
+    """Read the number of vertices, normals, texcoords & faces from the header of an MSH file."""
+    counts = np.fromfile(input_path, dtype="<i4", count=4)
+    if len(counts) < 4 or counts[0] < 1 or counts.min() < 0:
+        Tf.RaiseRuntimeError(f'Invalid input_path: "{input_path}" is not a valid MSH file')
+    return tuple(int(x) for x in counts)
+
+
+def decode_msh(input_path: pathlib.Path, hull_faces: np.ndarray | None = None) -> MeshBuffers:
+    """
+    Decode a mesh in MuJoCo's binary MSH format.
+
+    The file is four int32 counts (vertices, normals, texcoords & faces) followed by the float32 vertex,
+    normal and texcoord arrays and the int32 face array. The arrays are viewed in place via a memory map.
+
+    A file without faces is converted using the faces of its convex hull, which MuJoCo computes
+    when compiling the model, so they must be given as ``hull_faces``.
+    """
+    size = input_path.stat().st_size
+    num_vertices, num_normals, num_texcoords, num_faces = read_msh_counts(input_path)
+    layout = np.dtype(
+        [
+            ("counts", "<i4", (4,)),
+            ("vertices", "<f4", (num_vertices, 3)),
+            ("normals", "<f4", (num_normals, 3)),
+            ("texcoords", "<f4", (num_texcoords, 2)),
+            ("faces", "<i4", (num_faces * 3,)),
+        ]
+    )
+    if size != layout.itemsize:
+        Tf.RaiseRuntimeError(f'Invalid input_path: "{input_path}" is not a valid MSH file, expected {layout.itemsize} bytes but found {size}')
+
+    msh = np.memmap(input_path, dtype=layout, mode="r", shape=(1,))[0]
+    faces = np.asarray(msh["faces"])
+    if num_faces == 0:
+        if hull_faces is None:
+            Tf.RaiseCodingError(f'"{input_path}" has no faces, so it must be decoded with the convex hull of the compiled model')
+        faces = hull_faces
+    elif faces.min() < 0 or faces.max() >= num_vertices:
+        Tf.RaiseRuntimeError(
+            f'Invalid input_path: "{input_path}" is not a valid MSH file, its faces index vertices outside of the {num_vertices} it defines'
+        )
+    return index_triangle_mesh(
+        np.asarray(msh["vertices"]),
+        faces,
+        normals=np.asarray(msh["normals"]),
+        normal_indices=np.empty(0, dtype=np.int32),
+        uvs=np.asarray(msh["texcoords"]),
+        uv_indices=np.empty(0, dtype=np.int32),
+    )
+
+
+def decode_obj(input_path: pathlib.Path, merge_shapes: bool = False) -> MeshBuffers:
     reader = tinyobjloader.ObjReader()
     config = tinyobjloader.ObjReaderConfig()
     config.triangulate = False  # Preserve quads and n-gons
@@ -101,55 +599,54 @@ def convert_obj(prim: Usd.Prim, input_path: pathlib.Path) -> UsdGeom.Mesh:
         Tf.RaiseRuntimeError(f'Invalid input_path: "{input_path}" could not be parsed. {reader.Error()}')
 
     shapes = reader.GetShapes()
+    warnings = []
     if len(shapes) == 0:
         Tf.RaiseRuntimeError(f'Invalid input_path: "{input_path}" contains no meshes')
-    elif len(shapes) > 1:
-        Tf.Warn(f'"{input_path.name}" contains multiple meshes, only the first one will be converted')
+    elif len(shapes) > 1 and not merge_shapes:
+        # MuJoCo only simulates the first shape, so the others are not converted unless requested
+        warnings.append(f'"{input_path.name}" contains multiple meshes, only the first one will be converted')
+        shapes = shapes[:1]
 
+    # FUTURE: use the numpy_* accessors once the supported tinyobjloader returns correct data from them
     attrib = reader.GetAttrib()
-    obj_mesh = shapes[0].mesh
-
-    face_vertex_counts = Vt.IntArray(obj_mesh.num_face_vertices)
-    vertex_indices_in_shape = np.array(obj_mesh.vertex_indices(), dtype=np.int32)
-    unique_vertex_indices = np.unique(vertex_indices_in_shape)
-    face_vertex_indices = Vt.IntArray.FromNumpy(np.searchsorted(unique_vertex_indices, vertex_indices_in_shape))
+    shape_face_counts = [np.array(shape.mesh.num_face_vertices, dtype=np.int32) for shape in shapes]
+    face_vertex_counts = np.concatenate(shape_face_counts)
+    vertex_indices_in_shapes = np.concatenate([np.asarray(shape.mesh.vertex_indices(), dtype=np.int32) for shape in shapes])
+    unique_vertex_indices = np.unique(vertex_indices_in_shapes)
+    face_vertex_indices = np.searchsorted(unique_vertex_indices, vertex_indices_in_shapes).astype(np.int32)
 
     vertices_array = np.array(attrib.vertices, dtype=np.float32).reshape(-1, 3)
-    points = Vt.Vec3fArray.FromNumpy(vertices_array[unique_vertex_indices])
+    buffers = MeshBuffers(
+        face_vertex_counts=face_vertex_counts,
+        face_vertex_indices=face_vertex_indices,
+        points=vertices_array[unique_vertex_indices],
+        warnings=warnings,
+    )
+    if len(unique_vertex_indices) < len(vertices_array):
+        buffers.unreferenced_points = np.delete(vertices_array, unique_vertex_indices, axis=0)
 
-    normals = None
     if len(attrib.normals) > 0:
-        normal_indices_in_shape = np.array(obj_mesh.normal_indices(), dtype=np.int32)
-        unique_normal_indices = np.unique(normal_indices_in_shape)
-
+        normal_indices_in_shapes = np.concatenate([np.asarray(shape.mesh.normal_indices(), dtype=np.int32) for shape in shapes])
+        unique_normal_indices = np.unique(normal_indices_in_shapes)
         normals_array = np.array(attrib.normals, dtype=np.float32).reshape(-1, 3)
         normals_data = normals_array[unique_normal_indices]
 
-        remapped_normal_indices = np.searchsorted(unique_normal_indices, normal_indices_in_shape)
-        normals = usdex.core.Vec3fPrimvarData(
-            UsdGeom.Tokens.faceVarying,
-            Vt.Vec3fArray.FromNumpy(normals_data),
-            Vt.IntArray.FromNumpy(remapped_normal_indices),
-        )
-        normals.index()  # re-index the normals to remove duplicates
+        remapped_normal_indices = np.searchsorted(unique_normal_indices, normal_indices_in_shapes)
+        # re-index the normals to remove duplicates
+        buffers.normals, buffers.normal_indices = index_values(normals_data, remapped_normal_indices)
 
-    uvs = None
     if len(attrib.texcoords) > 0:
-        texcoord_indices_in_shape = np.array(obj_mesh.texcoord_indices(), dtype=np.int32)
-        unique_texcoord_indices = np.unique(texcoord_indices_in_shape)
-
+        texcoord_indices_in_shapes = np.concatenate([np.asarray(shape.mesh.texcoord_indices(), dtype=np.int32) for shape in shapes])
+        unique_texcoord_indices = np.unique(texcoord_indices_in_shapes)
         texcoords_array = np.array(attrib.texcoords, dtype=np.float32).reshape(-1, 2)
         uv_data = texcoords_array[unique_texcoord_indices]
 
-        remapped_texcoord_indices = np.searchsorted(unique_texcoord_indices, texcoord_indices_in_shape)
-        uvs = usdex.core.Vec2fPrimvarData(
-            UsdGeom.Tokens.faceVarying,
-            Vt.Vec2fArray.FromNumpy(uv_data),
-            Vt.IntArray.FromNumpy(remapped_texcoord_indices),
-        )
-        uvs.index()  # re-index the uvs to remove duplicates
+        remapped_texcoord_indices = np.searchsorted(unique_texcoord_indices, texcoord_indices_in_shapes)
+        # re-index the uvs to remove duplicates
+        buffers.uvs, buffers.uv_indices = index_values(uv_data, remapped_texcoord_indices)
 
-    usd_mesh = usdex.core.definePolyMesh(prim, face_vertex_counts, face_vertex_indices, points, normals, uvs)
-    if not usd_mesh:
-        Tf.RaiseRuntimeError(f'Failed to convert mesh "{prim.GetPath()}" from {input_path}')
-    return usd_mesh
+    if len(shapes) > 1:
+        buffers.subset_names = [shape.name or f"Shape_{i}" for i, shape in enumerate(shapes)]
+        buffers.subset_face_counts = np.array([len(counts) for counts in shape_face_counts], dtype=np.int32)
+
+    return buffers
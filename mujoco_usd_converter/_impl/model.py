@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import pathlib
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
+
+import mujoco
+from pxr import Tf
+
+from .cache import DiskCache, hash_file, hash_key
+
+__all__ = ["compile_model"]
+
+# Bump whenever a change to compilation alters the models it produces, so stale cache entries are not reused
+MODEL_CACHE_VERSION = "1"
+
+MODEL_CACHE_FILE = "model.mjb"
+
+
+def compile_model(spec: mujoco.MjSpec, cache: DiskCache | None = None, model_path: pathlib.Path | None = None) -> mujoco.MjModel:
+    """
+    Compile a spec, reusing a previously compiled model from the cache when none of its inputs changed.
+
+    Note that ``MjSpec.compile()`` mutates the spec it is called on, so callers pass a copy of any
+    spec they continue to read from.
+
+    Args:
+        spec: The spec to compile.
+        cache: A cache of compiled models, in MuJoCo's binary MJB format.
+        model_path: The MJCF file the spec was parsed from. The cache is only used when this is known,
+            as the cache key covers the files the spec was parsed from.
+    """
+    key = get_model_cache_key(spec, model_path) if cache is not None and model_path is not None else None
+    if key is not None and (model := load_cached_model(cache, key)) is not None:
+        return model
+
+    model = spec.compile()
+    if key is not None:
+        store_cached_model(cache, key, model)
+        cache.evict()
+    return model
+
+
+def get_model_cache_key(
+    spec: mujoco.MjSpec,
+    model_path: pathlib.Path,
+    hasher: Callable[[pathlib.Path], str] = hash_file,
+) -> str | None:
+    """
+    Hash everything a compiled model depends on, or return ``None`` if some input cannot be read.
+
+    The key covers the MJCF file and the files it includes, every asset file the spec references,
+    any in-memory assets, and the version of MuJoCo which compiles it. Serializing the spec itself
+    is not an option, as ``MjSpec.to_xml()`` compiles the model.
+
+    Args:
+        spec: The spec parsed from ``model_path``.
+        model_path: The MJCF file the spec was parsed from.
+        hasher: Hashes the contents of each file, e.g. a :class:`FileHashes` shared between several models.
+    """
+    parts = [MODEL_CACHE_VERSION, mujoco.__version__]
+    try:
+        for path in get_model_files(model_path) + get_asset_files(spec):
+            parts += [path.as_posix(), hasher(path)]
+    except (OSError, ET.ParseError):
+        return None
+    for name, content in sorted(spec.assets.items()):
+        parts += [name, hash_key(content.decode("latin-1") if isinstance(content, bytes) else str(content))]
+    return hash_key(*parts)
+
+
+def get_model_files(model_path: pathlib.Path) -> list[pathlib.Path]:
+    """The MJCF file and every file it includes or attaches, recursively, in a stable order."""
+    model_dir = model_path.parent
+    files = [model_path]
+    pending = [model_path]
+    while pending:
+        path = pending.pop(0)
+        for element in ET.parse(path).iter():
+            if element.tag not in ("include", "model") or not (file := element.get("file")):
+                continue
+            # MuJoCo resolves includes relative to the main model, fall back to the including file for attached models
+            candidates = [model_dir / file, path.parent / file]
+            resolved = next((candidate for candidate in candidates if candidate.exists()), candidates[0])
+            if resolved not in files:
+                files.append(resolved)
+                pending.append(resolved)
+    return files
+
+
+def get_asset_files(spec: mujoco.MjSpec) -> list[pathlib.Path]:
+    """The files backing the meshes, height fields, skins and textures of a spec."""
+    root = pathlib.Path(spec.modelfiledir)
+    # height fields and skins are resolved against the mesh directory, as meshes are
+    files = [root / element.compiler.meshdir / element.file for element in (*spec.meshes, *spec.hfields, *spec.skins) if element.file]
+    files.extend(root / texture.compiler.texturedir / file for texture in spec.textures for file in (texture.file, *texture.cubefiles) if file)
+    return files
+
+
+def load_cached_model(cache: DiskCache, key: str) -> mujoco.MjModel | None:
+    if not (entry := cache.get(key)):
+        return None
+    try:
+        return mujoco.MjModel.from_binary_path((entry / MODEL_CACHE_FILE).as_posix())
+    except (OSError, ValueError):
+        # the entry was evicted while reading it, or is otherwise unusable
+        return None
+
+
+def store_cached_model(cache: DiskCache, key: str, model: mujoco.MjModel) -> None:
+    def write(directory: pathlib.Path):
+        mujoco.mj_saveModel(model, (directory / MODEL_CACHE_FILE).as_posix(), None)
+
+    try:
+        cache.put(key, write)
+    except OSError as e:
+        Tf.Warn(f"Unable to store the compiled model in the cache at {cache.root}: {e}")
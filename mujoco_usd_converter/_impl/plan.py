@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from pxr import Tf
+
+__all__ = ["ConversionPlan", "Phase"]
+
+
+@dataclass(frozen=True)
+class Phase:
+    """A step of a conversion, which runs once all the phases it depends on have finished."""
+
+    name: str
+    run: Callable[[], None]
+    depends: tuple[str, ...] = ()
+
+
+class ConversionPlan:
+    """
+    The phases of a conversion, and the dependencies between them.
+
+    The dependencies are resolved up front, so a plan with a missing or circular dependency fails
+    before any phase has run. The phases run on the calling thread, one at a time, in the order
+    they were added (unless a dependency requires otherwise), which keeps the authored layers
+    deterministic.
+
+    Every phase is timed, and :meth:`run` returns the durations by phase name.
+    """
+
+    def __init__(self):
+        self.__phases: dict[str, Phase] = {}
+
+    def add(self, name: str, run: Callable[[], None], depends: tuple[str, ...] = ()) -> None:
+        if name in self.__phases:
+            Tf.RaiseCodingError(f'Phase "{name}" is already in the conversion plan')
+        self.__phases[name] = Phase(name, run, tuple(depends))
+
+    def order(self) -> list[Phase]:
+        """Resolve the dependencies of the phases into the order they start in."""
+        for phase in self.__phases.values():
+            for dependency in phase.depends:
+                if dependency not in self.__phases:
+                    Tf.RaiseCodingError(f'Phase "{phase.name}" depends on "{dependency}", which is not in the conversion plan')
+
+        order: list[Phase] = []
+        done: set[str] = set()
+        pending = list(self.__phases.values())
+        while pending:
+            # the phases start in the order they were added, once their dependencies have finished
+            phase = next((phase for phase in pending if all(dependency in done for dependency in phase.depends)), None)
+            if phase is None:
+                Tf.RaiseCodingError(f"The conversion plan has circular dependencies between {sorted(phase.name for phase in pending)}")
+            order.append(phase)
+            done.add(phase.name)
+            pending.remove(phase)
+        return order
+
+    def run(self) -> dict[str, float]:
+        """Run every phase of the plan, returning the time each phase took in seconds."""
+        timings: dict[str, float] = {}
+        for phase in self.order():
+            start = time.perf_counter()
+            phase.run()
+            timings[phase.name] = time.perf_counter() - start
+            Tf.Status(f'Completed phase "{phase.name}" in {timings[phase.name]:.3f}s')
+        return timings
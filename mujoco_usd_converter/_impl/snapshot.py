@@ -0,0 +1,198 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+from typing import NamedTuple
+
+import mujoco
+import numpy as np
+
+__all__ = ["PHYSICS_MATERIAL_TOLERANCE", "SpecSnapshot", "get_physics_material_keys", "solref_to_stiffness_damping", "to_newton_angular_gain"]
+
+# the resolution at which physics material values are considered equal
+PHYSICS_MATERIAL_TOLERANCE = 1e-6
+
+# the fields read from each kind of spec element, as NumPy structured dtypes (enums are stored as their integer values)
+GEOM_FIELDS = [
+    ("type", np.int32),
+    ("contype", np.int32),
+    ("conaffinity", np.int32),
+    ("condim", np.int32),
+    ("group", np.int32),
+    ("priority", np.int32),
+    ("typeinertia", np.int32),
+    ("margin", np.float64),
+    ("gap", np.float64),
+    ("solmix", np.float64),
+    ("mass", np.float64),
+    ("density", np.float64),
+    ("friction", np.float64, (3,)),
+    ("solref", np.float64, (2,)),
+    ("solimp", np.float64, (5,)),
+]
+JOINT_FIELDS = [
+    ("type", np.int32),
+    ("group", np.int32),
+    ("actfrclimited", np.int32),
+    ("actgravcomp", np.bool_),
+    ("armature", np.float64),
+    ("frictionloss", np.float64),
+    ("margin", np.float64),
+    ("ref", np.float64),
+    ("springref", np.float64),
+    ("actfrcrange", np.float64, (2,)),
+    ("damping", np.float64, (3,)),
+    ("stiffness", np.float64, (3,)),
+    ("solimp_friction", np.float64, (5,)),
+    ("solimp_limit", np.float64, (5,)),
+    ("solref_friction", np.float64, (2,)),
+    ("solref_limit", np.float64, (2,)),
+    ("springdamper", np.float64, (2,)),
+]
+ACTUATOR_FIELDS = [
+    ("trntype", np.int32),
+    ("group", np.int32),
+    ("actdim", np.int32),
+    ("actearly", np.bool_),
+    ("actlimited", np.int32),
+    ("ctrllimited", np.int32),
+    ("forcelimited", np.int32),
+    ("biastype", np.int32),
+    ("dyntype", np.int32),
+    ("gaintype", np.int32),
+    ("cranklength", np.float64),
+    ("inheritrange", np.float64),
+    ("actrange", np.float64, (2,)),
+    ("ctrlrange", np.float64, (2,)),
+    ("forcerange", np.float64, (2,)),
+    ("lengthrange", np.float64, (2,)),
+    ("biasprm", np.float64, (10,)),
+    ("dynprm", np.float64, (10,)),
+    ("gainprm", np.float64, (10,)),
+    ("gear", np.float64, (6,)),
+]
+TENDON_FIELDS = [
+    ("group", np.int32),
+    ("limited", np.int32),
+    ("actfrclimited", np.int32),
+    ("armature", np.float64),
+    ("frictionloss", np.float64),
+    ("margin", np.float64),
+    ("width", np.float64),
+    ("stiffness", np.float64, (3,)),
+    ("damping", np.float64, (3,)),
+    ("springlength", np.float64, (2,)),
+    ("range", np.float64, (2,)),
+    ("actfrcrange", np.float64, (2,)),
+    ("solref_friction", np.float64, (2,)),
+    ("solimp_friction", np.float64, (5,)),
+    ("solref_limit", np.float64, (2,)),
+    ("solimp_limit", np.float64, (5,)),
+    ("rgba", np.float32, (4,)),
+]
+
+# the values derived from the geom and joint fields, which are computed for all elements at once
+GEOM_DERIVED_FIELDS = [("stiffness", np.float64), ("damping", np.float64), ("material_key", np.float64, (5,))]
+JOINT_DERIVED_FIELDS = [("newton_damping", np.float64)]
+
+
+class SpecSnapshot:
+    """
+    The numeric fields of every geom, joint, actuator and tendon of a spec, gathered in one pass.
+
+    Each kind of element is extracted into a NumPy structured array, with one row per element and
+    one column per field, and the values derived from those fields (e.g. the physics material of a
+    geom) are computed for all rows at once. Reading a structured array one row at a time is no
+    cheaper than reading the spec, so each row is also held as a record of plain Python values,
+    which the converters read in place of the spec element.
+    """
+
+    def __init__(self, spec: mujoco.MjSpec):
+        bodies = spec.bodies
+        # listing the children of each body is much faster than the flattened lists of the spec
+        geoms = [geom for body in bodies for geom in body.geoms]
+        joints = [joint for body in bodies for joint in body.joints]
+
+        self.geoms = gather(geoms, GEOM_FIELDS, GEOM_DERIVED_FIELDS)
+        stiffness, damping = solref_to_stiffness_damping(self.geoms["solref"])
+        self.geoms["stiffness"] = stiffness
+        self.geoms["damping"] = damping
+        self.geoms["material_key"] = get_physics_material_keys(np.column_stack([self.geoms["friction"], stiffness, damping]))
+
+        self.joints = gather(joints, JOINT_FIELDS, JOINT_DERIVED_FIELDS)
+        self.joints["newton_damping"] = to_newton_angular_gain(self.joints["type"], self.joints["damping"][:, 0])
+
+        self.actuators = gather(spec.actuators, ACTUATOR_FIELDS)
+        self.tendons = gather(spec.tendons, TENDON_FIELDS)
+
+        # The element wrappers hash by identity, see ModelIndex for why holding them keeps that stable.
+        self.__geoms = get_records("GeomRecord", geoms, self.geoms)
+        self.__joints = get_records("JointRecord", joints, self.joints)
+        self.__actuators = get_records("ActuatorRecord", spec.actuators, self.actuators)
+        self.__tendons = get_records("TendonRecord", spec.tendons, self.tendons)
+
+    def geom(self, geom: mujoco.MjsGeom) -> tuple:
+        """The fields of a geom, and its ``stiffness``, ``damping`` and physics ``material_key``."""
+        return self.__geoms[geom]
+
+    def joint(self, joint: mujoco.MjsJoint) -> tuple:
+        """The fields of a joint, and its ``newton_damping``."""
+        return self.__joints[joint]
+
+    def actuator(self, actuator: mujoco.MjsActuator) -> tuple:
+        """The fields of an actuator."""
+        return self.__actuators[actuator]
+
+    def tendon(self, tendon: mujoco.MjsTendon) -> tuple:
+        """The fields of a tendon."""
+        return self.__tendons[tendon]
+
+
+def gather(elements: list, fields: list[tuple], derived_fields: list[tuple] = ()) -> np.ndarray:
+    """Extract the fields of a list of spec elements into a structured array, leaving the derived fields zeroed."""
+    array = np.zeros(len(elements), dtype=[*fields, *derived_fields])
+    if elements:
+        for name, *_ in fields:
+            array[name] = [getattr(element, name) for element in elements]
+    return array
+
+
+def get_records(typename: str, elements: list, array: np.ndarray) -> dict[object, tuple]:
+    """Map each spec element to its row of a structured array, as a named tuple of Python values."""
+    record = NamedTuple(typename, [(name, object) for name in array.dtype.names])
+    columns = [array[name].tolist() for name in array.dtype.names]
+    return {element: record(*values) for element, values in zip(elements, zip(*columns))}
+
+
+def solref_to_stiffness_damping(solref: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Convert MuJoCo solref (timeconst, dampratio) rows to Newton stiffness and damping."""
+    timeconst, dampratio = solref[:, 0], solref[:, 1]
+    direct = (timeconst < 0.0) & (dampratio < 0.0)
+    invalid = ~direct & ((timeconst <= 0.0) | (dampratio <= 0.0))
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        stiffness = 1.0 / (timeconst * timeconst * dampratio * dampratio)
+        damping = 2.0 / timeconst
+    stiffness = np.where(direct, -timeconst, np.where(invalid, -np.inf, stiffness))
+    damping = np.where(direct, -dampratio, np.where(invalid, -np.inf, damping))
+    return stiffness, damping
+
+
+def get_physics_material_keys(values: np.ndarray) -> np.ndarray:
+    """
+    Quantize rows of (sliding, torsional, rolling, stiffness, damping) physics material values for deduplication.
+
+    The material attributes are single precision, so values are rounded to float first, which
+    makes materials that would author identical attributes share a key. The remaining precision
+    is quantized to ``PHYSICS_MATERIAL_TOLERANCE``.
+    """
+    authored = values.astype(np.float32).astype(np.float64)
+    # infinite values (e.g. from a non-positive solref) stay infinite, and so compare equal
+    return np.round(authored / PHYSICS_MATERIAL_TOLERANCE)
+
+
+def to_newton_angular_gain(joint_types: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Convert MuJoCo per-radian gains to the per-degree convention used by NewtonJointAPI.
+
+    MuJoCo authors angular gains per radian, while the NewtonJointAPI attributes are per
+    degree. Linear DOFs are unaffected.
+    """
+    angular = np.isin(joint_types, (int(mujoco.mjtJoint.mjJNT_HINGE), int(mujoco.mjtJoint.mjJNT_BALL)))
+    return np.where(angular, values * (np.pi / 180.0), values)
@@ -35,30 +35,29 @@ def get_tendon_name(tendon: mujoco.MjsTendon) -> str:
 def convert_tendon(parent: Usd.Prim, name: str, tendon: mujoco.MjsTendon, data: ConversionData) -> Usd.Prim:
     tendon_prim: Usd.Prim = parent.GetStage().DefinePrim(parent.GetPath().AppendChild(name))
     tendon_prim.SetTypeName("MjcTendon")
-
-    set_schema_attribute(tendon_prim, "mjc:stiffness", tendon.stiffness[0])
-    set_schema_attribute(tendon_prim, "mjc:springlength", Vt.DoubleArray(tendon.springlength))
-    set_schema_attribute(tendon_prim, "mjc:damping", tendon.damping[0])
-    set_schema_attribute(tendon_prim, "mjc:frictionloss", tendon.frictionloss)
-    set_schema_attribute(tendon_prim, "mjc:solreffriction", Vt.DoubleArray(tendon.solref_friction))
-    set_schema_attribute(tendon_prim, "mjc:solimpfriction", Vt.DoubleArray(tendon.solimp_friction))
-    set_schema_attribute(tendon_prim, "mjc:armature", tendon.armature)
-    set_schema_attribute(tendon_prim, "mjc:limited", mj_limited_to_token(tendon.limited))
-    set_schema_attribute(tendon_prim, "mjc:actuatorfrclimited", mj_limited_to_token(tendon.actfrclimited))
-    set_schema_attribute(tendon_prim, "mjc:range:min", tendon.range[0])
-    set_schema_attribute(tendon_prim, "mjc:range:max", tendon.range[1])
-    set_schema_attribute(tendon_prim, "mjc:actuatorfrcrange:min", tendon.actfrcrange[0])
-    set_schema_attribute(tendon_prim, "mjc:actuatorfrcrange:max", tendon.actfrcrange[1])
-    set_schema_attribute(tendon_prim, "mjc:margin", tendon.margin)
-    set_schema_attribute(tendon_prim, "mjc:solreflimit", Vt.DoubleArray(tendon.solref_limit))
-    set_schema_attribute(tendon_prim, "mjc:solimplimit", Vt.DoubleArray(tendon.solimp_limit))
+    fields = data.get_spec_snapshot().tendon(tendon)
+
+    set_schema_attribute(tendon_prim, "mjc:stiffness", fields.stiffness[0])
+    set_schema_attribute(tendon_prim, "mjc:springlength", Vt.DoubleArray(fields.springlength))
+    set_schema_attribute(tendon_prim, "mjc:damping", fields.damping[0])
+    set_schema_attribute(tendon_prim, "mjc:frictionloss", fields.frictionloss)
+    set_schema_attribute(tendon_prim, "mjc:solreffriction", Vt.DoubleArray(fields.solref_friction))
+    set_schema_attribute(tendon_prim, "mjc:solimpfriction", Vt.DoubleArray(fields.solimp_friction))
+    set_schema_attribute(tendon_prim, "mjc:armature", fields.armature)
+    set_schema_attribute(tendon_prim, "mjc:limited", mj_limited_to_token(fields.limited))
+    set_schema_attribute(tendon_prim, "mjc:actuatorfrclimited", mj_limited_to_token(fields.actfrclimited))
+    set_schema_attribute(tendon_prim, "mjc:range:min", fields.range[0])
+    set_schema_attribute(tendon_prim, "mjc:range:max", fields.range[1])
+    set_schema_attribute(tendon_prim, "mjc:actuatorfrcrange:min", fields.actfrcrange[0])
+    set_schema_attribute(tendon_prim, "mjc:actuatorfrcrange:max", fields.actfrcrange[1])
+    set_schema_attribute(tendon_prim, "mjc:margin", fields.margin)
+    set_schema_attribute(tendon_prim, "mjc:solreflimit", Vt.DoubleArray(fields.solref_limit))
+    set_schema_attribute(tendon_prim, "mjc:solimplimit", Vt.DoubleArray(fields.solimp_limit))
 
     # visual
-    set_schema_attribute(
-        tendon_prim, "mjc:rgba", Gf.Vec4f(float(tendon.rgba[0]), float(tendon.rgba[1]), float(tendon.rgba[2]), float(tendon.rgba[3]))
-    )
-    set_schema_attribute(tendon_prim, "mjc:width", tendon.width)
-    set_schema_attribute(tendon_prim, "mjc:group", tendon.group)
+    set_schema_attribute(tendon_prim, "mjc:rgba", Gf.Vec4f(*fields.rgba))
+    set_schema_attribute(tendon_prim, "mjc:width", fields.width)
+    set_schema_attribute(tendon_prim, "mjc:group", fields.group)
 
     # path
     divisors = [1.0]
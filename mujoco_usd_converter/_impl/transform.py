@@ -0,0 +1,214 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import mujoco
+import numpy as np
+from pxr import Gf
+
+__all__ = ["SpecTransforms", "multiply_transforms_preserve_scale"]
+
+# geom types which may be positioned and oriented by fromto
+FROMTO_GEOM_TYPES = (mujoco.mjtGeom.mjGEOM_CAPSULE, mujoco.mjtGeom.mjGEOM_CYLINDER, mujoco.mjtGeom.mjGEOM_BOX, mujoco.mjtGeom.mjGEOM_ELLIPSOID)
+
+# the length below which Gf treats a vector as zero
+MIN_VECTOR_LENGTH = 1e-10
+
+
+class SpecTransforms:
+    """
+    The local transforms of every body, geom, site and mesh of a spec, resolved together.
+
+    The table is built once per conversion. The position, orientation (of any alternative type),
+    fromto and scale of every element are gathered into NumPy arrays and resolved in bulk, and the
+    rotations are canonicalized through ``Gf`` once per distinct orientation rather than once per
+    prim. The frames elements are within, including nested frames, are composed once per frame.
+
+    The result is exactly what composing each element through ``Gf.Transform`` gives, so authoring
+    a prim which has no transform of its own only needs a lookup. A prim which already has one
+    (e.g. via a reference) is composed with it through :meth:`compose`.
+    """
+
+    def __init__(self, spec: mujoco.MjSpec):
+        bodies = spec.bodies
+        # listing the children of each body is much faster than the flattened lists of the spec
+        elements = [*bodies, *(geom for body in bodies for geom in body.geoms), *(site for body in bodies for site in body.sites), *spec.meshes]
+        # The element wrappers hash by identity, see ModelIndex for why holding them keeps that stable.
+        self.__rows: dict[object, int] = {element: i for i, element in enumerate(elements)}
+
+        count = len(elements)
+        pos = np.zeros((count, 3))
+        quat = np.tile([1.0, 0.0, 0.0, 0.0], (count, 1))
+        scale = np.ones((count, 3))
+        fromto = np.full((count, 6), np.nan)
+        # the frames are resolved lazily, as only some of the elements are within one
+        self.__spec = spec
+        self.__framed: set[int] = set()
+        self.__frame_transforms: dict[mujoco.MjsFrame, Gf.Transform] = {}
+        for i, element in enumerate(elements):
+            if isinstance(element, mujoco.MjsMesh):
+                pos[i] = element.refpos
+                quat[i] = element.refquat
+                scale[i] = element.scale
+                continue
+            pos[i] = element.pos
+            quat[i] = get_orientation(element, spec)
+            if isinstance(element, mujoco.MjsGeom) and element.type in FROMTO_GEOM_TYPES:
+                fromto[i] = element.fromto
+            if element.frame is not None:
+                self.__framed.add(i)
+
+        # fromto overrides position and orientation
+        valid = ~np.isnan(fromto[:, 0])
+        start, end = fromto[valid, :3], fromto[valid, 3:]
+        pos[valid] = (end + start) / 2
+        quat[valid] = vec_to_quat(end - start)
+
+        self.__pos = pos.tolist()
+        self.__scale = scale.tolist()
+        # orientations are authored in single precision, and many elements share the same orientation
+        quats = quat.astype(np.float32)
+        self.__rotations: dict[bytes, Gf.Rotation] = {}
+        self.__orients: dict[bytes, Gf.Quatf] = {}
+        self.__quats: dict[bytes, Gf.Quatf] = {}
+        self.__keys = [row.tobytes() for row in quats]
+        for key, row in zip(self.__keys, quats.tolist()):
+            if key not in self.__rotations:
+                self.__quats[key] = normalized = get_quatf(row)
+                self.__rotations[key] = rotation = Gf.Rotation(normalized)
+                self.__orients[key] = get_orient(Gf.Transform(Gf.Matrix4d().SetRotate(rotation)))
+
+    def get_frame_transform(self, mjc_object) -> Gf.Transform | None:
+        """
+        Return the transform of the frame a spec element is within, relative to its parent body, or ``None`` if it is not within a frame.
+
+        Nested frames are composed from the outermost frame inwards. Each frame is resolved once and
+        shared by every element within it, or within any frame nested inside it.
+        """
+        if (frame := mjc_object.frame) is None:
+            return None
+        if (transform := self.__frame_transforms.get(frame)) is not None:
+            return transform
+
+        # walk up to the outermost frame which has not been resolved yet, then compose back down
+        chain = []
+        while frame is not None and frame not in self.__frame_transforms:
+            chain.append(frame)
+            frame = frame.frame
+        parent = self.__frame_transforms.get(frame) if frame is not None else None
+        for frame in reversed(chain):
+            transform = Gf.Transform()
+            transform.SetTranslation(Gf.Vec3d(*frame.pos.tolist()))
+            transform.SetRotation(Gf.Rotation(get_quatf(get_orientation(frame, self.__spec))))
+            if parent is not None:
+                transform = multiply_transforms_preserve_scale(transform, parent)
+            self.__frame_transforms[frame] = parent = transform
+        return parent
+
+    def resolve(self, element) -> tuple[Gf.Vec3d, Gf.Quatf, Gf.Vec3d]:
+        """Return the translation, orientation and scale of a spec element, relative to its parent body."""
+        row = self.__rows[element]
+        if row in self.__framed:
+            return self.compose(element, Gf.Transform())
+        return Gf.Vec3d(*self.__pos[row]), self.__orients[self.__keys[row]], Gf.Vec3d(*self.__scale[row])
+
+    def to_body(self, element, pos: Gf.Vec3d, quat: Gf.Quatd) -> tuple[Gf.Vec3d, Gf.Quatf]:
+        """
+        Return a pose given in the frame of a spec element, relative to its parent body instead.
+
+        The orientations are multiplied as quaternions, as the compiler does, so the result has the same sign as the compiled model.
+        """
+        row = self.__rows[element]
+        translation = Gf.Vec3d(*self.__pos[row])
+        rotation = Gf.Quatd(self.__quats[self.__keys[row]])
+        if row in self.__framed:
+            frame = self.get_frame_transform(element)
+            translation = frame.GetMatrix().Transform(translation)
+            rotation = frame.GetRotation().GetQuat() * rotation
+        return translation + rotation.Transform(pos), Gf.Quatf((rotation * quat).GetNormalized())
+
+    def compose(self, element, current: Gf.Transform) -> tuple[Gf.Vec3d, Gf.Quatf, Gf.Vec3d]:
+        """Return the translation, orientation and scale of a spec element, composed with the current transform of its prim."""
+        row = self.__rows[element]
+        frame = self.get_frame_transform(element) if row in self.__framed else None
+        local = multiply_transforms_preserve_scale(frame or Gf.Transform(), current)
+        transform = Gf.Transform()
+        transform.SetTranslation(Gf.Vec3d(*self.__pos[row]))
+        transform.SetRotation(self.__rotations[self.__keys[row]])
+        final = multiply_transforms_preserve_scale(transform, local)
+        return final.GetTranslation(), get_orient(final), Gf.CompMult(Gf.Vec3d(*self.__scale[row]), local.GetScale())
+
+
+def get_orientation(mjc_object: mujoco.MjsBody | mujoco.MjsGeom | mujoco.MjsSite | mujoco.MjsFrame, spec: mujoco.MjSpec) -> np.ndarray:
+    if mjc_object.alt.type == mujoco.mjtOrientation.mjORIENTATION_QUAT:
+        return mjc_object.quat
+    return np.asarray(spec.resolve_orientation(degree=spec.compiler.degree, sequence=spec.compiler.eulerseq, orientation=mjc_object.alt))
+
+
+def get_quatf(quat) -> Gf.Quatf:
+    return Gf.Quatf(float(quat[0]), Gf.Vec3f(float(quat[1]), float(quat[2]), float(quat[3]))).GetNormalized()
+
+
+def get_orient(transform: Gf.Transform) -> Gf.Quatf:
+    return Gf.Quatf(transform.GetRotation().GetQuat())
+
+
+def vec_to_quat(vec: np.ndarray) -> np.ndarray:
+    """
+    The rotations of the z axis onto each vector, or a half turn about x for vectors along z.
+
+    This follows the arithmetic of ``Gf.Vec3d``, operation for operation, so the result is identical.
+    """
+    x, y, z = vec.T
+    length = np.sqrt(x * x + y * y + z * z)
+    vec = vec * (1.0 / np.maximum(length, MIN_VECTOR_LENGTH))[:, None]
+    x, y, z = vec.T
+    # the cross product of the z axis and the vector
+    cross = np.stack((0 * z - 1 * y, 1 * x - 0 * z, 0 * y - 0 * x), axis=-1)
+    sin = np.sqrt(cross[:, 0] * cross[:, 0] + cross[:, 1] * cross[:, 1] + cross[:, 2] * cross[:, 2])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cross = cross * (1.0 / sin)[:, None]
+    half = np.arctan2(sin, z)[:, None] / 2.0
+    quat = np.concatenate((np.cos(half), cross * np.sin(half)), axis=-1)
+    return np.where((sin < MIN_VECTOR_LENGTH)[:, None], [0.0, 1.0, 0.0, 0.0], quat)
+
+
+def multiply_transforms_preserve_scale(transform1: Gf.Transform, transform2: Gf.Transform) -> Gf.Transform:
+    """
+    Multiply two Gf.Transform objects while preserving non-uniform scales.
+
+    This function uses matrix multiplication but then carefully decomposes the result
+    to extract and preserve the non-uniform scale components that would otherwise
+    be lost or corrupted in standard matrix decomposition.
+
+    Args:
+        transform1: The first transform (applied second in the composition)
+        transform2: The second transform (applied first in the composition)
+
+    Returns:
+        A new Gf.Transform representing transform1 * transform2 with preserved scales
+    """
+    # Extract scale components before matrix multiplication
+    s1 = transform1.GetScale()
+    s2 = transform2.GetScale()
+
+    # Create transforms without scale for matrix multiplication
+    transform1_no_scale = Gf.Transform()
+    transform1_no_scale.SetTranslation(transform1.GetTranslation())
+    transform1_no_scale.SetRotation(transform1.GetRotation())
+
+    transform2_no_scale = Gf.Transform()
+    transform2_no_scale.SetTranslation(transform2.GetTranslation())
+    transform2_no_scale.SetRotation(transform2.GetRotation())
+
+    # Multiply the transforms without scale using standard matrix multiplication
+    result_no_scale = transform1_no_scale * transform2_no_scale
+
+    # Compute the combined scale (component-wise multiplication)
+    combined_scale = Gf.CompMult(s1, s2)
+
+    # Create the final result with the preserved scale
+    result = Gf.Transform()
+    result.SetTranslation(result_no_scale.GetTranslation())
+    result.SetRotation(result_no_scale.GetRotation())
+    result.SetScale(combined_scale)
+
+    return result
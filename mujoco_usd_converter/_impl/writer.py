@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import pathlib
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import usdex.core
+from pxr import Sdf, Tf, Usd
+
+__all__ = ["LayerWriter"]
+
+
+class LayerWriter:
+    """
+    Write the layers and files of a conversion concurrently.
+
+    Files which are copied verbatim (e.g. textures) are copied on a pool of threads as soon as they
+    are requested, so the copies overlap with the authoring which continues on the calling thread.
+    Stages are only queued for saving, and :meth:`flush` writes every dirty layer of every queued
+    stage at once. The USD serializers and file copies release the GIL, so the writes proceed in
+    parallel.
+
+    Each layer is annotated and saved exactly as ``usdex.core.saveStage`` would, with the comment
+    of the first queued stage it contributes to.
+    """
+
+    def __init__(self):
+        self.__executor: ThreadPoolExecutor | None = None
+        self.__copies: dict[pathlib.Path, tuple[pathlib.Path, Future]] = {}
+        self.__stages: list[tuple[Usd.Stage, str]] = []
+
+    def copy_file(self, source: pathlib.Path, destination: pathlib.Path) -> None:
+        """Start copying a file in the background. The copy is complete once :meth:`flush` returns."""
+        if destination in self.__copies:
+            previous, future = self.__copies[destination]
+            if previous == source:
+                return
+            # the last copy to a destination wins, as it would when copying serially
+            future.result()
+        self.__copies[destination] = (source, self.__get_executor().submit(shutil.copyfile, source, destination))
+
+    def save_stage(self, stage: Usd.Stage, comment: str) -> None:
+        """Queue the dirty layers of a stage to be saved by :meth:`flush`, with the given comment."""
+        self.__stages.append((stage, comment))
+
+    def flush(self) -> None:
+        """Save the dirty layers of all queued stages in parallel, and wait for them and any file copies to finish."""
+        layers: dict[Sdf.Layer, str] = {}
+        for stage, comment in self.__stages:
+            for layer in stage.GetUsedLayers():
+                if layer.dirty and not layer.anonymous:
+                    layers.setdefault(layer, comment)
+        self.__stages.clear()
+        copies, self.__copies = self.__copies, {}
+
+        executor = self.__get_executor()
+        saves = [(layer, executor.submit(usdex.core.saveLayer, layer, comment=comment)) for layer, comment in layers.items()]
+        try:
+            for destination, (source, future) in copies.items():
+                future.result()
+                Tf.Status(f"Copied {source} to {destination}")
+            for layer, future in saves:
+                if not future.result():
+                    Tf.RaiseRuntimeError(f'Failed to save layer "{layer.identifier}"')
+        finally:
+            executor.shutdown()
+            self.__executor = None
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(thread_name_prefix="mujoco-usd-writer")
+        return self.__executor
@@ -2,12 +2,14 @@
 # SPDX-License-Identifier: Apache-2.0
 import pathlib
 
+import mujoco
 import omni.asset_validator
 import usdex.core
 import usdex.test
 from pxr import Kind, Sdf, Tf, Usd, UsdGeom, UsdPhysics, UsdShade
 
 import mujoco_usd_converter
+from mujoco_usd_converter._impl.mesh import get_mesh_name
 from tests.util.ConverterTestCase import ConverterTestCase
 
 
@@ -164,16 +166,29 @@ class TestAssetStructure(ConverterTestCase):
         geom_scope = UsdGeom.Scope(geometry_stage.GetDefaultPrim().GetChild("Geometry"))
         self.assertTrue(geom_scope)
 
+        # the library meshes which share a file with an earlier mesh
+        spec = mujoco.MjSpec.from_file(model.as_posix())
+        files = [mesh.file for mesh in spec.meshes]
+        shared = {get_mesh_name(mesh) for i, mesh in enumerate(spec.meshes) if mesh.file in files[:i]}
+        self.assertEqual(shared, {"box"})
+
         # Test that all descendant prims which are meshes are references
-        for prim in geometry_stage.TraverseAll():
-            if prim.IsA(UsdGeom.Mesh):
-                self.assertTrue(prim.HasAuthoredReferences(), f"Mesh {prim.GetPath()} should be a reference")
-                prim_specs: list[Sdf.PrimSpec] = prim.GetPrimStack()
+        meshes = [prim for prim in geometry_stage.TraverseAll() if prim.IsA(UsdGeom.Mesh)]
+        self.assertEqual(sorted(prim.GetName() for prim in meshes), ["ObjBox", "StlBox", "box"])
+        for prim in meshes:
+            self.assertTrue(prim.HasAuthoredReferences(), f"Mesh {prim.GetPath()} should be a reference")
+            prim_specs: list[Sdf.PrimSpec] = prim.GetPrimStack()
+            self.assertEqual(prim_specs[0].layer.identifier, (parent_path / pathlib.Path("./Payload/Geometry.usda")).as_posix())
+            self.assertEqual(prim_specs[0].path, prim.GetPath())
+            self.assertEqual(prim_specs[1].layer.identifier, (parent_path / pathlib.Path("./Payload/GeometryLibrary.usdc")).as_posix())
+            self.assertEqual(prim_specs[1].path, f"/Geometry/{prim.GetName()}")
+            # meshes sharing a file with an earlier mesh reference its library prim within the same layer
+            if prim.GetName() in shared:
+                self.assertEqual(len(prim_specs), 3)
+                self.assertEqual(prim_specs[2].layer, prim_specs[1].layer)
+                self.assertNotEqual(prim_specs[2].path, prim_specs[1].path)
+            else:
                 self.assertEqual(len(prim_specs), 2)
-                self.assertEqual(prim_specs[0].layer.identifier, (parent_path / pathlib.Path("./Payload/Geometry.usda")).as_posix())
-                self.assertEqual(prim_specs[0].path, prim.GetPath())
-                self.assertEqual(prim_specs[1].layer.identifier, (parent_path / pathlib.Path("./Payload/GeometryLibrary.usdc")).as_posix())
-                self.assertEqual(prim_specs[1].path, f"/Geometry/{prim.GetName()}")
 
     def test_materials_layer(self):
         model = pathlib.Path("./tests/data/physics_materials.xml")
@@ -230,6 +245,39 @@ class TestAssetStructure(ConverterTestCase):
                 self.assertEqual(prim.GetAppliedSchemas(), [])
                 self.assertEqual(prim.GetPropertyNames(), [])
 
+    def test_prune_unused_assets(self):
+        model = pathlib.Path("./tests/data/unused_assets.xml")
+
+        # by default every mesh and material is converted
+        asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model, self.tmpDir("all"))
+        parent_path = pathlib.Path(asset.path).parent
+        geometry_library = Sdf.Layer.FindOrOpen((parent_path / "Payload/GeometryLibrary.usdc").as_posix())
+        self.assertEqual(
+            [x.name for x in geometry_library.GetPrimAtPath("/Geometry").nameChildren],
+            ["UsedMesh", "FittedMesh", "UnusedMesh", "UnusedInlineMesh"],
+        )
+        materials_library = Sdf.Layer.FindOrOpen((parent_path / "Payload/MaterialsLibrary.usdc").as_posix())
+        self.assertEqual(
+            [x.name for x in materials_library.GetPrimAtPath("/Materials").nameChildren],
+            ["GeomMaterial", "SiteMaterial", "UnusedMaterial"],
+        )
+        self.assertTrue((parent_path / "Payload/Textures/grid.png").exists())
+
+        # only meshes instanced by mesh geoms, and materials bound to geoms or sites, are converted
+        asset: Sdf.AssetPath = mujoco_usd_converter.Converter(prune_unused_assets=True).convert(model, self.tmpDir("pruned"))
+        stage: Usd.Stage = Usd.Stage.Open(asset.path)
+        self.assertIsValidUsd(stage)
+        parent_path = pathlib.Path(asset.path).parent
+        geometry_library = Sdf.Layer.FindOrOpen((parent_path / "Payload/GeometryLibrary.usdc").as_posix())
+        self.assertEqual([x.name for x in geometry_library.GetPrimAtPath("/Geometry").nameChildren], ["UsedMesh"])
+        materials_library = Sdf.Layer.FindOrOpen((parent_path / "Payload/MaterialsLibrary.usdc").as_posix())
+        self.assertEqual([x.name for x in materials_library.GetPrimAtPath("/Materials").nameChildren], ["GeomMaterial", "SiteMaterial"])
+        self.assertFalse((parent_path / "Payload/Textures").exists())
+
+        # the fitted primitive does not need the library mesh
+        fitted = stage.GetPrimAtPath("/unused_assets/Geometry/body/Box")
+        self.assertTrue(fitted.IsA(UsdGeom.Cube))
+
     def test_physics_layer(self):
         model = pathlib.Path("./tests/data/simple_actuator.xml")
         model_name = pathlib.Path(model).stem
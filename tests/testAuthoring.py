@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+from pxr import Sdf, Tf, Usd, UsdPhysics
+
+from mujoco_usd_converter._impl.authoring import PrimOverride, author_overrides
+from mujoco_usd_converter._impl.utils import set_schema_attribute
+from tests.util.ConverterTestCase import ConverterTestCase
+
+
+class TestAuthorOverrides(ConverterTestCase):
+    def test_matches_usd(self):
+        # authoring through Usd, as the converter used to
+        expected: Usd.Stage = Usd.Stage.CreateInMemory()
+        prim: Usd.Prim = expected.OverridePrim("/Root/Geom")
+        UsdPhysics.CollisionAPI.Apply(prim)
+        prim.ApplyAPI("MjcCollisionAPI")
+        set_schema_attribute(prim, "mjc:condim", 4)
+        set_schema_attribute(prim, "mjc:priority", 0)
+        prim.GetAttribute("mjc:solref").Set([0.02, 1])
+        UsdPhysics.MassAPI.Apply(prim).CreateMassAttr().Set(2.0)
+        prim.ApplyAPI("MaterialBindingAPI")
+        prim.CreateRelationship("material:binding:physics", custom=False).SetTargets([Sdf.Path("/Root/Material")])
+
+        override = PrimOverride(Sdf.Path("/Root/Geom"), ["PhysicsCollisionAPI", "MjcCollisionAPI"])
+        override.set_attribute("mjc:condim", 4)
+        override.set_attribute("mjc:priority", 0)
+        override.set_attribute("mjc:solref", [0.02, 1], force=True)
+        override.apply_schema("PhysicsMassAPI")
+        override.set_attribute("physics:mass", 2.0, force=True)
+        override.apply_schema("MaterialBindingAPI")
+        override.set_target("material:binding:physics", Sdf.Path("/Root/Material"))
+        actual: Usd.Stage = Usd.Stage.CreateInMemory()
+        author_overrides(actual, [override])
+
+        self.assertEqual(actual.GetRootLayer().ExportToString(), expected.GetRootLayer().ExportToString())
+        # the stage recomposed with the new opinions
+        prim = actual.GetPrimAtPath("/Root/Geom")
+        self.assertTrue(prim.HasAPI(UsdPhysics.CollisionAPI))
+        self.assertEqual(prim.GetAttribute("mjc:condim").Get(), 4)
+        self.assertFalse(prim.GetAttribute("mjc:priority").HasAuthoredValue())
+
+    def test_existing_prim(self):
+        stage: Usd.Stage = Usd.Stage.CreateInMemory()
+        prim: Usd.Prim = stage.DefinePrim("/Root/Geom", "Cube")
+        prim.ApplyAPI("MjcImageableAPI")
+
+        override = PrimOverride(prim.GetPath(), ["MjcImageableAPI"])
+        override.set_attribute("mjc:group", 3)
+        author_overrides(stage, [override])
+
+        self.assertEqual(prim.GetTypeName(), "Cube")
+        self.assertEqual(prim.GetAppliedSchemas(), ["MjcImageableAPI"])
+        self.assertEqual(prim.GetAttribute("mjc:group").Get(), 3)
+
+    def test_invalid_attribute(self):
+        override = PrimOverride(Sdf.Path("/Root/Geom"), ["MjcImageableAPI"])
+        with self.assertRaises(Tf.ErrorException):
+            override.set_attribute("mjc:condim", 3)
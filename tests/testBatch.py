@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import json
+import pathlib
+
+import usdex.core
+import usdex.test
+from pxr import Tf
+
+import mujoco_usd_converter
+from mujoco_usd_converter._impl.batch import convert_batch, convert_model
+from tests.util.ConverterTestCase import ConverterTestCase
+
+
+class TestBatch(ConverterTestCase):
+    def test_convert_model(self):
+        output_dir = pathlib.Path(self.tmpDir())
+        converter = mujoco_usd_converter.Converter()
+        with usdex.test.ScopedDiagnosticChecker(
+            self,
+            [(Tf.TF_DIAGNOSTIC_WARNING_TYPE, ".*will discard textures at render time")],
+            level=usdex.core.DiagnosticsLevel.eWarning,
+        ):
+            result = convert_model(converter, pathlib.Path("tests/data/materials.xml"), output_dir / "materials")
+        self.assertEqual(result.status, "converted")
+        self.assertTrue(pathlib.Path(result.asset).exists())
+        self.assertIsNone(result.error)
+        self.assertIn("write", result.timings)
+        self.assertGreater(result.seconds, 0.0)
+        # the warnings are captured with the result
+        self.assertTrue(any(x["level"] == "warning" and "will discard textures" in x["message"] for x in result.diagnostics))
+        self.assertEqual(json.loads(result.to_json())["diagnostics"], result.diagnostics)
+
+        broken = output_dir / "broken.xml"
+        broken.write_text('<mujoco><worldbody><geom type="unknown"/></worldbody></mujoco>')
+        result = convert_model(converter, broken, output_dir / "broken")
+        self.assertEqual(result.status, "failed")
+        self.assertIsNone(result.asset)
+        self.assertIn("unknown", result.error)
+        # the timings of the previous model are not reported for a failed one
+        self.assertEqual(result.timings, {})
+
+    def test_convert_batch(self):
+        output_dir = pathlib.Path(self.tmpDir())
+        models = [(pathlib.Path(f"tests/data/{name}.xml"), output_dir / name) for name in ("geoms", "meshes", "actuators")]
+        results = list(convert_batch(models, mujoco_usd_converter.Converter.Params(), jobs=2))
+        self.assertEqual(sorted(result.input for result in results), sorted(model.as_posix() for model, _ in models))
+        for result in results:
+            self.assertEqual(result.status, "converted", result.error)
+            self.assertTrue(pathlib.Path(result.asset).exists())
+            self.assertTrue(result.asset.startswith(result.output))
+            self.assertIn("bodies", result.timings)
+
+    def test_timeout(self):
+        output_dir = pathlib.Path(self.tmpDir())
+        models = [(pathlib.Path(f"tests/data/{name}.xml"), output_dir / name) for name in ("meshes", "geoms")]
+        # the worker of a model which times out is replaced, so the following model is still attempted
+        results = list(convert_batch(models, mujoco_usd_converter.Converter.Params(), timeout=0.001))
+        self.assertEqual([result.input for result in results], [model.as_posix() for model, _ in models])
+        for result in results:
+            self.assertEqual(result.status, "timeout")
+            self.assertIsNone(result.asset)
+            self.assertEqual(result.seconds, 0.001)
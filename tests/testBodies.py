@@ -1,15 +1,16 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025-2026 The Newton Developers
 # SPDX-License-Identifier: Apache-2.0
 import pathlib
+import sys
 
 import mujoco
 import numpy as np
 import usdex.core
 import usdex.test
-from pxr import Gf, Sdf, Tf, Usd, UsdGeom, UsdPhysics
+from pxr import Gf, Sdf, Tf, Usd, UsdPhysics
 
 import mujoco_usd_converter
-from mujoco_usd_converter._impl.body import bake_body_mass, get_model_body_id
+from mujoco_usd_converter._impl.body import bake_body_masses, get_mass_bake_bodies
 from mujoco_usd_converter._impl.data import ConversionData
 from tests.util.ConverterTestCase import ConverterTestCase
 
@@ -59,6 +60,29 @@ class TestBodies(ConverterTestCase):
         body = UsdPhysics.RigidBodyAPI(prim)
         self.assertTrue(body.GetKinematicEnabledAttr().Get())
 
+    def test_long_chain(self):
+        # a chain of bodies attached to a mocap body, e.g. a rope, is deeper than the stack allows
+        depth = 250
+        chain = "".join(f'<body name="link{i}" pos="0 0 -0.01"><joint type="hinge"/><geom size="0.005"/>' for i in range(depth))
+        model = pathlib.Path(self.tmpDir()) / "chain.xml"
+        model.write_text(f'<mujoco model="chain"><worldbody><body name="anchor" mocap="true">{chain}{"</body>" * depth}</body></worldbody></mujoco>')
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(200)
+        try:
+            asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model, self.tmpDir("chain"))
+        finally:
+            sys.setrecursionlimit(limit)
+        stage: Usd.Stage = Usd.Stage.Open(asset.path)
+
+        anchor = stage.GetPrimAtPath("/chain/Geometry/anchor")
+        self.assertTrue(anchor.HasAPI(UsdPhysics.ArticulationRootAPI))
+        links = [prim for prim in Usd.PrimRange(anchor) if prim.HasAPI(UsdPhysics.RigidBodyAPI)]
+        self.assertEqual(len(links), depth + 1)
+        self.assertEqual(links[-1].GetName(), f"link{depth - 1}")
+        # the kinematic flag is inherited all the way down the chain
+        self.assertTrue(all(UsdPhysics.RigidBodyAPI(prim).GetKinematicEnabledAttr().Get() for prim in links))
+        self.assertFalse(any(prim.HasAPI(UsdPhysics.ArticulationRootAPI) for prim in links[1:]))
+
     def test_explicit_inertia_principal_axes(self):
         principal_prim = self.stage.GetPrimAtPath("/bodies/Geometry/explicit_inertia_principal")
         self.assertTrue(principal_prim.HasAPI(UsdPhysics.MassAPI))
@@ -210,6 +234,27 @@ class TestBodies(ConverterTestCase):
         self.assertTrue(prim.HasAPI(UsdPhysics.RigidBodyAPI))
         self.assertFalse(prim.HasAPI(UsdPhysics.MassAPI))
 
+    def test_mass_baked_with_background_compile(self):
+        """Compiling in the background bakes the same mass properties, and reports the same compile errors."""
+        model = pathlib.Path("./tests/data/bodies.xml")
+        asset: Sdf.AssetPath = mujoco_usd_converter.Converter(compile_in_background=True).convert(model, self.tmpDir("background"))
+        background: Usd.Stage = Usd.Stage.Open(asset.path)
+        self.assertIsValidUsd(background)
+        for prim in self.stage.Traverse():
+            if prim.HasAPI(UsdPhysics.MassAPI):
+                other = background.GetPrimAtPath(prim.GetPath())
+                for attr in prim.GetAttributes():
+                    if attr.GetNamespace() == "physics":
+                        self.assertEqual(other.GetAttribute(attr.GetName()).Get(), attr.Get(), attr.GetPath())
+
+        model = pathlib.Path("./tests/data/mass_bake_uncompilable.xml")
+        with usdex.test.ScopedDiagnosticChecker(
+            self,
+            [(Tf.TF_DIAGNOSTIC_WARNING_TYPE, "Unable to compile the model to bake mass for body 'uncompilable'.*")],
+            level=usdex.core.DiagnosticsLevel.eWarning,
+        ):
+            mujoco_usd_converter.Converter(compile_in_background=True).convert(model, self.tmpDir(model.stem))
+
     def test_mass_not_baked_for_a_body_outside_the_converted_spec(self):
         """Warn rather than bake when the spec being converted does not contain the body.
 
@@ -229,19 +274,50 @@ class TestBodies(ConverterTestCase):
             scene=False,
             comment="",
         )
-        compiled = data.get_model()
-        self.assertEqual(get_model_body_id(spec.body("a"), compiled, data), 1)
-        self.assertIsNone(get_model_body_id(other.body("b"), compiled, data))
+        index = data.get_model_index()
+        self.assertEqual(index.body_id(spec.body("a")), 1)
+        self.assertIsNone(index.body_id(other.body("b")))
 
-        stage: Usd.Stage = Usd.Stage.CreateInMemory()
-        prim: Usd.Prim = UsdGeom.Xform.Define(stage, "/body").GetPrim()
         with usdex.test.ScopedDiagnosticChecker(
             self,
             [(Tf.TF_DIAGNOSTIC_WARNING_TYPE, "Unable to locate body 'b' in the compiled model.*")],
             level=usdex.core.DiagnosticsLevel.eWarning,
         ):
-            bake_body_mass(other.body("b"), prim, data)
-        self.assertFalse(prim.HasAPI(UsdPhysics.MassAPI))
+            inertias = bake_body_masses([spec.body("a"), other.body("b")], data)
+        self.assertEqual(list(inertias), [spec.body("a")])
+
+    def test_mass_bake_bodies(self):
+        """Every body is checked at once, against the same rules as a body by body check."""
+        xml = """
+            <mujoco>
+              <compiler inertiagrouprange="0 3" {compiler}/>
+              <worldbody>
+                <geom name="world_visual" size="0.1" contype="0" conaffinity="0" mass="1"/>
+                <body name="visual_mass"><geom size="0.1" contype="0" conaffinity="0" mass="1"/></body>
+                <body name="visual_density"><geom size="0.1" contype="0" conaffinity="0"/></body>
+                <body name="visual_zero_mass"><geom size="0.1" contype="0" conaffinity="0" mass="0" density="1000"/></body>
+                <body name="visual_out_of_range"><geom size="0.1" contype="0" conaffinity="0" group="4"/></body>
+                <body name="collider"><geom size="0.1"/></body>
+                <body name="explicit"><inertial pos="0 0 0" mass="1" diaginertia="1 1 1"/><geom size="0.1" contype="0" conaffinity="0"/></body>
+                <body name="empty"/>
+              </worldbody>
+            </mujoco>
+            """
+        for compiler, expected in (("", ["visual_mass", "visual_density"]), ('inertiafromgeom="false"', [])):
+            with self.subTest(compiler=compiler):
+                spec = mujoco.MjSpec.from_string(xml.format(compiler=compiler))
+                data = ConversionData(
+                    spec=spec,
+                    model=None,
+                    content={},
+                    libraries={},
+                    references={},
+                    geom_targets={},
+                    name_cache=usdex.core.NameCache(),
+                    scene=False,
+                    comment="",
+                )
+                self.assertEqual([body.name for body in get_mass_bake_bodies(spec.bodies, data)], expected)
 
     def test_zero_inertia(self):
         zero_inertia_prim: Usd.Prim = self.stage.GetPrimAtPath("/bodies/Geometry/zero_inertia")
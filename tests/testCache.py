@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import os
+import pathlib
+import shutil
+from unittest.mock import patch
+
+import mujoco
+from pxr import Sdf, Usd, UsdPhysics
+
+import mujoco_usd_converter
+from mujoco_usd_converter._impl.cache import DiskCache, FileHashes, hash_file, hash_key
+from mujoco_usd_converter._impl.model import compile_model, get_model_cache_key
+from tests.util.ConverterTestCase import ConverterTestCase
+
+
+class TestDiskCache(ConverterTestCase):
+
+    def write_bytes(self, size: int):
+        def write(directory: pathlib.Path):
+            (directory / "data.bin").write_bytes(b"x" * size)
+
+        return write
+
+    def test_put_and_get(self):
+        cache = DiskCache(pathlib.Path(self.tmpDir()), max_bytes=1024)
+        self.assertIsNone(cache.get("abcdef"))
+        entry = cache.put("abcdef", self.write_bytes(10))
+        self.assertEqual(cache.get("abcdef"), entry)
+        self.assertEqual((entry / "data.bin").read_bytes(), b"x" * 10)
+
+    def test_first_publisher_wins(self):
+        cache = DiskCache(pathlib.Path(self.tmpDir()), max_bytes=1024)
+        first = cache.put("abcdef", self.write_bytes(10))
+        second = cache.put("abcdef", self.write_bytes(20))
+        self.assertEqual(first, second)
+        self.assertEqual((first / "data.bin").stat().st_size, 10)
+        # no staging directories are left behind
+        self.assertEqual(list((cache.root / "staging").iterdir()), [])
+
+    def test_evict_least_recently_used(self):
+        cache = DiskCache(pathlib.Path(self.tmpDir()), max_bytes=25)
+        for i, key in enumerate(("aa0001", "bb0002", "cc0003")):
+            entry = cache.put(key, self.write_bytes(10))
+            os.utime(entry, (i, i))
+        # reading an entry marks it as recently used
+        cache.get("aa0001")
+        cache.evict()
+        self.assertIsNotNone(cache.get("aa0001"))
+        self.assertIsNone(cache.get("bb0002"))
+        self.assertIsNotNone(cache.get("cc0003"))
+
+    def test_evict_whole_entries(self):
+        cache = DiskCache(pathlib.Path(self.tmpDir()), max_bytes=15)
+        for i, key in enumerate(("aa0001", "bb0002")):
+            os.utime(cache.put(key, self.write_bytes(10)), (i, i))
+        with patch("shutil.rmtree", wraps=shutil.rmtree) as rmtree:
+            cache.evict()
+        # evicted entries are moved out of place before they are deleted
+        for call in rmtree.call_args_list:
+            self.assertEqual(pathlib.Path(call.args[0]).parent, cache.root / "staging")
+        self.assertIsNone(cache.get("aa0001"))
+        self.assertEqual(list((cache.root / "aa").glob("*")), [])
+        self.assertIsNotNone(cache.get("bb0002"))
+        self.assertEqual(list((cache.root / "staging").iterdir()), [])
+
+    def test_hashing(self):
+        path = pathlib.Path(self.tmpDir()) / "file.bin"
+        path.write_bytes(b"content")
+        self.assertEqual(hash_file(path), hash_file(path))
+        self.assertNotEqual(hash_key("a", "bc"), hash_key("ab", "c"))
+
+    def test_file_hashes(self):
+        path = pathlib.Path(self.tmpDir()) / "file.bin"
+        path.write_bytes(b"content")
+        hasher = FileHashes()
+        with patch("mujoco_usd_converter._impl.cache.hash_file", wraps=hash_file) as wrapped:
+            self.assertEqual(hasher(path), hash_file(path))
+            self.assertEqual(hasher(path), hash_file(path))
+            wrapped.assert_called_once()
+            # a modified file is hashed again
+            path.write_bytes(b"modified content")
+            self.assertEqual(hasher(path), hash_file(path))
+            self.assertEqual(wrapped.call_count, 2)
+
+
+class TestModelCache(ConverterTestCase):
+
+    def write_model(self, directory: pathlib.Path) -> pathlib.Path:
+        (directory / "assets").mkdir()
+        shutil.copy("tests/data/assets/box.obj", directory / "assets/box.obj")
+        (directory / "part.xml").write_text("""
+            <mujoco>
+              <worldbody>
+                <body name="part">
+                  <geom type="mesh" mesh="box"/>
+                </body>
+              </worldbody>
+            </mujoco>
+            """)
+        model_path = directory / "model.xml"
+        model_path.write_text("""
+            <mujoco>
+              <compiler meshdir="assets"/>
+              <asset>
+                <mesh name="box" file="box.obj"/>
+              </asset>
+              <include file="part.xml"/>
+            </mujoco>
+            """)
+        return model_path
+
+    def test_compile_from_cache(self):
+        model_path = self.write_model(pathlib.Path(self.tmpDir()))
+        cache = DiskCache(pathlib.Path(self.tmpDir("model_cache")), max_bytes=1 << 30)
+        compiled = compile_model(mujoco.MjSpec.from_file(str(model_path)), cache, model_path)
+        self.assertEqual(len(list(cache.root.glob("??/*"))), 1)
+
+        # an unchanged model is loaded rather than compiled
+        with patch.object(mujoco.MjSpec, "compile", side_effect=AssertionError("compiled")):
+            cached = compile_model(mujoco.MjSpec.from_file(str(model_path)), cache, model_path)
+        self.assertEqual(cached.nbody, compiled.nbody)
+        self.assertEqual(cached.body_mass.tolist(), compiled.body_mass.tolist())
+        self.assertEqual(cached.mesh_vert.tolist(), compiled.mesh_vert.tolist())
+
+    def test_key_covers_inputs(self):
+        model_path = self.write_model(pathlib.Path(self.tmpDir()))
+
+        def key():
+            return get_model_cache_key(mujoco.MjSpec.from_file(str(model_path)), model_path)
+
+        original = key()
+        self.assertEqual(key(), original)
+
+        # editing an included file changes the key
+        part = model_path.parent / "part.xml"
+        part.write_text(part.read_text().replace('name="part"', 'name="renamed"'))
+        renamed = key()
+        self.assertNotEqual(renamed, original)
+
+        # editing a referenced asset changes the key
+        mesh = model_path.parent / "assets/box.obj"
+        mesh.write_bytes(mesh.read_bytes() + b"\n# edited\n")
+        self.assertNotEqual(key(), renamed)
+
+        # a spec whose files cannot all be read is never cached
+        spec = mujoco.MjSpec.from_file(str(model_path))
+        mesh.unlink()
+        self.assertIsNone(get_model_cache_key(spec, model_path))
+
+    def test_conversion_with_cache(self):
+        model_path = pathlib.Path("./tests/data/mass_bake_child.xml")
+        cache_dir = pathlib.Path(self.tmpDir("cache"))
+        uncached: Sdf.AssetPath = mujoco_usd_converter.Converter(cache_dir=cache_dir).convert(model_path, self.tmpDir("uncached"))
+        self.assertEqual(len(list((cache_dir / "models").glob("??/*"))), 1)
+
+        # the second conversion bakes mass from the cached model
+        with patch.object(mujoco.MjSpec, "compile", side_effect=AssertionError("compiled")):
+            cached: Sdf.AssetPath = mujoco_usd_converter.Converter(cache_dir=cache_dir).convert(model_path, self.tmpDir("cached"))
+        uncached_stage: Usd.Stage = Usd.Stage.Open(uncached.path)
+        cached_stage: Usd.Stage = Usd.Stage.Open(cached.path)
+        self.assertIsValidUsd(cached_stage)
+        baked = [prim for prim in uncached_stage.Traverse() if prim.HasAPI(UsdPhysics.MassAPI)]
+        self.assertTrue(baked)
+        for prim in baked:
+            other = cached_stage.GetPrimAtPath(prim.GetPath())
+            for attr in prim.GetAttributes():
+                if attr.GetNamespace() == "physics":
+                    self.assertEqual(other.GetAttribute(attr.GetName()).Get(), attr.Get(), attr.GetPath())
+
+    def test_cache_max_bytes(self):
+        model_path = pathlib.Path("./tests/data/mass_bake_child.xml")
+        cache_dir = pathlib.Path(self.tmpDir("cache"))
+        with patch("mujoco_usd_converter._impl.convert.DiskCache", wraps=DiskCache) as disk_cache:
+            mujoco_usd_converter.Converter(cache_dir=cache_dir, cache_max_bytes=1).convert(model_path, self.tmpDir("output"))
+        # the limit applies to both the mesh and the model cache
+        self.assertEqual([call.args[1] for call in disk_cache.call_args_list], [1, 1])
+        # neither fits within a single byte, so every entry is evicted as soon as it is stored
+        self.assertEqual(list((cache_dir / "models").glob("??/*")), [])
@@ -1,5 +1,7 @@
-# SPDX-FileCopyrightText: Copyright (c) 2025 The Newton Developers
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026 The Newton Developers
 # SPDX-License-Identifier: Apache-2.0
+import io
+import json
 import pathlib
 import shutil
 from unittest.mock import patch
@@ -8,6 +10,8 @@ import usdex.core
 import usdex.test
 from pxr import Sdf, Tf, Usd
 
+from mujoco_usd_converter._impl.batch import _Worker
+from mujoco_usd_converter._impl.cache import DiskCache
 from mujoco_usd_converter._impl.cli import run
 from tests.util.ConverterTestCase import ConverterTestCase
 
@@ -48,6 +52,188 @@ class TestCli(ConverterTestCase):
             layer = Sdf.Layer.FindOrOpen((pathlib.Path(self.tmpDir()) / f"{model_name}.usda").as_posix())
             self.assertEqual(layer.comment, "from the unittests")
 
+    def test_jobs(self):
+        model = "tests/data/meshes.xml"
+        model_name = pathlib.Path(model).stem
+        with patch("sys.argv", ["mujoco_usd_converter", model, self.tmpDir(), "--jobs", "2"]):
+            self.assertEqual(run(), 0, f"Failed to convert {model}")
+            self.assertTrue((pathlib.Path(self.tmpDir()) / f"{model_name}.usda").exists())
+
+    def test_invalid_jobs(self):
+        with (
+            patch("sys.argv", ["mujoco_usd_converter", "tests/data/meshes.xml", self.tmpDir(), "--jobs", "0"]),
+            usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_WARNING_TYPE, "The number of jobs must be at least 1.*")]),
+        ):
+            self.assertEqual(run(), 1, "Expected non-zero exit code for invalid jobs")
+
+    def test_cache_dir(self):
+        model = "tests/data/meshes.xml"
+        cache_dir = pathlib.Path(self.tmpDir()) / "cache"
+        with patch("sys.argv", ["mujoco_usd_converter", model, self.tmpDir(), "--cache-dir", str(cache_dir)]):
+            self.assertEqual(run(), 0, f"Failed to convert {model}")
+            self.assertTrue(any((cache_dir / "meshes").glob("??/*")))
+
+    def test_cache_max_size(self):
+        model = "tests/data/meshes.xml"
+        cache_dir = pathlib.Path(self.tmpDir()) / "cache"
+        args = ["mujoco_usd_converter", model, self.tmpDir(), "--cache-dir", str(cache_dir), "--cache-max-size", "1M"]
+        with (
+            patch("sys.argv", args),
+            patch("mujoco_usd_converter._impl.convert.DiskCache", wraps=DiskCache) as disk_cache,
+        ):
+            self.assertEqual(run(), 0, f"Failed to convert {model}")
+        self.assertEqual([call.args[1] for call in disk_cache.call_args_list], [1 << 20, 1 << 20])
+
+    def test_invalid_cache_max_size(self):
+        with (
+            patch("sys.argv", ["mujoco_usd_converter", "tests/data/meshes.xml", self.tmpDir(), "--cache-max-size", "0"]),
+            usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_WARNING_TYPE, "The cache size limit must be at least 1 byte.*")]),
+        ):
+            self.assertEqual(run(), 1, "Expected non-zero exit code for invalid cache size")
+
+    def test_weld_tolerance(self):
+        model = "tests/data/meshes.xml"
+        model_name = pathlib.Path(model).stem
+        with patch("sys.argv", ["mujoco_usd_converter", model, self.tmpDir(), "--weld-tolerance", "1e-5"]):
+            self.assertEqual(run(), 0, f"Failed to convert {model}")
+            self.assertTrue((pathlib.Path(self.tmpDir()) / f"{model_name}.usda").exists())
+
+    def test_merge_obj_shapes(self):
+        model = "tests/data/meshes.xml"
+        model_name = pathlib.Path(model).stem
+        with patch("sys.argv", ["mujoco_usd_converter", model, self.tmpDir(), "--merge-obj-shapes"]):
+            self.assertEqual(run(), 0, f"Failed to convert {model}")
+            self.assertTrue((pathlib.Path(self.tmpDir()) / f"{model_name}.usda").exists())
+
+    def test_prune_unused_assets(self):
+        model = "tests/data/unused_assets.xml"
+        with patch("sys.argv", ["mujoco_usd_converter", model, self.tmpDir(), "--prune-unused-assets"]):
+            self.assertEqual(run(), 0, f"Failed to convert {model}")
+            library = Sdf.Layer.FindOrOpen((pathlib.Path(self.tmpDir()) / "Payload/GeometryLibrary.usdc").as_posix())
+            self.assertEqual([x.name for x in library.GetPrimAtPath("/Geometry").nameChildren], ["UsedMesh"])
+
+    def test_compile_in_background(self):
+        model = "tests/data/bodies.xml"
+        with (
+            patch("sys.argv", ["mujoco_usd_converter", model, self.tmpDir(), "--compile-in-background"]),
+            patch("mujoco_usd_converter._impl.data.ConversionData.start_compile") as start_compile,
+        ):
+            self.assertEqual(run(), 0, f"Failed to convert {model}")
+            start_compile.assert_called_once()
+
+    def test_batch(self):
+        models = ["tests/data/geoms.xml", "tests/data/materials.xml"]
+        stdout = io.StringIO()
+        with (
+            patch("sys.argv", ["mujoco_usd_converter", *models, self.tmpDir(), "--jobs", "2"]),
+            patch("sys.stdout", stdout),
+        ):
+            self.assertEqual(run(), 0, f"Failed to convert {models}")
+        # one line of JSON is streamed per model, in the order the conversions complete
+        results = {x["input"]: x for x in map(json.loads, stdout.getvalue().splitlines())}
+        self.assertEqual(sorted(results), sorted(models))
+        for model in models:
+            model_name = pathlib.Path(model).stem
+            self.assertEqual(results[model]["status"], "converted")
+            self.assertTrue((pathlib.Path(self.tmpDir()) / model_name / f"{model_name}.usda").exists())
+        self.assertTrue(any("will discard textures" in x["message"] for x in results["tests/data/materials.xml"]["diagnostics"]))
+
+    def test_batch_failure(self):
+        broken = pathlib.Path(self.tmpDir()) / "broken.xml"
+        broken.write_text('<mujoco><worldbody><geom type="unknown"/></worldbody></mujoco>')
+        stdout = io.StringIO()
+        with (
+            patch("sys.argv", ["mujoco_usd_converter", str(broken), "tests/data/worldgeom.xml", self.tmpDir()]),
+            patch("sys.stdout", stdout),
+            usdex.test.ScopedDiagnosticChecker(
+                self,
+                [
+                    (Tf.TF_DIAGNOSTIC_WARNING_TYPE, "Conversion of .*broken.xml failed: XML Error.*"),
+                    (Tf.TF_DIAGNOSTIC_WARNING_TYPE, "1 of 2 conversions failed"),
+                ],
+                level=usdex.core.DiagnosticsLevel.eWarning,
+            ),
+        ):
+            self.assertEqual(run(), 1, "Expected non-zero exit code when a model of the batch fails")
+        # the other models of the batch are still converted
+        statuses = {x["input"]: x["status"] for x in map(json.loads, stdout.getvalue().splitlines())}
+        self.assertEqual(statuses, {broken.as_posix(): "failed", "tests/data/worldgeom.xml": "converted"})
+        self.assertTrue((pathlib.Path(self.tmpDir()) / "worldgeom" / "worldgeom.usda").exists())
+
+    def test_batch_same_output(self):
+        model = pathlib.Path(self.tmpDir()) / "geoms.xml"
+        shutil.copyfile("tests/data/geoms.xml", model)
+        with (
+            patch("sys.argv", ["mujoco_usd_converter", "tests/data/geoms.xml", str(model), self.tmpDir()]),
+            usdex.test.ScopedDiagnosticChecker(
+                self,
+                [(Tf.TF_DIAGNOSTIC_WARNING_TYPE, "Multiple input files would be converted into the same directory.*")],
+            ),
+        ):
+            self.assertEqual(run(), 1, "Expected non-zero exit code for inputs with the same name")
+
+    def test_timeout(self):
+        model = "tests/data/worldgeom.xml"
+        model_name = pathlib.Path(model).stem
+        stdout = io.StringIO()
+        with (
+            patch("sys.argv", ["mujoco_usd_converter", model, self.tmpDir(), "--timeout", "300"]),
+            patch("sys.stdout", stdout),
+        ):
+            self.assertEqual(run(), 0, f"Failed to convert {model}")
+        # a single model is converted directly into the output directory
+        self.assertTrue((pathlib.Path(self.tmpDir()) / f"{model_name}.usda").exists())
+        self.assertEqual(json.loads(stdout.getvalue())["status"], "converted")
+
+    def test_timeout_with_jobs(self):
+        model = "tests/data/meshes.xml"
+        stdout = io.StringIO()
+        with (
+            patch("sys.argv", ["mujoco_usd_converter", model, self.tmpDir(), "--timeout", "300", "--jobs", "2"]),
+            patch("sys.stdout", stdout),
+            patch("mujoco_usd_converter._impl.batch._Worker", wraps=_Worker) as worker,
+        ):
+            self.assertEqual(run(), 0, f"Failed to convert {model}")
+        self.assertEqual(json.loads(stdout.getvalue())["status"], "converted")
+        # a single model is converted by a single worker, which decodes its meshes with every job
+        worker.assert_called_once()
+        self.assertEqual(worker.call_args.args[1].jobs, 2)
+
+    def test_journal(self):
+        models = ["tests/data/geoms.xml", "tests/data/worldgeom.xml"]
+        journal = pathlib.Path(self.tmpDir()) / "journal.ndjson"
+        for expected in ("converted", "skipped"):
+            stdout = io.StringIO()
+            with (
+                patch("sys.argv", ["mujoco_usd_converter", *models, self.tmpDir(), "--journal", str(journal)]),
+                patch("sys.stdout", stdout),
+            ):
+                self.assertEqual(run(), 0, f"Failed to convert {models}")
+            # a rerun skips the models which the journal records as converted
+            self.assertEqual([x["status"] for x in map(json.loads, stdout.getvalue().splitlines())], [expected] * len(models))
+        self.assertEqual(len(journal.read_text().splitlines()), len(models))
+
+    def test_invalid_journal(self):
+        with (
+            patch("sys.argv", ["mujoco_usd_converter", "tests/data/meshes.xml", self.tmpDir(), "--journal", self.tmpDir()]),
+            usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_WARNING_TYPE, "Journal path exists but is not a file.*")]),
+        ):
+            self.assertEqual(run(), 1, "Expected non-zero exit code for invalid journal")
+
+    def test_invalid_timeout(self):
+        with (
+            patch("sys.argv", ["mujoco_usd_converter", "tests/data/meshes.xml", self.tmpDir(), "--timeout", "0"]),
+            usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_WARNING_TYPE, "The timeout must be positive.*")]),
+        ):
+            self.assertEqual(run(), 1, "Expected non-zero exit code for invalid timeout")
+
+    def test_invalid_weld_tolerance(self):
+        with (
+            patch("sys.argv", ["mujoco_usd_converter", "tests/data/meshes.xml", self.tmpDir(), "--weld-tolerance", "-1"]),
+            usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_WARNING_TYPE, "The weld tolerance must not be negative.*")]),
+        ):
+            self.assertEqual(run(), 1, "Expected non-zero exit code for invalid weld tolerance")
+
     def test_invalid_input(self):
         with (
             patch("sys.argv", ["mujoco_usd_converter", "tests/data/invalid.xml", self.tmpDir()]),
@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 import pathlib
 
-from pxr import Gf, Sdf, Usd, UsdGeom
+import mujoco
+import numpy as np
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdPhysics
 
 import mujoco_usd_converter
 from tests.util.ConverterTestCase import ConverterTestCase
@@ -34,3 +36,51 @@ class TestFrames(ConverterTestCase):
         self.assertTrue(Gf.IsClose(transform.GetTranslation(), Gf.Vec3d(pow(2, 0.5) / 2, -pow(2, 0.5) / 2, 0), 1e-6))
         self.assertRotationsAlmostEqual(transform.GetRotation(), Gf.Rotation(Gf.Vec3d(0, 0, 1), 90), 1e-4)
         self.assertTrue(Gf.IsClose(transform.GetScale(), Gf.Vec3d(0.1, 0.1, 0.4), 1e-6))
+
+    def test_nested_frames(self):
+        model = pathlib.Path("./tests/data/nested_frames.xml")
+        asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model, self.tmpDir())
+        stage: Usd.Stage = Usd.Stage.Open(asset.path)
+        self.assertIsValidUsd(stage)
+
+        # nested frames compose, so the result matches the compiled model
+        mj_model = mujoco.MjModel.from_xml_path(model.as_posix())
+        mj_data = mujoco.MjData(mj_model)
+        mujoco.mj_kinematics(mj_model, mj_data)
+
+        def assert_pose(path: str, pos: np.ndarray, quat: np.ndarray):
+            prim = UsdGeom.Xformable(stage.GetPrimAtPath(path))
+            self.assertTrue(prim, path)
+            transform = Gf.Transform(prim.ComputeLocalToWorldTransform(Usd.TimeCode.Default()))
+            self.assertTrue(Gf.IsClose(transform.GetTranslation(), Gf.Vec3d(*pos), 1e-6), path)
+            self.assertRotationsAlmostEqual(transform.GetRotation(), Gf.Rotation(Gf.Quatd(*quat)), 1e-4)
+
+        for name, path in (
+            ("nestedBody", "/nested_frames/Geometry/mainBody/nestedBody"),
+            ("jointBody", "/nested_frames/Geometry/mainBody/jointBody"),
+        ):
+            body = mj_model.body(name).id
+            assert_pose(path, mj_data.xpos[body], mj_data.xquat[body])
+
+        for name, path in (
+            ("nestedGeom", "/nested_frames/Geometry/mainBody/nestedGeom"),
+            ("nestedBodyGeom", "/nested_frames/Geometry/mainBody/nestedBody/nestedBodyGeom"),
+        ):
+            geom = mj_model.geom(name).id
+            quat = np.zeros(4)
+            mujoco.mju_mat2Quat(quat, mj_data.geom_xmat[geom])
+            assert_pose(path, mj_data.geom_xpos[geom], quat)
+
+        site = mj_model.site("nestedSite").id
+        quat = np.zeros(4)
+        mujoco.mju_mat2Quat(quat, mj_data.site_xmat[site])
+        assert_pose("/nested_frames/Geometry/mainBody/jointBody/nestedSite", mj_data.site_xpos[site], quat)
+
+        # the joint anchor and axis are relative to the body, through the frames
+        joint = UsdPhysics.RevoluteJoint(stage.GetPrimAtPath("/nested_frames/Geometry/mainBody/jointBody/nestedHinge"))
+        self.assertTrue(joint)
+        mj_joint = mj_model.joint("nestedHinge")
+        self.assertTrue(Gf.IsClose(joint.GetLocalPos1Attr().Get(), Gf.Vec3f(*mj_joint.pos), 1e-6))
+        local_axis = {UsdPhysics.Tokens.x: Gf.Vec3d(1, 0, 0), UsdPhysics.Tokens.y: Gf.Vec3d(0, 1, 0), UsdPhysics.Tokens.z: Gf.Vec3d(0, 0, 1)}
+        axis = Gf.Rotation(Gf.Quatd(joint.GetLocalRot1Attr().Get())).TransformDir(local_axis[joint.GetAxisAttr().Get()])
+        self.assertTrue(Gf.IsClose(axis, Gf.Vec3d(*mj_joint.axis), 1e-6))
@@ -1,7 +1,10 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 The Newton Developers
 # SPDX-License-Identifier: Apache-2.0
 import pathlib
+from unittest.mock import patch
 
+import mujoco
+import numpy as np
 import omni.asset_validator
 import usdex.core
 from pxr import Gf, Sdf, Tf, Usd, UsdGeom
@@ -9,6 +12,18 @@ from pxr import Gf, Sdf, Tf, Usd, UsdGeom
 import mujoco_usd_converter
 from tests.util.ConverterTestCase import ConverterTestCase
 
+PRIM_TYPES = {
+    mujoco.mjtGeom.mjGEOM_BOX: UsdGeom.Cube,
+    mujoco.mjtGeom.mjGEOM_SPHERE: UsdGeom.Sphere,
+    mujoco.mjtGeom.mjGEOM_CYLINDER: UsdGeom.Cylinder,
+    mujoco.mjtGeom.mjGEOM_CAPSULE: UsdGeom.Capsule,
+}
+
+# the NumPy fit differs from the MuJoCo compiler by a few ulps, and the radii, heights and orientations are authored
+# as single precision floats, so the axes of a fitted frame are only as close as a rounded quaternion allows
+FIT_TOLERANCE = 1e-6
+ROTATION_TOLERANCE = 1e-5
+
 
 class TestGeomFitting(ConverterTestCase):
     def setUp(self):
@@ -17,7 +32,6 @@ class TestGeomFitting(ConverterTestCase):
         with usdex.test.ScopedDiagnosticChecker(
             self,
             [
-                (Tf.TF_DIAGNOSTIC_WARNING_TYPE, r"Parent body name not found \(geom id: 1\)"),
                 (Tf.TF_DIAGNOSTIC_WARNING_TYPE, "Unsupported or unknown geom type mjtGeom.mjGEOM_ELLIPSOID for geom 'ellipsoid'"),
             ],
             level=usdex.core.DiagnosticsLevel.eWarning,
@@ -28,6 +42,84 @@ class TestGeomFitting(ConverterTestCase):
         self.validationEngine.disable_rule(omni.asset_validator.WeldChecker)
         self.assertIsValidUsd(self.stage)
 
+    def test_fit_matches_compiled_model(self):
+        # primitives are fitted from the decoded meshes without compiling the model, yet match the fit of the MuJoCo compiler
+        for model_path in (pathlib.Path("./tests/data/geoms_fitting.xml"), pathlib.Path("./tests/data/geoms_fitting_aabb.xml")):
+            with self.subTest(model=model_path.name):
+                with (
+                    patch("mujoco_usd_converter._impl.data.ConversionData.get_model", side_effect=AssertionError("model compiled")),
+                    usdex.test.ScopedDiagnosticChecker(
+                        self,
+                        [(Tf.TF_DIAGNOSTIC_WARNING_TYPE, "Unsupported or unknown geom type.*")],
+                        level=usdex.core.DiagnosticsLevel.eWarning,
+                    ),
+                ):
+                    asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model_path, self.tmpDir(model_path.stem))
+                self.check_fit(model_path, Usd.Stage.Open(asset.path), 26)
+
+    def test_fit_within_frames(self):
+        # the fitted pose is composed with the pose of its geom and of every frame the geom is within
+        model_path = pathlib.Path(self.tmpDir()) / "framed_fitting.xml"
+        model_path.write_text(f"""
+            <mujoco model="framed_fitting">
+                <compiler meshdir="{pathlib.Path("tests/data/assets").absolute().as_posix()}" angle="degree"/>
+                <asset>
+                    <mesh name="rectangle" file="box.obj" scale="1.2 0.3 0.2"/>
+                    <mesh name="complex_cube" file="complex_cube.obj" scale="1.3 1.0 1.0"/>
+                </asset>
+                <worldbody>
+                    <body name="body" pos="1 2 3" euler="10 20 30">
+                        <frame name="outer" pos="0.5 0 0" euler="0 90 0">
+                            <frame name="inner" pos="0 0.25 0" quat="0 0 0 1">
+                                <geom name="box" type="box" mesh="complex_cube" pos="0.1 0.2 0.3" euler="45 0 0"/>
+                                <geom name="capsule" type="capsule" mesh="rectangle" axisangle="1 1 0 30"/>
+                            </frame>
+                            <geom name="cylinder" type="cylinder" mesh="rectangle" pos="0 0 1"/>
+                        </frame>
+                    </body>
+                </worldbody>
+            </mujoco>
+        """)
+        with patch("mujoco_usd_converter._impl.data.ConversionData.get_model", side_effect=AssertionError("model compiled")):
+            asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model_path, self.tmpDir("framed"))
+        self.check_fit(model_path, Usd.Stage.Open(asset.path), 3)
+
+    def check_fit(self, model_path: pathlib.Path, stage: Usd.Stage, count: int):
+        spec = mujoco.MjSpec.from_file(model_path.as_posix())
+        fitted = {i: geom.name for i, geom in enumerate(spec.geoms) if geom.meshname and geom.type in PRIM_TYPES}
+        model = spec.compile()
+        data = mujoco.MjData(model)
+        # the geom poses are composed with their body poses in the default configuration
+        mujoco.mj_kinematics(model, data)
+
+        prims = {prim.GetName(): prim for prim in stage.Traverse() if prim.IsA(UsdGeom.Gprim) and not prim.IsA(UsdGeom.Mesh)}
+        default_prim = stage.GetDefaultPrim().GetPath()
+        self.assertEqual(len(fitted), count)
+        for i, name in fitted.items():
+            geom = model.geom(i)
+            self.assertEqual(geom.name, name)
+            # the only unnamed fitted geom is the box in the unnamed body
+            prim = prims[geom.name] if geom.name else stage.GetPrimAtPath(default_prim.AppendPath("Geometry/Body/Box"))
+            self.assertTrue(prim.IsA(PRIM_TYPES[geom.type[0]]), prim.GetPath())
+
+            # the rows of the world transform are the scaled axes of the prim
+            transform = np.array(UsdGeom.Xformable(prim).ComputeLocalToWorldTransform(Usd.TimeCode.Default()))
+            scale = np.linalg.norm(transform[:3, :3], axis=1)
+            np.testing.assert_allclose(transform[3, :3], data.geom_xpos[i], atol=FIT_TOLERANCE, err_msg=str(prim.GetPath()))
+            axes = transform[:3, :3] / scale[:, None]
+            np.testing.assert_allclose(axes, data.geom_xmat[i].reshape(3, 3).T, atol=ROTATION_TOLERANCE, err_msg=str(prim.GetPath()))
+
+            if geom.type[0] == mujoco.mjtGeom.mjGEOM_BOX:
+                self.assertEqual(UsdGeom.Cube(prim).GetSizeAttr().Get(), 2)
+                size = scale
+            elif geom.type[0] == mujoco.mjtGeom.mjGEOM_SPHERE:
+                size = [UsdGeom.Sphere(prim).GetRadiusAttr().Get() * scale[0]]
+            else:
+                gprim = PRIM_TYPES[geom.type[0]](prim)
+                self.assertEqual(gprim.GetAxisAttr().Get(), UsdGeom.Tokens.z)
+                size = [gprim.GetRadiusAttr().Get() * scale[0], gprim.GetHeightAttr().Get() * scale[2] / 2]
+            np.testing.assert_allclose(size, geom.size[: len(size)], atol=FIT_TOLERANCE, err_msg=str(prim.GetPath()))
+
     def test_geom_fitting_unsupported(self):
         # Check that no unsupported fitting types are specified.
         default_prim = self.stage.GetDefaultPrim()
@@ -59,6 +151,13 @@ class TestGeomFitting(ConverterTestCase):
         self.assertTrue(prim)
         self.assertTrue(prim.IsA(UsdGeom.Cube))
 
+        # the fit does not depend on the body name, so it matches the same mesh fitted within a named body
+        named_prim = self.stage.GetPrimAtPath(f"{default_prim.GetPath()}/Geometry/use_geom_name/geom_complex_cube")
+        self.assertEqual(
+            usdex.core.getLocalTransformComponentsQuat(prim),
+            usdex.core.getLocalTransformComponentsQuat(named_prim),
+        )
+
     def test_use_geom_name(self):
         # When specifying a geom name.
         default_prim = self.stage.GetDefaultPrim()
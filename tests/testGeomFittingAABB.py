@@ -17,7 +17,6 @@ class TestGeomFittingAABB(ConverterTestCase):
         with usdex.test.ScopedDiagnosticChecker(
             self,
             [
-                (Tf.TF_DIAGNOSTIC_WARNING_TYPE, r"Parent body name not found \(geom id: 1\)"),
                 (Tf.TF_DIAGNOSTIC_WARNING_TYPE, "Unsupported or unknown geom type mjtGeom.mjGEOM_ELLIPSOID for geom 'ellipsoid'"),
             ],
             level=usdex.core.DiagnosticsLevel.eWarning,
@@ -59,6 +58,13 @@ class TestGeomFittingAABB(ConverterTestCase):
         self.assertTrue(prim)
         self.assertTrue(prim.IsA(UsdGeom.Cube))
 
+        # the fit does not depend on the body name, so it matches the same mesh fitted within a named body
+        named_prim = self.stage.GetPrimAtPath(f"{default_prim.GetPath()}/Geometry/use_geom_name/geom_complex_cube")
+        self.assertEqual(
+            usdex.core.getLocalTransformComponentsQuat(prim),
+            usdex.core.getLocalTransformComponentsQuat(named_prim),
+        )
+
     def test_use_geom_name(self):
         # When specifying a geom name.
         default_prim = self.stage.GetDefaultPrim()
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import pathlib
+
+import mujoco
+import numpy as np
+
+from mujoco_usd_converter._impl.inertia import compute_mesh_inertia, triangulate
+from mujoco_usd_converter._impl.mesh import decode_obj
+from tests.util.ConverterTestCase import ConverterTestCase
+
+
+class TestInertia(ConverterTestCase):
+    def compile(self, inertia: str, fitaabb: bool) -> tuple[mujoco.MjSpec, mujoco.MjModel]:
+        spec = mujoco.MjSpec.from_string(f"""
+            <mujoco>
+              <compiler meshdir="{pathlib.Path("tests/data/assets").absolute()}" fitaabb="{str(fitaabb).lower()}"/>
+              <asset>
+                <mesh name="cube" file="complex_cube.obj" inertia="{inertia}" scale="1.3 0.8 1.1" refpos="0.1 -0.2 0.3" refquat="0.9 0.1 -0.3 0.2"/>
+              </asset>
+              <worldbody>
+                <body name="body">
+                  <geom type="mesh" mesh="cube"/>
+                  <geom type="box" mesh="cube"/>
+                </body>
+              </worldbody>
+            </mujoco>
+            """)
+        return spec, spec.copy().compile()
+
+    def test_triangulate(self):
+        triangles = triangulate(np.array([3, 4, 5]), np.arange(12))
+        np.testing.assert_array_equal(triangles, [[0, 1, 2], [3, 4, 5], [3, 5, 6], [7, 8, 9], [7, 9, 10], [7, 10, 11]])
+
+    def test_matches_compiler(self):
+        buffers = decode_obj(pathlib.Path("tests/data/assets/complex_cube.obj"))
+        triangles = triangulate(buffers.face_vertex_counts, buffers.face_vertex_indices)
+        for inertia_type in ("legacy", "exact", "shell"):
+            for fitaabb in (False, True):
+                with self.subTest(inertia=inertia_type, fitaabb=fitaabb):
+                    spec, model = self.compile(inertia_type, fitaabb)
+                    inertia = compute_mesh_inertia(spec.mesh("cube"), buffers.points, triangles)
+                    # the mesh geom is placed at the inertial frame of the mesh
+                    np.testing.assert_allclose(inertia.pos, model.geom_pos[0], atol=1e-9)
+                    np.testing.assert_allclose(inertia.quat, model.geom_quat[0], atol=1e-9)
+                    # the box geom is fitted to either the inertia box or the bounding box
+                    np.testing.assert_allclose(inertia.aabb_size if fitaabb else inertia.inertia_box, model.geom_size[1], atol=1e-9)
+
+    def test_convex_requires_compiling(self):
+        buffers = decode_obj(pathlib.Path("tests/data/assets/complex_cube.obj"))
+        spec = mujoco.MjSpec()
+        mesh = spec.add_mesh(name="cube", inertia=mujoco.mjtMeshInertia.mjMESH_INERTIA_CONVEX)
+        self.assertIsNone(compute_mesh_inertia(mesh, buffers.points, triangulate(buffers.face_vertex_counts, buffers.face_vertex_indices)))
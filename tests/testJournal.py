@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import json
+import pathlib
+import shutil
+from unittest.mock import patch
+
+import usdex.test
+from pxr import Tf
+
+import mujoco_usd_converter
+from mujoco_usd_converter._impl.batch import BatchResult
+from mujoco_usd_converter._impl.journal import BatchJournal, get_input_hash, resume_batch
+from tests.util.ConverterTestCase import ConverterTestCase
+
+
+class TestBatchJournal(ConverterTestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = pathlib.Path(self.tmpDir())
+        self.model = self.directory / "worldgeom.xml"
+        shutil.copyfile("tests/data/worldgeom.xml", self.model)
+        self.models = [(self.model, self.directory / "out" / "worldgeom"), (pathlib.Path("tests/data/geoms.xml"), self.directory / "out" / "geoms")]
+        self.journal_path = self.directory / "journal.ndjson"
+        self.params = mujoco_usd_converter.Converter.Params()
+
+    def resume(self, params=None) -> dict[str, str]:
+        results = resume_batch(self.models, BatchJournal(self.journal_path), params or self.params)
+        return {pathlib.Path(result.input).name: result.status for result in results}
+
+    def test_resume(self):
+        self.assertEqual(self.resume(), {"worldgeom.xml": "converted", "geoms.xml": "converted"})
+        self.assertEqual(len(self.journal_path.read_text().splitlines()), 2)
+
+        # completed models with unchanged inputs are skipped
+        self.assertEqual(self.resume(), {"worldgeom.xml": "skipped", "geoms.xml": "skipped"})
+        self.assertEqual(len(self.journal_path.read_text().splitlines()), 2)
+
+        # a changed input is converted again
+        self.model.write_text(self.model.read_text().replace('pos="0 0 -.1"', 'pos="0 0 -.2"', 1))
+        self.assertEqual(self.resume(), {"worldgeom.xml": "converted", "geoms.xml": "skipped"})
+
+        # as is a model whose asset is missing from the output tree
+        shutil.rmtree(self.directory / "out" / "geoms")
+        self.assertEqual(self.resume(), {"worldgeom.xml": "skipped", "geoms.xml": "converted"})
+
+        # and every model converted with different parameters
+        self.assertEqual(self.resume(mujoco_usd_converter.Converter.Params(scene=False)), {"worldgeom.xml": "converted", "geoms.xml": "converted"})
+        # parameters which do not change the asset do not invalidate the journal
+        params = mujoco_usd_converter.Converter.Params(scene=False, jobs=4, compile_in_background=True)
+        self.assertEqual(self.resume(params), {"worldgeom.xml": "skipped", "geoms.xml": "skipped"})
+
+    def test_hash_in_workers(self):
+        # the inputs are hashed by the workers, so the batch does not wait for every model to be hashed before converting
+        with patch("mujoco_usd_converter._impl.journal.get_input_hash", side_effect=AssertionError("hashed in the parent process")):
+            self.assertEqual(self.resume(), {"worldgeom.xml": "converted", "geoms.xml": "converted"})
+        entries = [json.loads(line) for line in self.journal_path.read_text().splitlines()]
+        self.assertEqual([entry["hash"] for entry in entries], [get_input_hash(pathlib.Path(entry["input"]), self.params) for entry in entries])
+
+    def test_retry_failed(self):
+        original = self.model.read_text()
+        self.model.write_text('<mujoco><worldbody><geom type="unknown"/></worldbody></mujoco>')
+        self.assertIsNone(get_input_hash(self.model, self.params))
+        self.assertEqual(self.resume(), {"worldgeom.xml": "failed", "geoms.xml": "converted"})
+
+        # failed models are retried, even when their inputs are unchanged
+        self.assertEqual(self.resume(), {"worldgeom.xml": "failed", "geoms.xml": "skipped"})
+        self.model.write_text(original)
+        self.assertEqual(self.resume(), {"worldgeom.xml": "converted", "geoms.xml": "skipped"})
+
+        entries = [json.loads(line) for line in self.journal_path.read_text().splitlines()]
+        self.assertEqual([entry["status"] for entry in entries], ["failed", "converted", "failed", "converted"])
+        self.assertEqual(entries[-1]["hash"], get_input_hash(self.model, self.params))
+        self.assertEqual(entries[-1]["output"], (self.directory / "out" / "worldgeom").as_posix())
+        self.assertIn("write", entries[-1]["timings"])
+
+    def test_partial_entry(self):
+        journal = BatchJournal(self.journal_path)
+        journal.record(BatchResult(input="first.xml", output="first", status="converted", asset="first/first.usda", input_hash="hash"))
+        # a crash while appending leaves a partial line
+        with self.journal_path.open("a") as f:
+            f.write('{"input": "/second.xml", "sta')
+
+        with usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_WARNING_TYPE, "Ignoring invalid entry on line 2 of the batch journal.*")]):
+            journal = BatchJournal(self.journal_path)
+        self.assertEqual(list(journal.entries), [pathlib.Path("first.xml").absolute().as_posix()])
+
+        # the next entry starts on a line of its own
+        journal.record(BatchResult(input="third.xml", output="third", status="failed"))
+        with usdex.test.ScopedDiagnosticChecker(self, [(Tf.TF_DIAGNOSTIC_WARNING_TYPE, "Ignoring invalid entry on line 2 of the batch journal.*")]):
+            journal = BatchJournal(self.journal_path)
+        self.assertEqual(len(journal.entries), 2)
+        self.assertEqual(journal.entries[pathlib.Path("third.xml").absolute().as_posix()]["status"], "failed")
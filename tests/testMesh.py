@@ -2,8 +2,16 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import pathlib
+import shutil
+from unittest.mock import patch
 
-from pxr import Sdf, Usd, UsdGeom, UsdShade
+import mujoco
+import numpy as np
+import omni.asset_validator
+import stl
+import usdex.core
+import usdex.test
+from pxr import Gf, Sdf, Tf, Usd, UsdGeom, UsdShade
 
 import mujoco_usd_converter
 from tests.util.ConverterTestCase import ConverterTestCase
@@ -80,6 +88,267 @@ class TestMesh(ConverterTestCase):
         self.assertEqual(len(uvs_primvar.GetAttr().Get()), 4)
         self.assertEqual(len(uvs_primvar.GetIndicesAttr().Get()), 24)
 
+    def test_mesh_conversion_with_jobs(self):
+        model_path = pathlib.Path("./tests/data/meshes.xml")
+        serial: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model_path, self.tmpDir("serial"))
+        parallel: Sdf.AssetPath = mujoco_usd_converter.Converter(jobs=2).convert(model_path, self.tmpDir("parallel"))
+        stage = Usd.Stage.Open(parallel.path)
+        self.assertIsValidUsd(stage)
+
+        # decoding in worker processes must not change the authored meshes
+        for relative_path in ("Payload/GeometryLibrary.usdc", "Payload/Geometry.usda"):
+            serial_layer = Sdf.Layer.FindOrOpen((pathlib.Path(serial.path).parent / relative_path).as_posix())
+            parallel_layer = Sdf.Layer.FindOrOpen((pathlib.Path(parallel.path).parent / relative_path).as_posix())
+            self.assertEqual(serial_layer.ExportToString(), parallel_layer.ExportToString())
+
+    def test_mesh_conversion_with_cache(self):
+        model_path = pathlib.Path("./tests/data/meshes.xml")
+        cache_dir = pathlib.Path(self.tmpDir("cache"))
+        uncached: Sdf.AssetPath = mujoco_usd_converter.Converter(cache_dir=cache_dir).convert(model_path, self.tmpDir("uncached"))
+        # each distinct mesh file is stored once, regardless of the mesh settings referencing it
+        self.assertEqual(len(list((cache_dir / "meshes").glob("??/*"))), 2)
+
+        # the second conversion must be served entirely from the cache
+        with (
+            patch("mujoco_usd_converter._impl.mesh.decode_stl", side_effect=AssertionError("STL decoded")),
+            patch("mujoco_usd_converter._impl.mesh.decode_obj", side_effect=AssertionError("OBJ decoded")),
+        ):
+            cached: Sdf.AssetPath = mujoco_usd_converter.Converter(cache_dir=cache_dir).convert(model_path, self.tmpDir("cached"))
+        stage = Usd.Stage.Open(cached.path)
+        self.assertIsValidUsd(stage)
+
+        uncached_layer = Sdf.Layer.FindOrOpen((pathlib.Path(uncached.path).parent / "Payload/GeometryLibrary.usdc").as_posix())
+        cached_layer = Sdf.Layer.FindOrOpen((pathlib.Path(cached.path).parent / "Payload/GeometryLibrary.usdc").as_posix())
+        self.assertEqual(uncached_layer.ExportToString(), cached_layer.ExportToString())
+
+    def test_partial_mesh_cache_entry(self):
+        model_path = pathlib.Path("./tests/data/meshes.xml")
+        cache_dir = pathlib.Path(self.tmpDir("cache"))
+        uncached: Sdf.AssetPath = mujoco_usd_converter.Converter(cache_dir=cache_dir).convert(model_path, self.tmpDir("uncached"))
+        # an entry missing one of its optional arrays (e.g. while it is being evicted) must not be used
+        (entry,) = [entry for entry in (cache_dir / "meshes").glob("??/*") if (entry / "uv_indices.npy").exists()]
+        (entry / "uv_indices.npy").unlink()
+
+        with patch("mujoco_usd_converter._impl.mesh.decode_obj", wraps=mujoco_usd_converter._impl.mesh.decode_obj) as decode_obj:
+            cached: Sdf.AssetPath = mujoco_usd_converter.Converter(cache_dir=cache_dir).convert(model_path, self.tmpDir("cached"))
+        decode_obj.assert_called_once()
+
+        uncached_layer = Sdf.Layer.FindOrOpen((pathlib.Path(uncached.path).parent / "Payload/GeometryLibrary.usdc").as_posix())
+        cached_layer = Sdf.Layer.FindOrOpen((pathlib.Path(cached.path).parent / "Payload/GeometryLibrary.usdc").as_posix())
+        self.assertEqual(uncached_layer.ExportToString(), cached_layer.ExportToString())
+
+    def test_binary_stl_conversion(self):
+        model_path = pathlib.Path("./tests/data/meshes.xml")
+        binary_dir = pathlib.Path(self.tmpDir("binary_model"))
+        shutil.copytree(model_path.parent / "assets", binary_dir / "assets")
+        shutil.copy(model_path, binary_dir / model_path.name)
+        stl.Mesh.from_file(model_path.parent / "assets/box.stl", calculate_normals=False).save(
+            binary_dir / "assets/box.stl", mode=stl.Mode.BINARY, update_normals=False
+        )
+
+        ascii_asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model_path, self.tmpDir("ascii"))
+        binary_asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(binary_dir / model_path.name, self.tmpDir("binary"))
+        stage = Usd.Stage.Open(binary_asset.path)
+        self.assertIsValidUsd(stage)
+
+        # binary and ascii encodings of the same mesh must author identical geometry
+        ascii_layer = Sdf.Layer.FindOrOpen((pathlib.Path(ascii_asset.path).parent / "Payload/GeometryLibrary.usdc").as_posix())
+        binary_layer = Sdf.Layer.FindOrOpen((pathlib.Path(binary_asset.path).parent / "Payload/GeometryLibrary.usdc").as_posix())
+        self.assertEqual(ascii_layer.ExportToString(), binary_layer.ExportToString())
+
+    def test_welded_stl_conversion(self):
+        model_dir = pathlib.Path(self.tmpDir("soup_model"))
+        (model_dir / "soup.xml").write_text(
+            '<mujoco model="soup"><asset><mesh file="soup.stl"/></asset><worldbody><geom type="mesh" mesh="soup"/></worldbody></mujoco>'
+        )
+        corners = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float32)
+        soup = stl.Mesh(np.zeros(7, dtype=stl.Mesh.dtype))
+        soup.vectors[:] = [
+            corners[[0, 1, 2]],
+            corners[[0, 2, 3]] + [[1e-6, 0, 0], [0, 0, 0], [0, 0, 0]],  # nearly coincident with the first corner above
+            corners[[1, 2, 0]],  # repeats the first triangle
+            corners[[2, 1, 0]],  # the first triangle with the opposite winding
+            corners[[0, 1, 1]],  # degenerate
+            corners[[0, 1, 4]],
+            corners[[0, 1, 4]] + [[0, 0, 0], [0, 0, 0], [0, 0, 1e-6]],  # nearly repeats the triangle above
+        ]
+        soup.save(model_dir / "soup.stl", mode=stl.Mode.BINARY)
+
+        asset: Sdf.AssetPath = mujoco_usd_converter.Converter(weld_tolerance=1e-4).convert(model_dir / "soup.xml", self.tmpDir("welded"))
+        stage = Usd.Stage.Open(asset.path)
+        # the back facing triangle is deliberately kept, which leaves the mesh non-manifold
+        self.validationEngine.disable_rule(omni.asset_validator.ManifoldChecker)
+        self.assertIsValidUsd(stage)
+
+        usd_mesh = UsdGeom.Mesh(stage.GetPrimAtPath("/soup/Geometry/soup"))
+        self.assertTrue(usd_mesh)
+        self.assertEqual(len(usd_mesh.GetPointsAttr().Get()), 5)
+        self.assertEqual(list(usd_mesh.GetFaceVertexCountsAttr().Get()), [3] * 4)
+        self.assertEqual(list(usd_mesh.GetFaceVertexIndicesAttr().Get()), [0, 1, 2, 0, 2, 3, 2, 1, 0, 0, 1, 4])
+        # normals are kept for the remaining triangles
+        normals_primvar: UsdGeom.Primvar = UsdGeom.PrimvarsAPI(usd_mesh).GetPrimvar("normals")
+        self.assertEqual(len(normals_primvar.GetIndicesAttr().Get()), 4)
+
+        # welding is opt-in
+        asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model_dir / "soup.xml", self.tmpDir("unwelded"))
+        stage = Usd.Stage.Open(asset.path)
+        usd_mesh = UsdGeom.Mesh(stage.GetPrimAtPath("/soup/Geometry/soup"))
+        self.assertEqual(len(usd_mesh.GetFaceVertexCountsAttr().Get()), 7)
+
+    def test_multiple_obj_shapes(self):
+        model_dir = pathlib.Path(self.tmpDir("shapes_model"))
+        (model_dir / "shapes.xml").write_text(
+            '<mujoco model="shapes"><asset><mesh file="shapes.obj"/></asset><worldbody><geom type="mesh" mesh="shapes"/></worldbody></mujoco>'
+        )
+        (model_dir / "shapes.obj").write_text(
+            "o first\nv 0 0 0\nv 1 0 0\nv 0 1 0\nv 0 0 1\nf 1 2 3\nf 1 4 2\n"
+            "o second part\nv 2 0 0\nv 3 0 0\nv 2 1 0\nv 2 0 1\nf 5 6 7\nf 5 8 6\nf 6 8 7\nf 5 7 8\n"
+        )
+
+        # by default only the first shape is converted, matching the geometry MuJoCo simulates
+        with usdex.test.ScopedDiagnosticChecker(
+            self,
+            [(Tf.TF_DIAGNOSTIC_WARNING_TYPE, '"shapes.obj" contains multiple meshes, only the first one will be converted')],
+            level=usdex.core.DiagnosticsLevel.eWarning,
+        ):
+            asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model_dir / "shapes.xml", self.tmpDir("first"))
+        stage = Usd.Stage.Open(asset.path)
+        usd_mesh = UsdGeom.Mesh(stage.GetPrimAtPath("/shapes/Geometry/shapes"))
+        self.assertEqual(len(usd_mesh.GetFaceVertexCountsAttr().Get()), 2)
+        self.assertEqual(len(usd_mesh.GetPointsAttr().Get()), 4)
+        self.assertEqual(UsdGeom.Subset.GetAllGeomSubsets(usd_mesh), [])
+
+        # all shapes are merged into one mesh, with a face subset per shape
+        asset: Sdf.AssetPath = mujoco_usd_converter.Converter(merge_obj_shapes=True).convert(model_dir / "shapes.xml", self.tmpDir("merged"))
+        stage = Usd.Stage.Open(asset.path)
+        # the shapes are open surfaces without normals
+        self.validationEngine.disable_rule(omni.asset_validator.ManifoldChecker)
+        self.validationEngine.disable_rule(omni.asset_validator.NormalsExistChecker)
+        self.assertIsValidUsd(stage)
+        usd_mesh = UsdGeom.Mesh(stage.GetPrimAtPath("/shapes/Geometry/shapes"))
+        self.assertEqual(len(usd_mesh.GetFaceVertexCountsAttr().Get()), 6)
+        self.assertEqual(len(usd_mesh.GetPointsAttr().Get()), 8)
+        self.assertEqual(list(usd_mesh.GetFaceVertexIndicesAttr().Get())[6:], [4, 5, 6, 4, 7, 5, 5, 7, 6, 4, 6, 7])
+        subsets = UsdGeom.Subset.GetGeomSubsets(usd_mesh, UsdGeom.Tokens.face, "shape")
+        self.assertEqual([subset.GetPrim().GetName() for subset in subsets], ["first", usdex.core.getValidPrimName("second part")])
+        self.assertEqual(usdex.core.getDisplayName(subsets[1].GetPrim()), "second part")
+        self.assertEqual(list(subsets[0].GetIndicesAttr().Get()), [0, 1])
+        self.assertEqual(list(subsets[1].GetIndicesAttr().Get()), [2, 3, 4, 5])
+        self.assertEqual(UsdGeom.Subset.GetFamilyType(usd_mesh, "shape"), UsdGeom.Tokens.partition)
+
+    def test_inline_mesh_conversion(self):
+        model_path = pathlib.Path("./tests/data/inline_meshes.xml")
+        model_name = model_path.stem
+        asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model_path, self.tmpDir())
+        stage = Usd.Stage.Open(asset.path)
+        self.assertIsValidUsd(stage)
+
+        tetrahedron = UsdGeom.Mesh(stage.GetPrimAtPath(f"/{model_name}/Geometry/body/tetrahedron"))
+        self.assertTrue(tetrahedron)
+        self.assertTrue(tetrahedron.GetPrim().HasAuthoredReferences())
+        self.assertEqual(len(tetrahedron.GetPointsAttr().Get()), 4)
+        self.assertEqual(list(tetrahedron.GetFaceVertexCountsAttr().Get()), [3] * 4)
+        self.assertEqual(list(tetrahedron.GetFaceVertexIndicesAttr().Get()), [0, 2, 1, 0, 1, 3, 0, 3, 2, 1, 2, 3])
+        self.assertEqual(tetrahedron.GetPrim().GetAttribute("xformOp:scale").Get(), Gf.Vec3f(0.1))
+
+        # meshes without faces use the convex hull computed by MuJoCo
+        hull = UsdGeom.Mesh(stage.GetPrimAtPath(f"/{model_name}/Geometry/body/hull"))
+        self.assertTrue(hull)
+        self.assertEqual(len(hull.GetFaceVertexCountsAttr().Get()), 12)
+        # the interior vertex is removed
+        self.assertEqual(len(hull.GetPointsAttr().Get()), 8)
+        # flat normals are authored when the mesh does not provide any
+        normals_primvar: UsdGeom.Primvar = UsdGeom.PrimvarsAPI(hull).GetPrimvar("normals")
+        self.assertEqual(normals_primvar.GetInterpolation(), UsdGeom.Tokens.uniform)
+        self.assertEqual(len(normals_primvar.Get()), 6)
+
+        textured = UsdGeom.Mesh(stage.GetPrimAtPath(f"/{model_name}/Geometry/body/textured"))
+        self.assertTrue(textured)
+        normals_primvar: UsdGeom.Primvar = UsdGeom.PrimvarsAPI(textured).GetPrimvar("normals")
+        self.assertEqual(list(normals_primvar.Get()), [Gf.Vec3f(0, 0, 1)])
+        self.assertEqual(len(normals_primvar.GetIndicesAttr().Get()), 6)
+        # MuJoCo texture coordinates are flipped vertically relative to USD
+        uvs_primvar: UsdGeom.Primvar = UsdGeom.PrimvarsAPI(textured).GetPrimvar("st")
+        expected_uvs = [Gf.Vec2f(0, 0), Gf.Vec2f(1, 0), Gf.Vec2f(1, 1), Gf.Vec2f(0, 0), Gf.Vec2f(1, 1), Gf.Vec2f(0, 1)]
+        self.assertEqual(list(uvs_primvar.ComputeFlattened()), expected_uvs)
+
+    def test_msh_conversion(self):
+        model_path = pathlib.Path("./tests/data/msh_meshes.xml")
+        model_name = model_path.stem
+        asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model_path, self.tmpDir())
+        stage = Usd.Stage.Open(asset.path)
+        self.assertIsValidUsd(stage)
+
+        usd_mesh = UsdGeom.Mesh(stage.GetPrimAtPath(f"/{model_name}/Geometry/body/tetrahedron"))
+        self.assertTrue(usd_mesh)
+        self.assertTrue(usd_mesh.GetPrim().HasAuthoredReferences())
+        self.assertEqual(len(usd_mesh.GetPointsAttr().Get()), 4)
+        self.assertEqual(list(usd_mesh.GetFaceVertexCountsAttr().Get()), [3] * 4)
+        self.assertEqual(list(usd_mesh.GetFaceVertexIndicesAttr().Get()), [0, 2, 1, 0, 1, 3, 0, 3, 2, 1, 2, 3])
+
+        # normals & texcoords are stored per vertex
+        normals_primvar: UsdGeom.Primvar = UsdGeom.PrimvarsAPI(usd_mesh).GetPrimvar("normals")
+        self.assertEqual(len(normals_primvar.Get()), 4)
+        self.assertEqual(list(normals_primvar.GetIndicesAttr().Get()), [0, 1, 2, 0, 2, 3, 0, 3, 1, 2, 1, 3])
+        # MuJoCo texture coordinates are flipped vertically relative to USD
+        uvs_primvar: UsdGeom.Primvar = UsdGeom.PrimvarsAPI(usd_mesh).GetPrimvar("st")
+        self.assertEqual(list(uvs_primvar.Get()), [Gf.Vec2f(0, 1), Gf.Vec2f(0, 0), Gf.Vec2f(1, 1), Gf.Vec2f(1, 0)])
+
+        # truncated files are rejected
+        model_dir = pathlib.Path(self.tmpDir("truncated_model"))
+        shutil.copy(model_path, model_dir / model_path.name)
+        (model_dir / "assets").mkdir()
+        (model_dir / "assets/tetrahedron.msh").write_bytes((model_path.parent / "assets/tetrahedron.msh").read_bytes()[:-4])
+        with self.assertRaisesRegex(Tf.ErrorException, "is not a valid MSH file"):
+            mujoco_usd_converter.Converter().convert(model_dir / model_path.name, self.tmpDir("truncated"))
+
+        # as are faces which index vertices the file does not define
+        data = np.frombuffer((model_path.parent / "assets/tetrahedron.msh").read_bytes(), dtype="<i4").copy()
+        data[-1] = data[0]
+        (model_dir / "assets/tetrahedron.msh").write_bytes(data.tobytes())
+        with self.assertRaisesRegex(Tf.ErrorException, "is not a valid MSH file, its faces index vertices outside of the 4 it defines"):
+            mujoco_usd_converter.Converter().convert(model_dir / model_path.name, self.tmpDir("out_of_range"))
+
+        # a file without faces uses the convex hull MuJoCo computes, as inline meshes without faces do
+        num_vertices, num_faces = int(data[0]), int(data[3])
+        data[3] = 0
+        (model_dir / "assets/tetrahedron.msh").write_bytes(data[: len(data) - num_faces * 3].tobytes())
+        asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model_dir / model_path.name, self.tmpDir("hull"))
+        stage = Usd.Stage.Open(asset.path)
+        self.assertIsValidUsd(stage)
+        model = mujoco.MjSpec.from_file((model_dir / model_path.name).as_posix()).compile()
+        hull_faces = model.mesh_face[model.mesh_faceadr[0] : model.mesh_faceadr[0] + model.mesh_facenum[0]]
+        usd_mesh = UsdGeom.Mesh(stage.GetPrimAtPath(f"/{model_name}/Geometry/body/tetrahedron"))
+        self.assertEqual(len(usd_mesh.GetPointsAttr().Get()), num_vertices)
+        self.assertEqual(list(usd_mesh.GetFaceVertexCountsAttr().Get()), [3] * len(hull_faces))
+        self.assertEqual(list(usd_mesh.GetFaceVertexIndicesAttr().Get()), hull_faces.reshape(-1).tolist())
+
+    def test_shared_mesh_conversion(self):
+        model_path = pathlib.Path("./tests/data/reflected_meshes.xml")
+        model_name = model_path.stem
+        asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model_path, self.tmpDir())
+        stage = Usd.Stage.Open(asset.path)
+        # the test data contains unwelded meshes, so we disable the weld checker
+        self.validationEngine.disable_rule(omni.asset_validator.WeldChecker)
+        self.assertIsValidUsd(stage)
+
+        # both meshes use the same file, so the second library mesh references the first rather than repeating its topology
+        library_layer = Sdf.Layer.FindOrOpen((pathlib.Path(asset.path).parent / "Payload/GeometryLibrary.usdc").as_posix())
+        source_spec: Sdf.PrimSpec = library_layer.GetPrimAtPath("/Geometry/complexCube")
+        shared_spec: Sdf.PrimSpec = library_layer.GetPrimAtPath("/Geometry/complexCubeMirror")
+        self.assertIn("points", source_spec.attributes)
+        self.assertNotIn("points", shared_spec.attributes)
+        self.assertEqual(list(shared_spec.referenceList.prependedItems), [Sdf.Reference(primPath="/Geometry/complexCube")])
+
+        # each mesh keeps its own scale
+        regular = UsdGeom.Mesh(stage.GetPrimAtPath(f"/{model_name}/Geometry/body/bodyRegular/complexCube"))
+        reflected = UsdGeom.Mesh(stage.GetPrimAtPath(f"/{model_name}/Geometry/body/bodyReflected/complexCubeMirror"))
+        self.assertTrue(regular)
+        self.assertTrue(reflected)
+        self.assertEqual(regular.GetPointsAttr().Get(), reflected.GetPointsAttr().Get())
+        self.assertEqual(regular.GetPrim().GetAttribute("xformOp:scale").Get(), Gf.Vec3f(0.1, 0.1, 0.1))
+        self.assertEqual(reflected.GetPrim().GetAttribute("xformOp:scale").Get(), Gf.Vec3f(0.1, -0.1, 0.1))
+
     def test_attach_mesh_conversion(self):
         model_path = pathlib.Path("./tests/data/attach_scene.xml")
         model_name = model_path.stem
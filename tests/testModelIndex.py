@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import mujoco
+
+from mujoco_usd_converter._impl.index import ModelIndex
+from tests.util.ConverterTestCase import ConverterTestCase
+
+MODEL = """
+<mujoco>
+  <asset>
+    <mesh name="tetra" vertex="0 0 0  1 0 0  0 1 0  0 0 1"/>
+    <mesh name="prism" vertex="0 0 0  1 0 0  0 1 0  0 0 1  1 1 1"/>
+  </asset>
+  <worldbody>
+    <geom name="floor" type="plane" size="1 1 0.1"/>
+    <body name="a">
+      <joint name="hinge"/>
+      <geom type="sphere" size="0.1"/>
+      <geom type="sphere" size="0.2"/>
+      <geom type="box" size="0.1 0.1 0.1"/>
+      <site name="tip"/>
+      <body>
+        <geom type="mesh" mesh="prism"/>
+      </body>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+
+class TestModelIndex(ConverterTestCase):
+    def setUp(self):
+        super().setUp()
+        self.spec = mujoco.MjSpec.from_string(MODEL)
+        self.model = self.spec.copy().compile()
+        self.index = ModelIndex(self.spec, self.model)
+
+    def test_bodies(self):
+        for i, body in enumerate(self.spec.bodies):
+            self.assertEqual(self.index.body_id(body), i)
+        self.assertEqual(self.index.body_id(self.spec.body("a")), self.model.body("a").id)
+
+        other = mujoco.MjSpec.from_string("<mujoco><worldbody><body name='a'/></worldbody></mujoco>")
+        self.assertIsNone(self.index.body_id(other.body("a")))
+        self.assertIsNone(self.index.spec_index(other.body("a")))
+
+    def test_geoms(self):
+        geoms = self.spec.geoms
+        self.assertEqual(self.index.geom_id(geoms[0]), self.model.geom("floor").id)
+        # unnamed geoms match the first compiled geom of the same type in the same named body
+        self.assertEqual(self.index.geom_id(geoms[1]), 1)
+        self.assertEqual(self.index.geom_id(geoms[2]), 1)
+        self.assertEqual(self.index.geom_id(geoms[3]), 3)
+        # the parent body of the mesh geom is unnamed, so it cannot be located by name
+        self.assertEqual(self.index.spec_index(geoms[4]), 4)
+
+    def test_meshes(self):
+        self.assertEqual(self.index.mesh_id(self.spec.mesh("tetra")), 0)
+        self.assertEqual(self.index.mesh_id(self.spec.mesh("prism")), self.model.mesh("prism").id)
+
+    def test_names(self):
+        self.assertEqual(self.index.name_id(mujoco.mjtObj.mjOBJ_SITE, "tip"), self.model.site("tip").id)
+        self.assertEqual(self.index.name_id(mujoco.mjtObj.mjOBJ_JOINT, "hinge"), self.model.joint("hinge").id)
+        self.assertEqual(self.index.name_id(mujoco.mjtObj.mjOBJ_MESH, "prism"), 1)
+        self.assertIsNone(self.index.name_id(mujoco.mjtObj.mjOBJ_SITE, "missing"))
+        self.assertIsNone(self.index.name_id(mujoco.mjtObj.mjOBJ_BODY, ""))
@@ -142,3 +142,29 @@ class TestPhysicsMaterials(ConverterTestCase):
         materials_stage: Usd.Stage = Usd.Stage.Open(materials_layer_path.as_posix())
         visual_materials_scope = materials_stage.GetPrimAtPath("/physics_materials/Materials")
         self.assertEqual(len(visual_materials_scope.GetChildren()), 2)
+
+    def test_physics_materials_deduplicated(self):
+        model = pathlib.Path(self.tmpDir()) / "dedup.xml"
+        model.write_text("""
+            <mujoco model="dedup">
+              <worldbody>
+                <geom name="a" type="sphere" size="0.1" friction="0.3" solref="0.03 0.9"/>
+                <geom name="b" type="sphere" size="0.1" friction="0.3" solref="0.03 0.9"/>
+                <geom name="c" type="sphere" size="0.1" friction="0.3000001" solref="0.03 0.9"/>
+                <geom name="d" type="sphere" size="0.1" friction="0.31" solref="0.03 0.9"/>
+              </worldbody>
+            </mujoco>
+            """)
+        asset: Sdf.AssetPath = mujoco_usd_converter.Converter().convert(model, self.tmpDir("dedup"))
+        stage: Usd.Stage = Usd.Stage.Open(asset.path)
+        self.assertIsValidUsd(stage)
+
+        def physics_binding(name: str) -> Sdf.Path:
+            prim = stage.GetPrimAtPath(f"/dedup/Geometry/{name}")
+            return UsdShade.MaterialBindingAPI(prim).GetDirectBinding(materialPurpose="physics").GetMaterialPath()
+
+        # stiffness values which are not representable as float still match, as do differences below the tolerance
+        self.assertEqual(physics_binding("a"), physics_binding("b"))
+        self.assertEqual(physics_binding("a"), physics_binding("c"))
+        self.assertNotEqual(physics_binding("a"), physics_binding("d"))
+        self.assertEqual(len(stage.GetPrimAtPath("/dedup/Physics").GetChildren()), 2)
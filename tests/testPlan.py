@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import pathlib
+
+from pxr import Tf
+
+import mujoco_usd_converter
+from mujoco_usd_converter._impl.plan import ConversionPlan
+from tests.util.ConverterTestCase import ConverterTestCase
+
+
+class TestConversionPlan(ConverterTestCase):
+    def test_order(self):
+        ran = []
+        plan = ConversionPlan()
+        plan.add("a", lambda: ran.append("a"))
+        plan.add("c", lambda: ran.append("c"), depends=("b",))
+        plan.add("b", lambda: ran.append("b"), depends=("a",))
+        plan.add("d", lambda: ran.append("d"))
+        # phases run in the order they were added, unless a dependency requires otherwise
+        self.assertEqual([phase.name for phase in plan.order()], ["a", "b", "c", "d"])
+        timings = plan.run()
+        self.assertEqual(ran, ["a", "b", "c", "d"])
+        self.assertEqual(sorted(timings), ["a", "b", "c", "d"])
+        self.assertTrue(all(seconds >= 0.0 for seconds in timings.values()))
+
+    def test_invalid_dependencies(self):
+        plan = ConversionPlan()
+        plan.add("a", lambda: None, depends=("missing",))
+        with self.assertRaises(Tf.ErrorException):
+            plan.order()
+
+        plan = ConversionPlan()
+        plan.add("a", lambda: None, depends=("b",))
+        plan.add("b", lambda: None, depends=("a",))
+        with self.assertRaises(Tf.ErrorException):
+            plan.run()
+
+        with self.assertRaises(Tf.ErrorException):
+            plan.add("a", lambda: None)
+
+    def test_converter_timings(self):
+        converter = mujoco_usd_converter.Converter()
+        converter.convert(pathlib.Path("./tests/data/actuators.xml"), self.tmpDir())
+        for phase in ("meshes", "materials", "scene", "bodies", "tendons", "actuators", "write"):
+            self.assertIn(phase, converter.timings)
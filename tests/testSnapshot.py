@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import math
+import pathlib
+import threading
+from unittest.mock import patch
+
+import mujoco
+import numpy as np
+
+import mujoco_usd_converter
+from mujoco_usd_converter._impl.snapshot import SpecSnapshot, solref_to_stiffness_damping
+from tests.util.ConverterTestCase import ConverterTestCase
+
+MODEL = """
+<mujoco>
+  <worldbody>
+    <geom name="floor" type="plane" size="1 1 0.1" friction="0.8 0.01 0.001"/>
+    <body name="arm">
+      <joint name="hinge" type="hinge" damping="2" stiffness="3" actuatorfrclimited="true" actuatorfrcrange="-1 1"/>
+      <joint name="slide" type="slide" damping="2"/>
+      <geom name="direct" size="0.1" solref="-100 -10" mass="2"/>
+      <geom name="invalid" size="0.1" solref="0 1" contype="0" conaffinity="0"/>
+      <site name="anchor"/>
+      <body name="tip">
+        <joint name="ball" type="ball" damping="2"/>
+        <geom name="tip" size="0.1" friction="0.8 0.01 0.001"/>
+        <site name="end"/>
+      </body>
+    </body>
+  </worldbody>
+  <tendon>
+    <spatial name="cable" stiffness="5" rgba="0.1 0.2 0.3 1">
+      <site site="anchor"/>
+      <site site="end"/>
+    </spatial>
+  </tendon>
+  <actuator>
+    <position name="servo" joint="hinge" kp="10" ctrlrange="-1 1"/>
+  </actuator>
+</mujoco>
+"""
+
+
+class TestSpecSnapshot(ConverterTestCase):
+    def setUp(self):
+        super().setUp()
+        self.spec = mujoco.MjSpec.from_string(MODEL)
+        self.snapshot = SpecSnapshot(self.spec)
+
+    def test_fields(self):
+        # each record holds the same values as the spec element, as plain Python values
+        geom = self.snapshot.geom(self.spec.geom("direct"))
+        self.assertEqual(geom.type, mujoco.mjtGeom.mjGEOM_SPHERE)
+        self.assertEqual(geom.mass, 2.0)
+        self.assertEqual(geom.solref, [-100.0, -10.0])
+        self.assertIsInstance(geom.solimp, list)
+        self.assertEqual(geom.solimp, list(self.spec.geom("direct").solimp))
+        self.assertEqual((geom.contype, geom.conaffinity), (1, 1))
+        self.assertEqual(self.snapshot.geom(self.spec.geom("invalid")).contype, 0)
+
+        joint = self.snapshot.joint(self.spec.joint("hinge"))
+        self.assertEqual(joint.type, mujoco.mjtJoint.mjJNT_HINGE)
+        self.assertEqual(joint.actfrclimited, mujoco.mjtLimited.mjLIMITED_TRUE)
+        self.assertEqual(joint.actfrcrange, [-1.0, 1.0])
+        self.assertEqual((joint.damping[0], joint.stiffness[0]), (2.0, 3.0))
+
+        actuator = self.snapshot.actuator(self.spec.actuator("servo"))
+        self.assertEqual(actuator.trntype, mujoco.mjtTrn.mjTRN_JOINT)
+        self.assertEqual(actuator.biastype, mujoco.mjtBias.mjBIAS_AFFINE)
+        self.assertEqual(actuator.gainprm, list(self.spec.actuator("servo").gainprm))
+        self.assertEqual(actuator.ctrlrange, [-1.0, 1.0])
+
+        tendon = self.snapshot.tendon(self.spec.tendon("cable"))
+        self.assertEqual(tendon.stiffness[0], 5.0)
+        self.assertEqual(tendon.rgba, self.spec.tendon("cable").rgba.tolist())
+
+        # the structured arrays hold one row per element
+        self.assertEqual(len(self.snapshot.geoms), len(self.spec.geoms))
+        self.assertEqual(len(self.snapshot.joints), len(self.spec.joints))
+        np.testing.assert_array_equal(self.snapshot.geoms["friction"][0], [0.8, 0.01, 0.001])
+
+    def test_physics_materials(self):
+        # geoms with the same friction and solref share a material key
+        floor = self.snapshot.geom(self.spec.geom("floor"))
+        tip = self.snapshot.geom(self.spec.geom("tip"))
+        self.assertEqual(floor.material_key, tip.material_key)
+        self.assertNotEqual(floor.material_key, self.snapshot.geom(self.spec.geom("direct")).material_key)
+
+        # the default solref is converted to stiffness and damping
+        self.assertAlmostEqual(tip.stiffness, 1.0 / (0.02 * 0.02))
+        self.assertAlmostEqual(tip.damping, 2.0 / 0.02)
+
+        # negative values are the stiffness and damping themselves
+        direct = self.snapshot.geom(self.spec.geom("direct"))
+        self.assertEqual((direct.stiffness, direct.damping), (100.0, 10.0))
+
+        # any other non-positive values are unspecified
+        invalid = self.snapshot.geom(self.spec.geom("invalid"))
+        self.assertEqual((invalid.stiffness, invalid.damping), (-math.inf, -math.inf))
+
+    def test_solref_to_stiffness_damping(self):
+        stiffness, damping = solref_to_stiffness_damping(np.array([[0.02, 1.0], [-100.0, -10.0], [-1.0, 1.0], [0.0, 1.0]]))
+        np.testing.assert_array_equal(stiffness, [1.0 / (0.02 * 0.02), 100.0, -np.inf, -np.inf])
+        np.testing.assert_array_equal(damping, [2.0 / 0.02, 10.0, -np.inf, -np.inf])
+
+    def test_newton_damping(self):
+        # angular gains are per degree, linear gains are unchanged
+        self.assertAlmostEqual(self.snapshot.joint(self.spec.joint("hinge")).newton_damping, 2.0 * math.pi / 180.0)
+        self.assertAlmostEqual(self.snapshot.joint(self.spec.joint("ball")).newton_damping, 2.0 * math.pi / 180.0)
+        self.assertEqual(self.snapshot.joint(self.spec.joint("slide")).newton_damping, 2.0)
+
+    def test_empty(self):
+        spec = mujoco.MjSpec.from_string("<mujoco><worldbody/></mujoco>")
+        snapshot = SpecSnapshot(spec)
+        self.assertEqual(len(snapshot.geoms), 0)
+        self.assertEqual(len(snapshot.actuators), 0)
+        self.assertEqual(len(snapshot.tendons), 0)
+
+    def test_built_once_on_first_use(self):
+        threads = []
+
+        def snapshot(spec):
+            threads.append(threading.current_thread())
+            return SpecSnapshot(spec)
+
+        with patch("mujoco_usd_converter._impl.data.SpecSnapshot", side_effect=snapshot):
+            mujoco_usd_converter.Converter().convert(pathlib.Path("./tests/data/actuators.xml"), self.tmpDir())
+        # the snapshot is built on the converting thread, the first time an element reads from it
+        self.assertEqual(threads, [threading.current_thread()])
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import mujoco
+from pxr import Gf
+
+from mujoco_usd_converter._impl.transform import SpecTransforms, multiply_transforms_preserve_scale
+from tests.util.ConverterTestCase import ConverterTestCase
+
+MODEL = """
+<mujoco>
+  <compiler angle="degree" eulerseq="zyx"/>
+  <worldbody>
+    <body name="euler" pos="0 0 1" euler="0 45 -90">
+      <geom name="fromto" type="capsule" size="0.1" fromto="0 0 0 0.1 0.2 0.3"/>
+      <geom name="fromto_z" type="cylinder" size="0.1" fromto="0 0 0 0 0 1"/>
+      <site name="xyaxes" pos="0.1 0 0" xyaxes="0 1 0 -1 0 0"/>
+    </body>
+    <frame pos="1 2 3" axisangle="0 0 1 90">
+      <body name="framed" pos="0 1 0" zaxis="1 1 0">
+        <geom name="quat" type="box" size="0.1 0.2 0.3" quat="-1 0 0 0"/>
+      </body>
+    </frame>
+  </worldbody>
+</mujoco>
+"""
+
+
+class TestTransforms(ConverterTestCase):
+    def setUp(self):
+        super().setUp()
+        self.spec = mujoco.MjSpec.from_string(MODEL)
+        self.transforms = SpecTransforms(self.spec)
+
+    def rotation(self, mjc_object) -> Gf.Rotation:
+        quat = self.spec.resolve_orientation(degree=True, sequence=self.spec.compiler.eulerseq, orientation=mjc_object.alt)
+        return Gf.Rotation(Gf.Quatf(*quat).GetNormalized())
+
+    def assert_transform_equal(self, actual: tuple[Gf.Vec3d, Gf.Quatf, Gf.Vec3d], pos, rotation: Gf.Rotation, frame: Gf.Transform | None = None):
+        # the spec transform follows the frame, canonicalized through Gf.Transform
+        transform = Gf.Transform()
+        transform.SetTranslation(Gf.Vec3d(*pos))
+        transform.SetRotation(rotation)
+        expected = multiply_transforms_preserve_scale(transform, multiply_transforms_preserve_scale(frame or Gf.Transform(), Gf.Transform()))
+        self.assertEqual(actual, (expected.GetTranslation(), Gf.Quatf(expected.GetRotation().GetQuat()), Gf.Vec3d(1)))
+
+    def test_orientations(self):
+        body = self.spec.body("euler")
+        self.assert_transform_equal(self.transforms.resolve(body), (0, 0, 1), self.rotation(body))
+
+        site = self.spec.site("xyaxes")
+        self.assert_transform_equal(self.transforms.resolve(site), (0.1, 0, 0), self.rotation(site))
+
+        geom = self.spec.geom("quat")
+        self.assert_transform_equal(self.transforms.resolve(geom), (0, 0, 0), Gf.Rotation(Gf.Quatf(-1, 0, 0, 0)))
+
+    def test_fromto(self):
+        # the capsule is centered between the points, with its axis along them
+        pos, orient, _ = self.transforms.resolve(self.spec.geom("fromto"))
+        self.assertTrue(Gf.IsClose(pos, Gf.Vec3d(0.05, 0.1, 0.15), 1e-12))
+        axis = Gf.Rotation(orient).TransformDir(Gf.Vec3d(0, 0, 1))
+        self.assertTrue(Gf.IsClose(axis, Gf.Vec3d(0.1, 0.2, 0.3).GetNormalized(), 1e-6))
+
+        # an axis along z is a half turn about x
+        self.assert_transform_equal(self.transforms.resolve(self.spec.geom("fromto_z")), (0, 0, 0.5), Gf.Rotation(Gf.Vec3d(1, 0, 0), 180))
+
+    def test_frame(self):
+        body = self.spec.body("framed")
+        frame = Gf.Transform()
+        frame.SetTranslation(Gf.Vec3d(1, 2, 3))
+        frame.SetRotation(self.rotation(body.frame))
+        self.assert_transform_equal(self.transforms.resolve(body), (0, 1, 0), self.rotation(body), frame)
+
+    def test_nested_frames(self):
+        # nested frames compose from the outermost inwards, and each frame is resolved once
+        spec = mujoco.MjSpec.from_string("""
+            <mujoco>
+              <worldbody>
+                <frame name="outer" pos="1 0 0" euler="0 0 90">
+                  <frame name="inner" pos="0 1 0">
+                    <geom name="first" size="0.1" pos="0 0 1"/>
+                    <geom name="second" size="0.1"/>
+                  </frame>
+                </frame>
+              </worldbody>
+            </mujoco>
+            """)
+        transforms = SpecTransforms(spec)
+        frame = transforms.get_frame_transform(spec.geom("first"))
+        self.assertIs(transforms.get_frame_transform(spec.geom("second")), frame)
+        self.assertTrue(Gf.IsClose(frame.GetTranslation(), Gf.Vec3d(0, 0, 0), 1e-6))
+        self.assertRotationsAlmostEqual(frame.GetRotation(), Gf.Rotation(Gf.Vec3d(0, 0, 1), 90), 1e-4)
+        pos, _, _ = transforms.resolve(spec.geom("first"))
+        self.assertTrue(Gf.IsClose(pos, Gf.Vec3d(0, 0, 1), 1e-6))
+        self.assertIsNone(self.transforms.get_frame_transform(self.spec.body("euler")))
+
+    def test_compose(self):
+        # a prim which already has a transform (e.g. a referenced mesh) applies it after the spec transform
+        current = Gf.Transform()
+        current.SetTranslation(Gf.Vec3d(0, 0, 2))
+        current.SetRotation(Gf.Rotation(Gf.Vec3d(1, 0, 0), 90))
+        current.SetScale(Gf.Vec3d(1, 2, 3))
+        pos, orient, scale = self.transforms.compose(self.spec.site("xyaxes"), current)
+        self.assertTrue(Gf.IsClose(pos, Gf.Vec3d(0.1, 0, 2), 1e-6))
+        self.assertRotationsAlmostEqual(Gf.Rotation(orient), Gf.Rotation(Gf.Vec3d(0, 0, 1), 90) * Gf.Rotation(Gf.Vec3d(1, 0, 0), 90), 1e-4)
+        self.assertEqual(scale, Gf.Vec3d(1, 2, 3))
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from pxr import Tf, Usd
 
+from mujoco_usd_converter._impl.authoring import get_schema_fallbacks
 from mujoco_usd_converter._impl.utils import set_schema_attribute
 from tests.util.ConverterTestCase import ConverterTestCase
 
@@ -51,3 +52,17 @@ class TestSetSchemaAttribute(ConverterTestCase):
 
         with self.assertRaises(Tf.ErrorException):
             set_schema_attribute(prim, "mjc:armature", "wrong type")
+
+    def test_schema_fallbacks(self):
+        # the table holds the fallback of every mjc and newton attribute, as the prim definition resolves it
+        stage: Usd.Stage = Usd.Stage.CreateInMemory()
+        prim: Usd.Prim = stage.DefinePrim("/TestPrim")
+        prim.ApplyAPI("MjcJointAPI")
+        prim.ApplyAPI("NewtonJointAPI")
+        fallbacks = get_schema_fallbacks()
+        names = [name for name in prim.GetPropertyNames() if name.startswith(("mjc:", "newton:"))]
+        self.assertTrue(names)
+        for name in names:
+            self.assertEqual(fallbacks[name], prim.GetAttribute(name).Get(), name)
+        self.assertNotIn("physics:jointEnabled", fallbacks)
+        self.assertIs(get_schema_fallbacks(), fallbacks)
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+import pathlib
+
+import usdex.core
+from pxr import Sdf, Usd
+
+from mujoco_usd_converter._impl.writer import LayerWriter
+from tests.util.ConverterTestCase import ConverterTestCase
+
+
+class TestLayerWriter(ConverterTestCase):
+    def create_stage(self, identifier: str) -> Usd.Stage:
+        stage = usdex.core.createStage(identifier, "Root", "Z", 1.0, "Test")
+        usdex.core.defineXform(stage, "/Root")
+        return stage
+
+    def test_matches_save_stage(self):
+        directory = pathlib.Path(self.tmpDir())
+        for name in ("expected", "actual"):
+            (directory / name).mkdir()
+            stage = self.create_stage((directory / name / "asset.usda").as_posix())
+            library = self.create_stage((directory / name / "library.usda").as_posix())
+            stage.GetRootLayer().subLayerPaths.append("./library.usda")
+            if name == "expected":
+                usdex.core.saveStage(library, comment="Library")
+                usdex.core.saveStage(stage, comment="Asset")
+            else:
+                writer = LayerWriter()
+                writer.save_stage(library, "Library")
+                writer.save_stage(stage, "Asset")
+                # nothing is written until the writer is flushed
+                self.assertTrue(stage.GetRootLayer().dirty)
+                writer.flush()
+            self.assertFalse(stage.GetRootLayer().dirty)
+            self.assertFalse(library.GetRootLayer().dirty)
+
+        for filename in ("asset.usda", "library.usda"):
+            self.assertEqual((directory / "actual" / filename).read_text(), (directory / "expected" / filename).read_text())
+        # the library keeps the comment of the stage it was queued with, not the stage which sublayers it
+        self.assertEqual(Sdf.Layer.FindOrOpen((directory / "actual" / "library.usda").as_posix()).comment, "Library")
+
+    def test_copy_file(self):
+        directory = pathlib.Path(self.tmpDir())
+        first, second = directory / "first.png", directory / "second.png"
+        first.write_bytes(b"first")
+        second.write_bytes(b"second")
+        destination = directory / "textures" / "texture.png"
+        destination.parent.mkdir()
+
+        writer = LayerWriter()
+        writer.copy_file(first, destination)
+        writer.copy_file(first, destination)
+        writer.flush()
+        self.assertEqual(destination.read_bytes(), b"first")
+
+        # the last copy to a destination wins
+        writer.copy_file(first, destination)
+        writer.copy_file(second, destination)
+        writer.flush()
+        self.assertEqual(destination.read_bytes(), b"second")
+
+    def test_copy_failure(self):
+        directory = pathlib.Path(self.tmpDir())
+        writer = LayerWriter()
+        writer.copy_file(directory / "missing.png", directory / "texture.png")
+        with self.assertRaises(FileNotFoundError):
+            writer.flush()